@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark of embed_batched() with the real OpenAIEmbeddingModel
+
+The OpenAI client talks to an in-process httpx.MockTransport that answers
+each embeddings request after --latency-ms, so the run measures how many
+provider calls overlap rather than network noise. For each concurrency
+limit the benchmark reports wall time, provider calls, the most calls seen
+in flight at once, and how long the event loop was blocked at worst (a
+ticker task that should wake every millisecond).
+
+Usage (from frontend/site/src):
+    python benchmarks/bench_embed_batched.py --texts 8192 --batch-size 512
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+
+import httpx
+import openai
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp_agent.logging import logger  # noqa: F401  (import order: breaks a cycle)
+from mcp_agent.config import OpenAISettings, Settings
+from mcp_agent.core.context import Context
+from mcp_agent.workflows.embedding.embedding_base import embed_batched
+from mcp_agent.workflows.embedding.embedding_openai import OpenAIEmbeddingModel
+
+DIM = 1536
+
+
+class StubEmbeddings:
+    """Async MockTransport handler that returns zero vectors after a delay"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            body = json.loads(request.content)
+            texts = body["input"]
+            if body.get("encoding_format") == "base64":
+                vector = base64.b64encode(bytes(4 * DIM)).decode()
+            else:
+                vector = [0.0] * DIM
+            return httpx.Response(
+                200,
+                json={
+                    "object": "list",
+                    "model": "text-embedding-3-small",
+                    "data": [
+                        {"object": "embedding", "index": i, "embedding": vector}
+                        for i in range(len(texts))
+                    ],
+                    "usage": {"prompt_tokens": len(texts), "total_tokens": len(texts)},
+                },
+            )
+        finally:
+            self.in_flight -= 1
+
+
+async def max_loop_stall(stop: asyncio.Event) -> float:
+    """Longest gap between 1 ms ticks while the benchmark runs"""
+    worst = 0.0
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.001)
+        now = time.perf_counter()
+        worst = max(worst, now - last)
+        last = now
+    return worst
+
+
+async def run(texts: int, batch_size: int, concurrency: int, latency: float) -> dict:
+    stub = StubEmbeddings(latency)
+    # Route the registry's AsyncOpenAI clients through the stub transport
+    openai.DefaultAsyncHttpxClient = lambda **kwargs: httpx.AsyncClient(
+        transport=httpx.MockTransport(stub)
+    )
+    model = OpenAIEmbeddingModel(
+        context=Context(config=Settings(openai=OpenAISettings(api_key="sk-bench")))
+    )
+    model.max_batch_size = batch_size
+
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(max_loop_stall(stop))
+    start = time.perf_counter()
+    embeddings = await embed_batched(
+        model, [f"text {i}" for i in range(texts)], max_concurrency=concurrency
+    )
+    elapsed = time.perf_counter() - start
+    stop.set()
+    stall = await ticker
+    assert embeddings.shape == (texts, DIM)
+
+    return {
+        "max_concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "calls": stub.calls,
+        "peak_in_flight": stub.peak_in_flight,
+        "max_loop_stall_ms": round(stall * 1000, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--texts", type=int, default=8192)
+    parser.add_argument("--batch-size", type=int, default=512)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    results = [
+        asyncio.run(
+            run(args.texts, args.batch_size, concurrency, args.latency_ms / 1000)
+        )
+        for concurrency in args.concurrency
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
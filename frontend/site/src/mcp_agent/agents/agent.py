@@ -535,13 +535,7 @@ class Agent(BaseModel):
                     result_tools = []
                     for namespaced_tool in server_tools:
                         if namespaced_tool.tool.name in allowed_tools:
-                            result_tools.append(
-                                namespaced_tool.tool.model_copy(
-                                    update={
-                                        "name": namespaced_tool.namespaced_tool_name
-                                    }
-                                )
-                            )
+                            result_tools.append(namespaced_tool.listed_tool())
                         else:
                             filtered_out_tools.append(
                                 (
@@ -556,9 +550,7 @@ class Agent(BaseModel):
                     # Include all tools from this server
                     result = ListToolsResult(
                         tools=[
-                            namespaced_tool.tool.model_copy(
-                                update={"name": namespaced_tool.namespaced_tool_name}
-                            )
+                            namespaced_tool.listed_tool()
                             for namespaced_tool in server_tools
                         ]
                     )
@@ -603,20 +595,14 @@ class Agent(BaseModel):
                             should_include = True
 
                         if should_include:
-                            filtered_tools.append(
-                                namespaced_tool.tool.model_copy(
-                                    update={"name": namespaced_tool_name}
-                                )
-                            )
+                            filtered_tools.append(namespaced_tool.listed_tool())
                     result = ListToolsResult(tools=filtered_tools)
                 else:
                     # No filter at all - include everything
                     result = ListToolsResult(
                         tools=[
-                            namespaced_tool.tool.model_copy(
-                                update={"name": namespaced_tool_name}
-                            )
-                            for namespaced_tool_name, namespaced_tool in self._namespaced_tool_map.items()
+                            namespaced_tool.listed_tool()
+                            for namespaced_tool in self._namespaced_tool_map.values()
                         ]
                     )
 
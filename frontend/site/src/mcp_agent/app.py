@@ -21,6 +21,7 @@ from mcp_agent.executor.decorator_registry import (
     register_asyncio_decorators,
     register_temporal_decorators,
 )
+from mcp_agent.executor.process_executor import ProcessExecutor
 from mcp_agent.executor.task_registry import ActivityRegistry
 from mcp_agent.executor.workflow_signal import SignalWaitCallback
 from mcp_agent.executor.workflow_task import GlobalWorkflowTaskRegistry
@@ -378,6 +379,10 @@ class MCPApp:
         if self._context and self._context.tracing_config:
             await self._context.tracing_config.flush()
 
+        # Stop the worker processes of the process execution engine
+        if self._context and isinstance(self._context.executor, ProcessExecutor):
+            self._context.executor.shutdown()
+
         try:
             # Don't shutdown OTEL completely, just cleanup app-specific resources
             await cleanup_context(shutdown_logger=False)
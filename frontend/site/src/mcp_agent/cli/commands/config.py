@@ -373,7 +373,7 @@ def builder(
     config["execution_engine"] = Prompt.ask(
         "Execution engine",
         default=config.get("execution_engine", "asyncio"),
-        choices=["asyncio", "temporal"],
+        choices=["asyncio", "temporal", "process"],
     )
 
     # Logger configuration
@@ -413,6 +413,45 @@ class TemporalSettings(BaseModel):
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
+class ProcessExecutorSettings(BaseModel):
+    """
+    Settings for the "process" execution engine, which runs @cpu_bound tasks
+    in a pool of worker processes (see mcp_agent.executor.process_executor).
+    """
+
+    max_workers: int | None = None
+    """Worker processes in the pool. Defaults to the number of CPUs."""
+
+    start_method: Literal["spawn", "fork", "forkserver"] | None = "spawn"
+    """multiprocessing start method for the workers."""
+
+    shared_memory_threshold: int = 1024 * 1024
+    """Bytes-like or array arguments and results at least this large are passed through shared memory."""
+
+    max_concurrent_activities: int | None = None
+    """Maximum tasks (of any kind) running at once."""
+
+    model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
+
+
+class ProviderClientSettings(BaseModel):
+    """
+    Connection pool settings for the shared LLM provider clients
+    (see mcp_agent.workflows.llm.provider_clients).
+    """
+
+    max_connections: int = 100
+    """Maximum concurrent connections per provider client."""
+
+    max_keepalive_connections: int = 20
+    """Idle connections kept open for reuse per provider client."""
+
+    keepalive_expiry: float = 30.0
+    """Seconds an idle connection is kept before it is closed."""
+
+    model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
+
+
 class UsageTelemetrySettings(BaseModel):
     """
     Settings for usage telemetry in the MCP Agent application.
@@ -562,11 +601,27 @@ class LoggerSettings(BaseModel):
     """Number of events to accumulate before processing"""
 
     flush_interval: float = 2.0
-    """How often to flush events in seconds"""
+    """How often to flush events in seconds (for HTTP, the longest an event waits to be sent)"""
 
     max_queue_size: int = 2048
     """Maximum queue size for event processing"""
 
+    # File transport settings
+    file_flush_interval: float = 1.0
+    """Maximum seconds log lines stay buffered before the log file is flushed (0 flushes every write)"""
+
+    file_fsync_interval: float | None = None
+    """Minimum seconds between fsyncs of the log file, or None to leave syncing to the OS"""
+
+    file_max_bytes: int = 0
+    """Rotate the log file once it reaches this size in bytes (0 disables rotation)"""
+
+    file_backup_count: int = 5
+    """Number of rotated log files to keep"""
+
+    file_overflow: Literal["block", "drop"] = "block"
+    """When max_queue_size log lines are waiting to be written, make loggers wait ('block') or drop events ('drop')"""
+
     # HTTP transport settings
     http_endpoint: str | None = None
     """HTTP endpoint for event transport"""
@@ -577,6 +632,24 @@ class LoggerSettings(BaseModel):
     http_timeout: float = 5.0
     """HTTP timeout seconds for event transport"""
 
+    http_max_batch_bytes: int = 1024 * 1024
+    """Send a batch of events once its uncompressed body reaches this many bytes"""
+
+    http_compress: bool = True
+    """Gzip-compress HTTP request bodies"""
+
+    http_spool_dir: str | None = None
+    """Directory to keep failed batches in for retry, or None to drop them"""
+
+    http_max_spool_bytes: int = 64 * 1024 * 1024
+    """Maximum total size of spooled batches; the oldest are dropped first"""
+
+    http_retry_backoff: float = 1.0
+    """Seconds before retrying a failed batch, doubling after each failed retry"""
+
+    http_max_retry_backoff: float = 60.0
+    """Upper bound for the retry delay in seconds"""
+
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
@@ -596,12 +669,15 @@ class Settings(BaseSettings):
     mcp: MCPSettings | None = Field(default_factory=MCPSettings)
     """MCP config, such as MCP servers"""
 
-    execution_engine: Literal["asyncio", "temporal"] = "asyncio"
-    """Execution engine for the MCP Agent application"""
+    execution_engine: Literal["asyncio", "temporal", "process"] = "asyncio"
+    """Execution engine for the MCP Agent application. "process" is asyncio with @cpu_bound tasks run in worker processes"""
 
     temporal: TemporalSettings | None = None
     """Settings for Temporal workflow orchestration"""
 
+    process: ProcessExecutorSettings | None = None
+    """Settings for the process execution engine"""
+
     anthropic: AnthropicSettings | None = Field(default_factory=AnthropicSettings)
     """Settings for using Anthropic models in the MCP Agent application"""
 
@@ -626,6 +702,9 @@ class Settings(BaseSettings):
     logger: LoggerSettings | None = LoggerSettings()
     """Logger settings for the MCP Agent application"""
 
+    provider_clients: ProviderClientSettings | None = ProviderClientSettings()
+    """Connection pooling for LLM provider clients"""
+
     usage_telemetry: UsageTelemetrySettings | None = UsageTelemetrySettings()
     """Usage tracking settings for the MCP Agent application"""
 
@@ -31,6 +31,7 @@ from mcp_agent.logging.transport import create_transport
 from mcp_agent.mcp.mcp_server_registry import ServerRegistry
 from mcp_agent.tracing.tracer import TracingConfig
 from mcp_agent.workflows.llm.llm_selector import ModelSelector
+from mcp_agent.workflows.llm.provider_clients import provider_clients
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.tracing.token_counter import TokenCounter
 
@@ -163,6 +164,14 @@ async def configure_executor(config: "Settings"):
 
         executor = TemporalExecutor(config=config.temporal)
         return executor
+    elif config.execution_engine == "process":
+        from mcp_agent.executor.process_executor import (
+            ProcessExecutor,
+            ProcessExecutorConfig,
+        )
+
+        settings = config.process.model_dump() if config.process else {}
+        return ProcessExecutor(config=ProcessExecutorConfig(**settings))
     else:
         # Default to asyncio executor
         executor = AsyncioExecutor()
@@ -219,6 +228,9 @@ async def initialize_context(
     await configure_logger(config, context.session_id, context.token_counter)
     await configure_usage_telemetry(config)
 
+    if config.provider_clients:
+        provider_clients.configure(config.provider_clients)
+
     context.task_registry = task_registry or ActivityRegistry()
 
     context.signal_registry = signal_registry or SignalRegistry()
@@ -256,12 +268,12 @@ async def cleanup_context(shutdown_logger: bool = False):
         shutdown_logger: If True, completely shutdown OTEL infrastructure.
                       If False, just cleanup app-specific resources.
     """
+    # Close pooled LLM provider connections owned by this event loop
+    await provider_clients.aclose()
+
     if shutdown_logger:
         # Shutdown logging and telemetry completely
         await LoggingConfig.shutdown()
-    else:
-        # Just cleanup app-specific resources
-        pass
 
 
 _global_context: Context | None = None
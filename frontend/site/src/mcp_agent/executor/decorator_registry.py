@@ -173,17 +173,17 @@ def default_workflow_signal(fn: Callable[..., R]) -> Callable[..., R]:
 
 
 def register_asyncio_decorators(decorator_registry: DecoratorRegistry):
-    """Registers default asyncio decorators."""
-    executor_name = "asyncio"
-    decorator_registry.register_workflow_defn_decorator(
-        executor_name, default_workflow_defn
-    )
-    decorator_registry.register_workflow_run_decorator(
-        executor_name, default_workflow_run
-    )
-    decorator_registry.register_workflow_signal_decorator(
-        executor_name, default_workflow_signal
-    )
+    """Registers default asyncio decorators (also used by the process engine)."""
+    for executor_name in ("asyncio", "process"):
+        decorator_registry.register_workflow_defn_decorator(
+            executor_name, default_workflow_defn
+        )
+        decorator_registry.register_workflow_run_decorator(
+            executor_name, default_workflow_run
+        )
+        decorator_registry.register_workflow_signal_decorator(
+            executor_name, default_workflow_signal
+        )
 
 
 def register_temporal_decorators(decorator_registry: DecoratorRegistry):
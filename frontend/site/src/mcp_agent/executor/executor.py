@@ -7,10 +7,12 @@ from contextlib import asynccontextmanager
 from datetime import timedelta
 from typing import (
     Any,
+    AsyncIterable,
     AsyncIterator,
     Callable,
     Coroutine,
     Dict,
+    Iterable,
     List,
     Optional,
     Type,
@@ -39,6 +41,9 @@ logger = get_logger(__name__)
 # Type variable for the return type of tasks
 R = TypeVar("R")
 
+# Workers used by AsyncioExecutor.imap when neither the call nor the config sets a limit
+DEFAULT_MAP_CONCURRENCY = 32
+
 
 class ExecutorConfig(BaseModel):
     """Configuration for executors."""
@@ -127,9 +132,15 @@ class Executor(ABC, ContextDependent):
         """
         results: List[R, BaseException] = []
 
+        # One semaphore shared by every item, so the limit actually applies
+        semaphore = (
+            asyncio.Semaphore(self.config.max_concurrent_activities)
+            if self.config.max_concurrent_activities
+            else None
+        )
+
         async def run(item):
-            if self.config.max_concurrent_activities:
-                semaphore = asyncio.Semaphore(self.config.max_concurrent_activities)
+            if semaphore:
                 async with semaphore:
                     return await self.execute(functools.partial(func, item), **kwargs)
             else:
@@ -386,6 +397,159 @@ class AsyncioExecutor(Executor):
                 for future in done:
                     yield await future
 
+    async def imap(
+        self,
+        func: Callable[..., R],
+        inputs: Iterable[Any] | AsyncIterable[Any],
+        concurrency: int | None = None,
+        ordered: bool = True,
+        timeout: float | None = None,
+        cancel_on_error: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[R | BaseException]:
+        """
+        Run `func(item, **kwargs)` for each item with a fixed pool of workers
+        and yield the results.
+
+        The workers pull items from `inputs` (which may be a lazy iterator or
+        an async iterable) only when they have room, so at most `concurrency`
+        items are in flight or awaiting delivery at any time: memory stays
+        O(concurrency) however many inputs there are.
+
+        Args:
+            func: The task to run for each item (sync or async)
+            inputs: The items, consumed lazily
+            concurrency: Number of workers. Defaults to the config's
+                max_concurrent_activities, or DEFAULT_MAP_CONCURRENCY
+            ordered: Yield results in input order (True) or as they complete
+            timeout: Optional per-item timeout in seconds; an item that times
+                out yields an asyncio.TimeoutError
+            cancel_on_error: Cancel the remaining items and raise the first
+                failure instead of yielding it
+            **kwargs: Additional arguments to pass to func
+
+        Yields:
+            Results or exceptions, one per input item
+        """
+        concurrency = (
+            concurrency
+            or self.config.max_concurrent_activities
+            or DEFAULT_MAP_CONCURRENCY
+        )
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        if isinstance(inputs, AsyncIterable):
+            iterator = inputs.__aiter__()
+            pull_lock = asyncio.Lock()
+
+            async def next_item():
+                # Async generators do not allow concurrent __anext__ calls
+                async with pull_lock:
+                    return await iterator.__anext__()
+
+        else:
+            iterator = iter(inputs)
+
+            async def next_item():
+                try:
+                    return next(iterator)
+                except StopIteration:
+                    raise StopAsyncIteration from None
+
+        # A slot is held from pulling an item until its result is yielded,
+        # which also bounds results buffered for in-order delivery
+        slots = asyncio.Semaphore(concurrency)
+        results: asyncio.Queue = asyncio.Queue()
+        done = object()
+        position = 0
+
+        async def run(item) -> R | BaseException:
+            # Through execute(), so each item gets its span and execution
+            # context as it does in Executor.map
+            if timeout is None:
+                return await self.execute(func, item, **kwargs)
+            try:
+                return await asyncio.wait_for(
+                    self.execute(func, item, **kwargs), timeout
+                )
+            except asyncio.TimeoutError as e:
+                return e
+
+        async def worker():
+            nonlocal position
+            try:
+                while True:
+                    await slots.acquire()
+                    try:
+                        item = await next_item()
+                    except StopAsyncIteration:
+                        slots.release()
+                        return
+                    index = position
+                    position += 1
+                    results.put_nowait((index, await run(item)))
+            except Exception as e:
+                # Failures of the input iterator itself end the map
+                results.put_nowait((None, e))
+            finally:
+                results.put_nowait(done)
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        running = len(workers)
+        buffered: Dict[int, R | BaseException] = {}
+        next_index = 0
+        try:
+            while running:
+                entry = await results.get()
+                if entry is done:
+                    running -= 1
+                    continue
+
+                index, result = entry
+                if index is None:
+                    raise result
+                if cancel_on_error and isinstance(result, BaseException):
+                    raise result
+
+                if not ordered:
+                    slots.release()
+                    yield result
+                    continue
+
+                buffered[index] = result
+                while next_index in buffered:
+                    slots.release()
+                    yield buffered.pop(next_index)
+                    next_index += 1
+        finally:
+            # Stops the pool on errors and when the caller stops iterating early
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def map(
+        self,
+        func: Callable[..., R],
+        inputs: List[Any],
+        **kwargs: Any,
+    ) -> List[R | BaseException]:
+        """
+        Run `func(item)` for each item in `inputs`. With max_concurrent_activities
+        set, items run on a bounded worker pool (see imap) instead of being
+        scheduled all at once.
+        """
+        if not self.config.max_concurrent_activities:
+            return await super().map(func, inputs, **kwargs)
+
+        results: List[R | BaseException] = []
+        async for entry in self.imap(func, inputs, **kwargs):
+            if isinstance(entry, list):
+                results.extend(entry)
+            else:
+                results.append(entry)
+        return results
+
     @telemetry.traced()
     async def signal(
         self,
@@ -0,0 +1,255 @@
+"""
+Process pool executor for CPU-bound workflow tasks.
+
+AsyncioExecutor runs synchronous callables on the default thread pool, where
+CPU-heavy work (image pre-processing, large JSON transformations, local
+scoring) holds the GIL and stalls the event loop serving MCP sessions. The
+ProcessExecutor behaves exactly like AsyncioExecutor, except that callables
+marked with @cpu_bound run in a pool of worker processes.
+
+Arguments and results cross the process boundary by pickling. Top-level
+bytes-like and numpy array arguments (and results) larger than
+`shared_memory_threshold` are passed through multiprocessing shared memory
+instead, so they are copied once rather than pickled through a pipe.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Any, Callable, Coroutine, Dict, List, Literal, Tuple
+
+from pydantic import ConfigDict
+
+from mcp_agent.config import ProcessExecutorSettings
+from mcp_agent.executor.executor import AsyncioExecutor, ExecutorConfig, R
+from mcp_agent.executor.workflow_signal import SignalHandler
+from mcp_agent.logging.logger import get_logger
+
+try:
+    import numpy
+except ImportError:  # Only bytes-like payloads use shared memory
+    numpy = None
+
+logger = get_logger(__name__)
+
+CPU_BOUND_ATTR = "__mcp_agent_cpu_bound__"
+
+
+def cpu_bound(fn: Callable[..., R]) -> Callable[..., R]:
+    """
+    Mark a synchronous function to run in the ProcessExecutor's worker
+    processes. The function must be importable at module level (picklable).
+    Under other executors it runs as before.
+    """
+    if asyncio.iscoroutinefunction(fn):
+        raise TypeError(f"{fn.__qualname__} must be synchronous to run in a process")
+    setattr(fn, CPU_BOUND_ATTR, True)
+    return fn
+
+
+def is_cpu_bound(task: Any) -> bool:
+    while isinstance(task, functools.partial):
+        task = task.func
+    return bool(getattr(task, CPU_BOUND_ATTR, False))
+
+
+class SharedPayload:
+    """Picklable handle to a bytes-like or numpy payload in shared memory"""
+
+    __slots__ = ("name", "size", "kind", "dtype", "shape")
+
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        kind: Literal["bytes", "bytearray", "ndarray"],
+        dtype: str | None = None,
+        shape: Tuple[int, ...] | None = None,
+    ):
+        self.name = name
+        self.size = size
+        self.kind = kind
+        self.dtype = dtype
+        self.shape = shape
+
+    def __getstate__(self):
+        return (self.name, self.size, self.kind, self.dtype, self.shape)
+
+    def __setstate__(self, state):
+        self.name, self.size, self.kind, self.dtype, self.shape = state
+
+
+def _share(value: Any, threshold: int) -> Tuple[Any, shared_memory.SharedMemory | None]:
+    """Move a large payload into a new shared memory block"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        data = memoryview(value).cast("B")
+        kind = "bytearray" if isinstance(value, bytearray) else "bytes"
+        dtype = shape = None
+    elif numpy is not None and isinstance(value, numpy.ndarray) and not value.dtype.hasobject:
+        data = memoryview(numpy.ascontiguousarray(value)).cast("B")
+        kind, dtype, shape = "ndarray", value.dtype.str, value.shape
+    else:
+        return value, None
+
+    if data.nbytes < threshold:
+        return value, None
+    block = shared_memory.SharedMemory(create=True, size=data.nbytes)
+    block.buf[: data.nbytes] = data
+    return SharedPayload(block.name, data.nbytes, kind, dtype, shape), block
+
+
+def _load(value: Any, unlink: bool = False) -> Any:
+    """Copy a shared payload out of its block, optionally freeing the block"""
+    if not isinstance(value, SharedPayload):
+        return value
+    block = shared_memory.SharedMemory(name=value.name)
+    try:
+        data = block.buf[: value.size]
+        if value.kind == "ndarray":
+            result = numpy.frombuffer(data, dtype=value.dtype).reshape(value.shape).copy()
+        elif value.kind == "bytearray":
+            result = bytearray(data)
+        else:
+            result = bytes(data)
+        del data
+        return result
+    finally:
+        block.close()
+        if unlink:
+            block.unlink()
+
+
+def _discard(value: Any) -> None:
+    """Free the block behind a shared payload without reading it"""
+    if isinstance(value, SharedPayload):
+        block = shared_memory.SharedMemory(name=value.name)
+        block.close()
+        block.unlink()
+
+
+def _release(
+    blocks: List[shared_memory.SharedMemory], future: concurrent.futures.Future
+) -> None:
+    """
+    Done callback for a worker whose caller went away: free its shared result
+    and, now that it can no longer attach to them, its argument blocks
+    """
+    try:
+        if not future.cancelled() and future.exception() is None:
+            _discard(future.result())
+    except Exception as e:
+        logger.error(f"Error freeing shared memory of a cancelled task: {e}")
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _run_in_process(
+    task: Callable[..., R], args: Tuple[Any, ...], kwargs: Dict[str, Any], threshold: int
+) -> Any:
+    """Worker-side entry point: resolve shared arguments, run, share the result"""
+    result = task(
+        *(_load(arg) for arg in args), **{k: _load(v) for k, v in kwargs.items()}
+    )
+    result, block = _share(result, threshold)
+    if block is not None:
+        block.close()
+    return result
+
+
+class ProcessExecutorConfig(ExecutorConfig, ProcessExecutorSettings):
+    """Configuration for process pool executors."""
+
+    model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
+
+
+class ProcessExecutor(AsyncioExecutor):
+    """
+    AsyncioExecutor that runs @cpu_bound callables in a process pool. All other
+    tasks (coroutines, async and ordinary sync callables) run as they would
+    under AsyncioExecutor.
+    """
+
+    def __init__(
+        self,
+        config: ProcessExecutorConfig | None = None,
+        signal_bus: SignalHandler | None = None,
+    ):
+        super().__init__(config=config or ProcessExecutorConfig(), signal_bus=signal_bus)
+        self.execution_engine = "process"
+        self.config: ProcessExecutorConfig
+        self._pool: concurrent.futures.ProcessPoolExecutor | None = None
+
+    @property
+    def pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """The worker pool, started on first use"""
+        if self._pool is None:
+            self._pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.config.max_workers,
+                mp_context=multiprocessing.get_context(self.config.start_method),
+            )
+        return self._pool
+
+    async def _execute_task(
+        self,
+        task: Callable[..., R] | Coroutine[Any, Any, R],
+        *args,
+        **kwargs,
+    ) -> R | BaseException:
+        if not is_cpu_bound(task):
+            return await super()._execute_task(task, *args, **kwargs)
+
+        if self._activity_semaphore:
+            async with self._activity_semaphore:
+                return await self._run_in_pool(task, args, kwargs)
+        return await self._run_in_pool(task, args, kwargs)
+
+    async def _run_in_pool(
+        self, task: Callable[..., R], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> R | BaseException:
+        threshold = self.config.shared_memory_threshold
+        blocks = []
+
+        def share(value):
+            value, block = _share(value, threshold)
+            if block is not None:
+                blocks.append(block)
+            return value
+
+        try:
+            shared_args = tuple(share(arg) for arg in args)
+            shared_kwargs = {key: share(value) for key, value in kwargs.items()}
+            future = self.pool.submit(
+                _run_in_process, task, shared_args, shared_kwargs, threshold
+            )
+            try:
+                result = await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                # The worker may still be running (and not yet attached to its
+                # arguments), so the blocks are freed once it's done
+                future.add_done_callback(functools.partial(_release, blocks))
+                blocks = []
+                raise
+            # The worker leaves a shared result for us to copy out and free
+            return _load(result, unlink=True)
+        except concurrent.futures.process.BrokenProcessPool as e:
+            # A worker died (e.g. killed by the OOM killer); start a new pool next time
+            logger.error(f"Process pool broken, restarting it: {e}")
+            self._pool = None
+            return e
+        except Exception as e:
+            logger.error(f"Error executing task: {e}")
+            return e
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
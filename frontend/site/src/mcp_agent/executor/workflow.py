@@ -222,7 +222,7 @@ class Workflow(ABC, Generic[T], ContextDependent):
 
         self.update_status("scheduled")
 
-        if self.context.config.execution_engine == "asyncio":
+        if self.context.config.execution_engine in ("asyncio", "process"):
             # Generate a unique ID for this workflow instance
             if not self._workflow_id:
                 self._workflow_id = provided_workflow_id or self.name
@@ -1,6 +1,8 @@
+import json
 import os
 import warnings
-from typing import Any, Dict, Iterable, Set
+from collections.abc import Iterable as IterableABC
+from typing import Any, Callable, Dict, Iterable, Set
 from datetime import datetime, date
 from decimal import Decimal
 from pathlib import Path
@@ -12,11 +14,46 @@ import httpx
 
 from mcp_agent.logging import logger
 
+try:
+    import orjson
+except ImportError:  # json.dumps is used for bytes output instead
+    orjson = None
+
+_Plan = Callable[["JSONSerializer", Any, int], Any]
+
+# Serialization hooks looked up with hasattr(), which instance attributes
+# (or __getattr__) can satisfy where the class doesn't
+_INSTANCE_HOOKS = frozenset({"model_dump", "dict", "to_json", "to_dict"})
+
+
+def encode_json(value: Any) -> bytes:
+    """
+    Encode an already serialized value as compact JSON bytes, with orjson when
+    it's installed. orjson writes non-ASCII characters as UTF-8 rather than
+    \\u escapes.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # e.g. integers beyond 64 bits; json handles those
+            pass
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _type_has(obj_type: type, name: str) -> bool:
+    """Whether instances of obj_type get attribute `name` from their class"""
+    return any(name in vars(klass) for klass in obj_type.__mro__)
+
 
 class JSONSerializer:
     """
     A robust JSON serializer that handles various Python objects by attempting
     different serialization strategies recursively.
+
+    The strategy for an object depends (almost always) only on its type, so
+    it's chosen once per type and cached as a plan. Objects whose instance
+    attributes could change the choice go through the full strategy chain.
     """
 
     MAX_DEPTH = 99  # Maximum recursion depth
@@ -33,6 +70,14 @@ class JSONSerializer:
         "refresh_token",
     }
 
+    # Caches shared by all serializers: type -> plan, key -> is sensitive.
+    # Both are cleared when full, so dynamically created classes (and keys)
+    # can't accumulate
+    _plans: Dict[type, _Plan] = {}
+    _MAX_PLANS = 1024
+    _sensitive_keys: Dict[str, bool] = {}
+    _MAX_SENSITIVE_KEYS = 10_000
+
     def __init__(self):
         # Set of already processed objects to prevent infinite recursion
         self._processed_objects: Set[int] = set()
@@ -55,13 +100,23 @@ class JSONSerializer:
         self._processed_objects.clear()
         return self._serialize_object(obj, depth=0)
 
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes (see encode_json)."""
+        return encode_json(self.serialize(obj))
+
     def _is_sensitive_key(self, key: str) -> bool:
         """Check if a key likely contains sensitive information."""
-        key = str(key).lower()
-        return any(sensitive in key for sensitive in self.SENSITIVE_FIELDS)
+        sensitive = self._sensitive_keys.get(key)
+        if sensitive is None:
+            lowered = str(key).lower()
+            sensitive = any(s in lowered for s in self.SENSITIVE_FIELDS)
+            if len(self._sensitive_keys) >= self._MAX_SENSITIVE_KEYS:
+                self._sensitive_keys.clear()
+            self._sensitive_keys[key] = sensitive
+        return sensitive
 
     def _serialize_object(self, obj: Any, depth: int = 0) -> Any:
-        """Recursively serialize an object using various strategies."""
+        """Recursively serialize an object using its type's plan."""
         # Handle None
         if obj is None:
             return None
@@ -81,89 +136,205 @@ class JSONSerializer:
             return str(obj)
         self._processed_objects.add(obj_id)
 
-        # Try different serialization strategies in order
         try:
-            if isinstance(obj, httpx.Response):
-                return f"<httpx.Response [{obj.status_code}] {obj.url}>"
-
-            if isinstance(obj, logger.Logger):
-                return "<logging: logger>"
-
-            # Basic JSON-serializable types
-            if isinstance(obj, (str, int, float, bool)):
-                return obj
-
-            # Handle common built-in types
-            if isinstance(obj, (datetime, date)):
-                return obj.isoformat()
-            if isinstance(obj, (Decimal, UUID)):
-                return str(obj)
-            if isinstance(obj, Path):
-                return str(obj)
-            if isinstance(obj, Enum):
-                return obj.value
-
-            # Handle callables
-            if callable(obj):
-                return f"<callable: {obj.__name__}>"
-
-            # Handle Pydantic models
-            if hasattr(obj, "model_dump"):  # Pydantic v2
-                return self._serialize_object(obj.model_dump())
-            if hasattr(obj, "dict"):  # Pydantic v1
-                return self._serialize_object(obj.dict())
-
-            # Handle dataclasses
-            if dataclasses.is_dataclass(obj):
-                return self._serialize_object(dataclasses.asdict(obj))
-
-            # Handle objects with custom serialization method
-            if hasattr(obj, "to_json"):
-                return self._serialize_object(obj.to_json())
-            if hasattr(obj, "to_dict"):
-                return self._serialize_object(obj.to_dict())
-
-            # Handle dictionaries with sensitive data redaction
-            if isinstance(obj, Dict):
-                safe_dict: Dict[str, Any] = {}
-                for key, value in obj.items():
-                    skey = str(key)
-                    if self._is_sensitive_key(skey):
-                        # Redact strings; for non-strings, avoid leaking complex objects
-                        safe_dict[skey] = (
-                            self._redact_sensitive_value(value)
-                            if isinstance(value, str)
-                            else "<redacted>"
-                        )
-                    else:
-                        safe_dict[skey] = self._serialize_object(value, depth + 1)
-                return safe_dict
-
-            # Handle iterables (lists, tuples, sets)
-            if isinstance(obj, Iterable) and not isinstance(obj, (str, bytes)):
-                return [self._serialize_object(item, depth + 1) for item in obj]
-
-            # Handle objects with __dict__
-            if hasattr(obj, "__dict__"):
-                return self._serialize_object(obj.__dict__, depth + 1)
-
-            # Handle objects with attributes
-            if inspect.getmembers(obj):
-                return {
-                    name: self._redact_sensitive_value(value)
-                    if self._is_sensitive_key(name)
-                    else self._serialize_object(value, depth + 1)
-                    for name, value in inspect.getmembers(obj)
-                    if not name.startswith("_") and not inspect.ismethod(value)
-                }
-
-            # Fallback: convert to string
-            return str(obj)
-
+            plan = self._plans.get(type(obj))
+            if plan is None:
+                plan = self._plan_for(type(obj))
+                if len(self._plans) >= self._MAX_PLANS:
+                    self._plans.clear()
+                self._plans[type(obj)] = plan
+            return plan(self, obj, depth)
         except Exception as e:
             # If all serialization attempts fail, return string representation
             return f"<unserializable: {type(obj).__name__}, error: {str(e)}>"
 
+    @classmethod
+    def _plan_for(cls, obj_type: type) -> _Plan:
+        """
+        Pick the strategy _serialize_any() would pick for instances of
+        obj_type, checking the class instead of the instance.
+        """
+        if issubclass(obj_type, httpx.Response):
+            return cls._serialize_httpx_response
+        if issubclass(obj_type, logger.Logger):
+            return cls._serialize_logger
+        if issubclass(obj_type, (str, int, float, bool)):
+            return cls._serialize_as_is
+        if issubclass(obj_type, (datetime, date)):
+            return cls._serialize_isoformat
+        if issubclass(obj_type, (Decimal, UUID, Path)):
+            return cls._serialize_str
+        if issubclass(obj_type, Enum):
+            return cls._serialize_enum
+        if _type_has(obj_type, "__call__"):
+            return cls._serialize_callable
+        if _type_has(obj_type, "model_dump"):
+            return cls._serialize_model_dump
+
+        # From here on the checks use hasattr(), so an instance attribute
+        # (or __getattr__) can make an instance take an earlier strategy
+        if _type_has(obj_type, "dict"):
+            plan = cls._serialize_dict_method
+        elif dataclasses.is_dataclass(obj_type):
+            plan = cls._serialize_dataclass
+        elif _type_has(obj_type, "to_json"):
+            plan = cls._serialize_to_json
+        elif _type_has(obj_type, "to_dict"):
+            plan = cls._serialize_to_dict
+        elif issubclass(obj_type, dict):
+            plan = cls._serialize_dict
+        elif issubclass(obj_type, IterableABC) and not issubclass(obj_type, bytes):
+            plan = cls._serialize_iterable
+        else:
+            plan = cls._serialize_attributes
+
+        if _type_has(obj_type, "__getattr__"):
+            return cls._serialize_any
+        if obj_type.__dictoffset__:
+            return cls._guarded(plan)
+        return plan
+
+    @staticmethod
+    def _guarded(plan: _Plan) -> _Plan:
+        def serialize_checked(self: "JSONSerializer", obj: Any, depth: int) -> Any:
+            if _INSTANCE_HOOKS.isdisjoint(obj.__dict__):
+                return plan(self, obj, depth)
+            return self._serialize_any(obj, depth)
+
+        return serialize_checked
+
+    def _serialize_httpx_response(self, obj: Any, depth: int) -> Any:
+        return f"<httpx.Response [{obj.status_code}] {obj.url}>"
+
+    def _serialize_logger(self, obj: Any, depth: int) -> Any:
+        return "<logging: logger>"
+
+    def _serialize_as_is(self, obj: Any, depth: int) -> Any:
+        return obj
+
+    def _serialize_isoformat(self, obj: Any, depth: int) -> Any:
+        return obj.isoformat()
+
+    def _serialize_str(self, obj: Any, depth: int) -> Any:
+        return str(obj)
+
+    def _serialize_enum(self, obj: Any, depth: int) -> Any:
+        return obj.value
+
+    def _serialize_callable(self, obj: Any, depth: int) -> Any:
+        return f"<callable: {obj.__name__}>"
+
+    def _serialize_model_dump(self, obj: Any, depth: int) -> Any:
+        # Pydantic v2
+        return self._serialize_object(obj.model_dump())
+
+    def _serialize_dict_method(self, obj: Any, depth: int) -> Any:
+        # Pydantic v1
+        return self._serialize_object(obj.dict())
+
+    def _serialize_dataclass(self, obj: Any, depth: int) -> Any:
+        return self._serialize_object(dataclasses.asdict(obj))
+
+    def _serialize_to_json(self, obj: Any, depth: int) -> Any:
+        return self._serialize_object(obj.to_json())
+
+    def _serialize_to_dict(self, obj: Any, depth: int) -> Any:
+        return self._serialize_object(obj.to_dict())
+
+    def _serialize_dict(self, obj: Any, depth: int) -> Any:
+        # Redact sensitive data
+        safe_dict: Dict[str, Any] = {}
+        sensitive_keys = self._sensitive_keys
+        for key, value in obj.items():
+            skey = str(key)
+            sensitive = sensitive_keys.get(skey)
+            if sensitive is None:
+                sensitive = self._is_sensitive_key(skey)
+            if sensitive:
+                # Redact strings; for non-strings, avoid leaking complex objects
+                safe_dict[skey] = (
+                    self._redact_sensitive_value(value)
+                    if isinstance(value, str)
+                    else "<redacted>"
+                )
+            else:
+                safe_dict[skey] = self._serialize_object(value, depth + 1)
+        return safe_dict
+
+    def _serialize_iterable(self, obj: Any, depth: int) -> Any:
+        # Lists, tuples, sets
+        return [self._serialize_object(item, depth + 1) for item in obj]
+
+    def _serialize_attributes(self, obj: Any, depth: int) -> Any:
+        # Handle objects with __dict__
+        if hasattr(obj, "__dict__"):
+            return self._serialize_object(obj.__dict__, depth + 1)
+
+        # Handle objects with attributes
+        if inspect.getmembers(obj):
+            return {
+                name: self._redact_sensitive_value(value)
+                if self._is_sensitive_key(name)
+                else self._serialize_object(value, depth + 1)
+                for name, value in inspect.getmembers(obj)
+                if not name.startswith("_") and not inspect.ismethod(value)
+            }
+
+        # Fallback: convert to string
+        return str(obj)
+
+    def _serialize_any(self, obj: Any, depth: int) -> Any:
+        """Try the serialization strategies in order, checking the instance."""
+        if isinstance(obj, httpx.Response):
+            return self._serialize_httpx_response(obj, depth)
+
+        if isinstance(obj, logger.Logger):
+            return self._serialize_logger(obj, depth)
+
+        # Basic JSON-serializable types
+        if isinstance(obj, (str, int, float, bool)):
+            return obj
+
+        # Handle common built-in types
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        if isinstance(obj, (Decimal, UUID)):
+            return str(obj)
+        if isinstance(obj, Path):
+            return str(obj)
+        if isinstance(obj, Enum):
+            return obj.value
+
+        # Handle callables
+        if callable(obj):
+            return self._serialize_callable(obj, depth)
+
+        # Handle Pydantic models
+        if hasattr(obj, "model_dump"):  # Pydantic v2
+            return self._serialize_model_dump(obj, depth)
+        if hasattr(obj, "dict"):  # Pydantic v1
+            return self._serialize_dict_method(obj, depth)
+
+        # Handle dataclasses
+        if dataclasses.is_dataclass(obj):
+            return self._serialize_dataclass(obj, depth)
+
+        # Handle objects with custom serialization method
+        if hasattr(obj, "to_json"):
+            return self._serialize_to_json(obj, depth)
+        if hasattr(obj, "to_dict"):
+            return self._serialize_to_dict(obj, depth)
+
+        # Handle dictionaries with sensitive data redaction
+        if isinstance(obj, Dict):
+            return self._serialize_dict(obj, depth)
+
+        # Handle iterables (lists, tuples, sets)
+        if isinstance(obj, Iterable) and not isinstance(obj, (str, bytes)):
+            return self._serialize_iterable(obj, depth)
+
+        return self._serialize_attributes(obj, depth)
+
     def __call__(self, obj: Any) -> Any:
         """Make the serializer callable."""
         return self.serialize(obj)
@@ -5,12 +5,14 @@ Listeners for the logger module of MCP Agent.
 import asyncio
 import logging
 import time
+import traceback
 
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Protocol, TYPE_CHECKING
 
 from mcp_agent.logging.events import Event, EventFilter, EventType
 from mcp_agent.logging.event_progress import convert_log_event
+from rich import print
 
 if TYPE_CHECKING:  # pragma: no cover - for type checking only
     from mcp.types import LoggingLevel
@@ -26,13 +28,39 @@ class UpstreamServerSessionProtocol(Protocol):
     ) -> None: ...
 
 
+def report_listener_error(e: BaseException):
+    """Print a listener failure; the listener keeps receiving events."""
+    print(f"Error in listener: {e}")
+    print(
+        f"Stacktrace: {''.join(traceback.format_exception(type(e), e, e.__traceback__))}"
+    )
+
+
 class EventListener(ABC):
     """Base async listener that processes events."""
 
+    synchronous: bool = False
+    """
+    True if the listener implements handle_events_sync(), which processes a
+    batch without awaiting anything. The event bus then calls it inline
+    instead of scheduling handle_events().
+    """
+
     @abstractmethod
     async def handle_event(self, event: Event):
         """Process an incoming event."""
 
+    async def handle_events(self, events: List[Event]):
+        """
+        Process a batch of events, in order. A failing event is reported and
+        doesn't stop the rest of the batch. Override to handle them at once.
+        """
+        for event in events:
+            try:
+                await self.handle_event(event)
+            except Exception as e:
+                report_listener_error(e)
+
 
 class LifecycleAwareListener(EventListener):
     """
@@ -77,6 +105,8 @@ class LoggingListener(FilteredListener):
     Routes events to Python's logging facility with appropriate severity level.
     """
 
+    synchronous = True
+
     def __init__(
         self,
         event_filter: EventFilter | None = None,
@@ -91,6 +121,17 @@ class LoggingListener(FilteredListener):
         self.logger = logger or logging.getLogger("mcp_agent")
 
     async def handle_matched_event(self, event):
+        self.handle_matched_event_sync(event)
+
+    def handle_events_sync(self, events: List[Event]):
+        for event in events:
+            try:
+                if not self.filter or self.filter.matches(event):
+                    self.handle_matched_event_sync(event)
+            except Exception as e:
+                report_listener_error(e)
+
+    def handle_matched_event_sync(self, event):
         level_map: Dict[EventType, int] = {
             "debug": logging.DEBUG,
             "info": logging.INFO,
@@ -126,6 +167,8 @@ class ProgressListener(LifecycleAwareListener):
     FilteredListener, we get events before any filtering occurs.
     """
 
+    synchronous = True
+
     def __init__(self, display=None, token_counter=None):
         """Initialize the progress listener.
         Args:
@@ -149,10 +192,20 @@ class ProgressListener(LifecycleAwareListener):
 
     async def handle_event(self, event: Event):
         """Process an incoming event and display progress if relevant."""
-        if self.display and event.data:
-            progress_event = convert_log_event(event)
-            if progress_event:
-                self.display.update(progress_event)
+        self.handle_events_sync([event])
+
+    def handle_events_sync(self, events: List[Event]):
+        if not self.display:
+            return
+        for event in events:
+            if not event.data:
+                continue
+            try:
+                progress_event = convert_log_event(event)
+                if progress_event:
+                    self.display.update(progress_event)
+            except Exception as e:
+                report_listener_error(e)
 
 
 class BatchingListener(FilteredListener):
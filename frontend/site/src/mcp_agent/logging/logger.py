@@ -12,7 +12,7 @@ from datetime import timedelta
 import threading
 import time
 
-from typing import Any, Dict, Final
+from typing import Any, Callable, Dict, Final
 
 from contextlib import asynccontextmanager, contextmanager
 
@@ -25,10 +25,22 @@ from mcp_agent.logging.events import (
 )
 from mcp_agent.logging.listeners import (
     BatchingListener,
+    FilteredListener,
     LoggingListener,
     ProgressListener,
 )
-from mcp_agent.logging.transport import AsyncEventBus, EventTransport
+from mcp_agent.logging.transport import (
+    AsyncEventBus,
+    EventTransport,
+    FilteredEventTransport,
+    MultiTransport,
+    NoOpTransport,
+)
+
+# What a logger emits for an event type, see Logger._emit_level()
+_EMIT_NONE = 0
+_EMIT_PROGRESS = 1
+_EMIT_ALL = 2
 
 
 class Logger:
@@ -36,6 +48,14 @@ class Logger:
     Developer-friendly logger that sends events to the AsyncEventBus.
     - `type` is a broad category (INFO, ERROR, etc.).
     - `name` can be a custom domain-specific event name, e.g. "ORDER_PLACED".
+
+    Events no listener or transport would accept (e.g. debug events below
+    the configured level) are dropped before anything is built. For
+    messages or data that are expensive to produce, pass a zero-argument
+    callable as the message or as `data=`; it's only called if the event is
+    emitted:
+
+        logger.debug(lambda: f"Tools: {describe(tools)}", data=lambda: {...})
     """
 
     def __init__(
@@ -48,6 +68,39 @@ class Logger:
         # an "upstream_session" attribute. This allows cached loggers to
         # observe the current upstream session without relying on globals.
         self._bound_context = bound_context
+        # Per event type emit decisions, valid for the versions below
+        self._emit_levels: Dict[str, int] = {}
+        self._config_version = -1
+        self._bus_version = -1
+
+    def _emit_level(self, etype: EventType) -> int:
+        """
+        Whether events of this type from this namespace are emitted: all of
+        them, only progress events (for the progress display, which sees
+        events before filtering), or none. Cached until the logging config
+        or the event bus changes.
+        """
+        if (
+            self._config_version != LoggingConfig._version
+            or self._bus_version != self.event_bus.version
+        ):
+            self._emit_levels = {}
+            self._config_version = LoggingConfig._version
+            self._bus_version = self.event_bus.version
+        level = self._emit_levels.get(etype)
+        if level is None:
+            level = self._emit_levels[etype] = _emit_level_for(
+                self.event_bus, self.namespace, etype
+            )
+        return level
+
+    def is_enabled_for(self, etype: EventType) -> bool:
+        """
+        Whether an event of this type would reach any listener or transport.
+        Progress events may still be emitted for the progress display when
+        this is False.
+        """
+        return self._emit_level(etype) == _EMIT_ALL
 
     def _ensure_event_loop(self):
         """Ensure we have an event loop we can use."""
@@ -200,11 +253,24 @@ class Logger:
         self,
         etype: EventType,
         ename: str | None,
-        message: str,
+        message: str | Callable[[], str],
         context: EventContext | None,
-        data: dict,
+        data: dict | Callable[[], dict],
     ):
-        """Create and emit an event."""
+        """Create and emit an event, unless nothing would consume it."""
+        emit_level = self._emit_level(etype)
+        if emit_level == _EMIT_NONE:
+            return
+
+        if callable(data):
+            data = data()
+        if callable(data.get("data")):
+            data = {**data, "data": data["data"]()}
+        if emit_level == _EMIT_PROGRESS and not _is_progress_data(data):
+            return
+        if callable(message):
+            message = message()
+
         # Only create or modify context with session_id if we have one
         if self.session_id:
             # If no context was provided, create one with our session_id
@@ -260,7 +326,7 @@ class Logger:
 
     def debug(
         self,
-        message: str,
+        message: str | Callable[[], str],
         name: str | None = None,
         context: EventContext = None,
         **data,
@@ -270,7 +336,7 @@ class Logger:
 
     def info(
         self,
-        message: str,
+        message: str | Callable[[], str],
         name: str | None = None,
         context: EventContext = None,
         **data,
@@ -280,7 +346,7 @@ class Logger:
 
     def warning(
         self,
-        message: str,
+        message: str | Callable[[], str],
         name: str | None = None,
         context: EventContext = None,
         **data,
@@ -290,7 +356,7 @@ class Logger:
 
     def error(
         self,
-        message: str,
+        message: str | Callable[[], str],
         name: str | None = None,
         context: EventContext = None,
         **data,
@@ -300,7 +366,7 @@ class Logger:
 
     def progress(
         self,
-        message: str,
+        message: str | Callable[[], str],
         name: str | None = None,
         percentage: float = None,
         context: EventContext = None,
@@ -370,6 +436,8 @@ class LoggingConfig:
 
     _initialized: bool = False
     _event_filter_ref: EventFilter | None = None
+    _version: int = 0
+    """Bumped when filtering changes; loggers then recompute what they emit"""
 
     @classmethod
     async def configure(
@@ -394,6 +462,7 @@ class LoggingConfig:
         # Keep a reference to the provided filter so we can update at runtime
         if event_filter is not None:
             cls._event_filter_ref = event_filter
+            cls.invalidate_level_cache()
 
         # If already initialized, ensure critical listeners exist and return
         if cls._initialized:
@@ -467,6 +536,14 @@ class LoggingConfig:
             return
         bus = AsyncEventBus.get()
         await bus.stop()
+        # Write out anything transports still buffer (e.g. FileTransport's queue)
+        close = getattr(bus.transport, "close", None)
+        if close is not None:
+            try:
+                await close()
+            except Exception:
+                # Non-fatal during shutdown
+                pass
         cls._initialized = False
 
     @classmethod
@@ -489,6 +566,15 @@ class LoggingConfig:
             "emergency": "error",
         }
         cls._event_filter_ref.min_level = mapping.get(normalized, "info")
+        cls.invalidate_level_cache()
+
+    @classmethod
+    def invalidate_level_cache(cls) -> None:
+        """
+        Make loggers recompute which event types they emit. Call this after
+        modifying the shared event filter in place.
+        """
+        cls._version += 1
 
     @classmethod
     def get_event_filter(cls) -> EventFilter | None:
@@ -505,6 +591,52 @@ class LoggingConfig:
             await cls.shutdown()
 
 
+def _emit_level_for(bus: AsyncEventBus, namespace: str, etype: EventType) -> int:
+    """
+    Decide what a logger emits for an event type. Events rejected by the
+    shared event filter can only be dropped if every listener and transport
+    applies that same filter; the progress listener sees events before
+    filtering, so progress events are still emitted while it's registered.
+    """
+    event_filter = LoggingConfig._event_filter_ref
+    # Filters on event names depend on the call, not just the type
+    if event_filter is None or event_filter.names:
+        return _EMIT_ALL
+    probe = Event(type=etype, namespace=namespace, message="")
+    # Base checks only: a SamplingFilter passes a subset of these
+    if EventFilter.matches(event_filter, probe):
+        return _EMIT_ALL
+    if not _applies_filter(bus.transport, event_filter):
+        return _EMIT_ALL
+
+    level = _EMIT_NONE
+    for listener in bus.listeners.values():
+        if isinstance(listener, ProgressListener):
+            level = _EMIT_PROGRESS
+        elif not (
+            isinstance(listener, FilteredListener) and listener.filter is event_filter
+        ):
+            return _EMIT_ALL
+    return level
+
+
+def _applies_filter(transport: EventTransport, event_filter: EventFilter) -> bool:
+    if isinstance(transport, MultiTransport):
+        return all(_applies_filter(t, event_filter) for t in transport.transports)
+    if isinstance(transport, NoOpTransport):
+        return True
+    return (
+        isinstance(transport, FilteredEventTransport)
+        and transport.filter is event_filter
+    )
+
+
+def _is_progress_data(data: dict) -> bool:
+    """Whether the progress listener would display an event with this data"""
+    event_data = data.get("data")
+    return isinstance(event_data, dict) and bool(event_data.get("progress_action"))
+
+
 _logger_lock = threading.Lock()
 _loggers: Dict[str, Logger] = {}
 _default_bound_context: Any | None = None
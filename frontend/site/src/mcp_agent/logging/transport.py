@@ -5,12 +5,19 @@ Transports for the Logger module for MCP Agent, including:
 """
 
 import asyncio
+import atexit
+import gzip
 import json
+import os
+import queue
+import threading
+import time
 import uuid
 import datetime
 import sys
 from abc import ABC, abstractmethod
-from typing import Dict, List, Protocol
+from collections import deque
+from typing import IO, Deque, Dict, List, Literal, Protocol, Tuple
 from pathlib import Path
 
 import aiohttp
@@ -21,10 +28,13 @@ from rich.text import Text
 from mcp_agent.config import LoggerSettings
 from mcp_agent.console import console
 from mcp_agent.logging.events import Event, EventFilter
-from mcp_agent.logging.json_serializer import JSONSerializer
-from mcp_agent.logging.listeners import EventListener, LifecycleAwareListener
+from mcp_agent.logging.json_serializer import JSONSerializer, encode_json
+from mcp_agent.logging.listeners import (
+    EventListener,
+    LifecycleAwareListener,
+    report_listener_error,
+)
 from rich import print
-import traceback
 
 
 class EventTransport(Protocol):
@@ -109,7 +119,17 @@ class ConsoleTransport(FilteredEventTransport):
 
 
 class FileTransport(FilteredEventTransport):
-    """Transport that writes events to a file with proper formatting."""
+    """
+    Transport that writes events to a file with proper formatting.
+
+    Lines are formatted on the caller's event loop and handed to a dedicated
+    writer thread through a bounded queue. The writer keeps the file open and
+    writes whatever lines have queued up in one call (group commit), flushing
+    at most every `flush_interval` seconds while busy and as soon as it goes
+    idle for that long. When the queue is full, `overflow="block"` makes
+    senders wait for room (in order) and `overflow="drop"` discards the event
+    and counts it in `dropped`.
+    """
 
     def __init__(
         self,
@@ -117,6 +137,12 @@ class FileTransport(FilteredEventTransport):
         event_filter: EventFilter | None = None,
         mode: str = "a",
         encoding: str = "utf-8",
+        max_queue_size: int = 2048,
+        flush_interval: float = 1.0,
+        fsync_interval: float | None = None,
+        max_bytes: int = 0,
+        backup_count: int = 5,
+        overflow: Literal["block", "drop"] = "block",
     ):
         """Initialize FileTransport.
 
@@ -125,24 +151,43 @@ class FileTransport(FilteredEventTransport):
             event_filter: Optional filter for events
             mode: File open mode ('a' for append, 'w' for write)
             encoding: File encoding to use
+            max_queue_size: Maximum number of lines waiting for the writer thread
+            flush_interval: Maximum seconds written lines stay in the file buffer (0 flushes every write)
+            fsync_interval: Minimum seconds between fsyncs on flush (None never fsyncs)
+            max_bytes: Rotate the file once it reaches this size (0 disables rotation)
+            backup_count: Number of rotated files (filepath.1 ... filepath.N) to keep
+            overflow: What to do when the queue is full, 'block' or 'drop'
         """
         super().__init__(event_filter=event_filter)
         self.filepath = Path(filepath)
         self.mode = mode
         self.encoding = encoding
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.overflow = overflow
         self._serializer = JSONSerializer()
 
-        # Batching for efficient writes
-        self._write_buffer: List[str] = []
-        self._buffer_lock = asyncio.Lock()
-        self._flush_task: asyncio.Task | None = None
-        self._running = True
+        self._queue: "queue.Queue[str | threading.Event | None]" = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self._file_mode = mode
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        # Senders waiting for room in the queue, served in arrival order
+        self._put_lock: asyncio.Lock | None = None
+        self._waiting = 0
+
+        self.written = 0
+        self.dropped = 0
+        self.rotations = 0
 
         # Create directory if it doesn't exist
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
     async def send_matched_event(self, event: Event) -> None:
-        """Write matched event to log file asynchronously.
+        """Queue matched event for the writer thread.
 
         Args:
             event: Event to write to file
@@ -166,38 +211,208 @@ class FileTransport(FilteredEventTransport):
         # Prepare the log line
         log_line = json.dumps(log_entry, separators=(",", ":")) + "\n"
 
-        # Use asyncio to run file I/O in executor to avoid blocking
+        self._ensure_writer()
+        if not self._waiting:
+            try:
+                self._queue.put_nowait(log_line)
+                return
+            except queue.Full:
+                pass
+
+        if self.overflow == "drop":
+            self.dropped += 1
+            return
+
+        # Back-pressure: wait for the writer to make room, behind earlier waiters
+        if self._put_lock is None:
+            self._put_lock = asyncio.Lock()
+        self._waiting += 1
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,  # Use default executor
-                self._write_to_file,
-                log_line,
-            )
-        except IOError as e:
-            # Log error without recursion
-            print(f"Error writing to log file {self.filepath}: {e}")
+            async with self._put_lock:
+                while True:
+                    try:
+                        self._queue.put_nowait(log_line)
+                        return
+                    except queue.Full:
+                        pass
+                    writer = self._thread
+                    if writer is None or not writer.is_alive():
+                        # Nothing will make room; don't block loggers forever
+                        self.dropped += 1
+                        return
+                    await asyncio.sleep(0.001)
+        finally:
+            self._waiting -= 1
 
-    def _write_to_file(self, log_line: str) -> None:
-        """Synchronous file write helper for use in executor."""
-        with open(self.filepath, mode=self.mode, encoding=self.encoding) as f:
-            f.write(log_line)
-            f.flush()  # Ensure writing to disk
+    def _ensure_writer(self) -> None:
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run_writer,
+                    name=f"FileTransport({self.filepath.name})",
+                    daemon=True,
+                )
+                self._thread.start()
+                atexit.register(self._close_writer)
+
+    def _run_writer(self) -> None:
+        """Writer thread: group-commit queued lines to a long-lived handle."""
+        file: IO[str] | None = None
+        size = 0
+        dirty = False
+        last_flush = last_fsync = time.monotonic()
+
+        def flush(force_fsync: bool = False) -> None:
+            nonlocal dirty, last_flush, last_fsync
+            file.flush()
+            now = last_flush = time.monotonic()
+            if self.fsync_interval is not None and (
+                force_fsync or now - last_fsync >= self.fsync_interval
+            ):
+                os.fsync(file.fileno())
+                last_fsync = now
+            dirty = False
+
+        while True:
+            timeout = None
+            if dirty:
+                timeout = max(0.0, last_flush + self.flush_interval - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                # Idle for a flush interval with unflushed lines
+                try:
+                    flush()
+                except OSError as e:
+                    print(f"Error writing to log file {self.filepath}: {e}")
+                    dirty = False
+                continue
+
+            # Take everything else already queued, up to the first control
+            # item: a flush barrier (an Event to set) or None to stop
+            lines: List[str] = []
+            control_item = False
+            while True:
+                if isinstance(item, str):
+                    lines.append(item)
+                else:
+                    control_item = True
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            try:
+                if lines:
+                    if file is None:
+                        file = open(
+                            self.filepath, mode=self._file_mode, encoding=self.encoding
+                        )
+                        # Rotated and reopened files are appended to
+                        self._file_mode = "a"
+                        size = file.tell()
+                    data = "".join(lines)
+                    file.write(data)
+                    # Rotation compares bytes (size starts from file.tell())
+                    size += len(data.encode(self.encoding))
+                    self.written += len(lines)
+                    dirty = True
+                    if self.max_bytes and size >= self.max_bytes:
+                        flush(force_fsync=True)
+                        file.close()
+                        file = None
+                        self._rotate()
+                    elif time.monotonic() - last_flush >= self.flush_interval:
+                        flush()
+                if control_item and dirty:
+                    flush(force_fsync=True)
+            except OSError as e:
+                # Drop this batch and reopen on the next one
+                print(f"Error writing to log file {self.filepath}: {e}")
+                if file is not None:
+                    try:
+                        file.close()
+                    except OSError:
+                        pass
+                file = None
+                dirty = False
+
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is None:
+                if file is not None:
+                    file.close()
+                return
+
+    def _rotate(self) -> None:
+        """Shift filepath -> filepath.1 -> ... -> filepath.N, dropping the oldest"""
+        if self.backup_count <= 0:
+            self.filepath.unlink(missing_ok=True)
+        else:
+            for i in range(self.backup_count - 1, 0, -1):
+                source = self.filepath.with_name(f"{self.filepath.name}.{i}")
+                if source.exists():
+                    source.replace(self.filepath.with_name(f"{self.filepath.name}.{i + 1}"))
+            self.filepath.replace(self.filepath.with_name(f"{self.filepath.name}.1"))
+        self.rotations += 1
+
+    def flush_sync(self, timeout: float | None = None) -> bool:
+        """
+        Block until every line queued so far is written and flushed. Returns
+        False on timeout.
+        """
+        if self._thread is None:
+            return True
+        barrier = threading.Event()
+        self._queue.put(barrier)
+        return barrier.wait(timeout)
+
+    async def flush(self) -> None:
+        """Wait until every line queued so far is written and flushed."""
+        if self._thread is not None:
+            await asyncio.to_thread(self.flush_sync)
+
+    def _close_writer(self) -> None:
+        with self._thread_lock:
+            if self._thread is None:
+                return
+            atexit.unregister(self._close_writer)
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if self.dropped:
+            print(f"FileTransport dropped {self.dropped} events for {self.filepath}")
 
     async def close(self) -> None:
-        """Clean up resources if needed."""
-        pass  # File handles are automatically closed after each write
+        """Write out queued lines and stop the writer thread."""
+        await asyncio.to_thread(self._close_writer)
 
     @property
     def is_closed(self) -> bool:
-        """Check if transport is closed."""
-        return False  # Since we open/close per write
+        """Check if transport is closed (a new event restarts the writer)."""
+        return self._thread is None
 
 
 class HTTPTransport(FilteredEventTransport):
     """
     Sends events to an HTTP endpoint in batches.
     Useful for sending to remote logging services like Elasticsearch, etc.
+
+    Events are encoded as NDJSON lines when they're sent and posted by a
+    background flusher task, so logging never waits on the network. A batch
+    goes out once it holds `batch_size` events or `max_batch_bytes` bytes, or
+    `max_latency` seconds after its first event. Bodies are gzip-compressed
+    unless `compress` is False.
+
+    Batches that fail with a connection error, a timeout, 408, 429 or a 5xx
+    are written to `spool_dir` (at most `max_spool_bytes`, evicting the oldest
+    batches) and retried oldest first with exponential backoff; later batches
+    queue behind them in the spool so events arrive in order. Spooled batches
+    left over from a previous run are sent too. Without a spool directory,
+    failed batches are dropped. `sent`, `spooled` and `dropped` count events.
     """
 
     def __init__(
@@ -207,18 +422,77 @@ class HTTPTransport(FilteredEventTransport):
         batch_size: int = 100,
         timeout: float = 5.0,
         event_filter: EventFilter | None = None,
+        max_latency: float = 2.0,
+        max_batch_bytes: int = 1024 * 1024,
+        max_queue_size: int = 2048,
+        compress: bool = True,
+        spool_dir: str | Path | None = None,
+        max_spool_bytes: int = 64 * 1024 * 1024,
+        retry_backoff: float = 1.0,
+        max_retry_backoff: float = 60.0,
     ):
+        """Initialize HTTPTransport.
+
+        Args:
+            endpoint: URL to POST batches of events to
+            headers: Extra HTTP headers for every request
+            batch_size: Send a batch once it holds this many events
+            timeout: Total timeout in seconds for each request
+            event_filter: Optional filter for events
+            max_latency: Maximum seconds an event waits before its batch is sent
+            max_batch_bytes: Send a batch once its uncompressed body reaches this size
+            max_queue_size: Maximum number of events waiting to be sent (more are dropped)
+            compress: Gzip request bodies (Content-Encoding: gzip)
+            spool_dir: Directory for batches waiting to be retried (None drops failed batches)
+            max_spool_bytes: Maximum total size of the spooled batches
+            retry_backoff: Seconds before the first retry, doubling per failed retry
+            max_retry_backoff: Upper bound for the retry delay
+        """
         super().__init__(event_filter=event_filter)
         self.endpoint = endpoint
         self.headers = headers or {}
         self.batch_size = batch_size
         self.timeout = timeout
-
-        self.batch: List[Event] = []
-        self.lock = asyncio.Lock()
+        self.max_latency = max_latency
+        self.max_batch_bytes = max_batch_bytes
+        self.max_queue_size = max_queue_size
+        self.compress = compress
+        self.spool_dir = Path(spool_dir) if spool_dir is not None else None
+        self.max_spool_bytes = max_spool_bytes
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+
+        # Encoded lines waiting for the flusher, and when the oldest arrived
+        self._pending: Deque[bytes] = deque()
+        self._pending_bytes = 0
+        self._pending_since = 0.0
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._closing = False
         self._session: aiohttp.ClientSession | None = None
         self._serializer = JSONSerializer()
 
+        # Spooled batches, oldest first: (path, number of events, size)
+        self._spool: Deque[Tuple[Path, int, int]] = deque()
+        self._spool_bytes = 0
+        self._failures = 0
+        self._next_retry = 0.0
+
+        self.sent = 0
+        self.spooled = 0
+        self.dropped = 0
+
+        if self.spool_dir is not None:
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            for path in sorted(self.spool_dir.glob("*.ndjson*")):
+                try:
+                    events = int(path.name.split(".", 1)[0].rsplit("-", 1)[1])
+                    size = path.stat().st_size
+                except (IndexError, ValueError, OSError):
+                    continue
+                self._spool.append((path, events, size))
+                self._spool_bytes += size
+
     async def start(self):
         """Initialize HTTP session."""
         if not self._session:
@@ -227,31 +501,39 @@ class HTTPTransport(FilteredEventTransport):
             )
 
     async def stop(self):
-        """Close HTTP session and flush any remaining events."""
-        if self.batch:
-            await self._flush()
+        """
+        Send pending events, retry spooled batches (unless retries are backing
+        off) and close the HTTP session. Spooled batches that aren't sent stay
+        on disk for the next run.
+        """
+        self._closing = True
+        task, self._task = self._task, None
+        if task is not None:
+            self._wake.set()
+            await task
+
+        while self._pending:
+            await self._send_batch()
+        if self._spool and not self._failures:
+            await self._retry_spool()
+
         if self._session:
             await self._session.close()
             self._session = None
+        self._closing = False
+
+    async def close(self):
+        """Same as stop(), for LoggingConfig.shutdown() and MultiTransport."""
+        await self.stop()
 
     async def send_matched_event(self, event: Event):
-        """Add event to batch, flush if batch is full."""
-        async with self.lock:
-            self.batch.append(event)
-            if len(self.batch) >= self.batch_size:
-                await self._flush()
-
-    async def _flush(self):
-        """Send batch of events to HTTP endpoint."""
-        if not self.batch:
+        """Encode event and queue it for the flusher."""
+        if len(self._pending) >= self.max_queue_size:
+            self.dropped += 1
             return
 
-        if not self._session:
-            await self.start()
-
-        try:
-            # Convert events to JSON-serializable dicts
-            events_data = [
+        line = (
+            encode_json(
                 {
                     "timestamp": event.timestamp.isoformat(),
                     "type": event.type,
@@ -263,41 +545,214 @@ class HTTPTransport(FilteredEventTransport):
                     "span_id": event.span_id,
                     "context": event.context.dict() if event.context else None,
                 }
-                for event in self.batch
-            ]
-
-            async with self._session.post(self.endpoint, json=events_data) as response:
-                if response.status >= 400:
-                    text = await response.text()
-                    print(
-                        f"Error sending log events to {self.endpoint}. "
-                        f"Status: {response.status}, Response: {text}"
-                    )
-        except Exception as e:
-            print(f"Error sending log events to {self.endpoint}: {e}")
-        finally:
-            self.batch.clear()
+            )
+            + b"\n"
+        )
+
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        self._pending.append(line)
+        self._pending_bytes += len(line)
+
+        self._ensure_flusher()
+        if self._batch_ready() or len(self._pending) == 1:
+            # Full batch to send, or a new deadline to wait for
+            self._wake.set()
+
+    def _ensure_flusher(self) -> None:
+        if self._task is None and not self._closing:
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run_flusher())
+
+    def _batch_ready(self) -> bool:
+        return (
+            len(self._pending) >= self.batch_size
+            or self._pending_bytes >= self.max_batch_bytes
+        )
+
+    async def _run_flusher(self) -> None:
+        """Flusher task: send batches when they fill up or fall due, retry the spool."""
+        while not self._closing:
+            now = time.monotonic()
+            deadlines = []
+            if self._pending:
+                deadlines.append(self._pending_since + self.max_latency)
+            if self._spool:
+                deadlines.append(self._next_retry)
+            timeout = max(0.0, min(deadlines) - now) if deadlines else None
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            try:
+                while not self._closing and self._pending and (
+                    self._batch_ready()
+                    or time.monotonic() >= self._pending_since + self.max_latency
+                ):
+                    await self._send_batch()
+                if (
+                    not self._closing
+                    and self._spool
+                    and time.monotonic() >= self._next_retry
+                ):
+                    await self._retry_spool()
+            except Exception as e:
+                print(f"Error sending log events to {self.endpoint}: {e}")
+
+    def _take_batch(self) -> Tuple[bytes, int]:
+        """Remove up to batch_size events / max_batch_bytes from the pending lines"""
+        lines = []
+        size = 0
+        while self._pending and len(lines) < self.batch_size:
+            if lines and size + len(self._pending[0]) > self.max_batch_bytes:
+                break
+            line = self._pending.popleft()
+            lines.append(line)
+            size += len(line)
+        # Events left behind keep the earlier deadline, so none waits longer
+        # than max_latency
+        self._pending_bytes -= size
+        body = b"".join(lines)
+        if self.compress:
+            body = gzip.compress(body, compresslevel=6)
+        return body, len(lines)
+
+    async def _send_batch(self) -> None:
+        body, events = self._take_batch()
+        if self._spool:
+            # Keep order behind batches waiting for a retry
+            await self._spool_batch(body, events)
+            return
+
+        result = await self._post(body)
+        if result == "sent":
+            self.sent += events
+            self._failures = 0
+        elif result == "retry":
+            await self._spool_batch(body, events)
+            self._schedule_retry()
+        else:
+            self.dropped += events
+
+    async def _retry_spool(self) -> None:
+        """Send spooled batches oldest first until one fails"""
+        while self._spool:
+            path, events, size = self._spool[0]
+            try:
+                body = await asyncio.to_thread(path.read_bytes)
+            except OSError as e:
+                print(f"Error reading spooled log events {path}: {e}")
+                result = "reject"
+            else:
+                result = await self._post(body)
+
+            if result == "retry":
+                self._schedule_retry()
+                return
+
+            self._spool.popleft()
+            self._spool_bytes -= size
+            path.unlink(missing_ok=True)
+            if result == "sent":
+                self.sent += events
+                self._failures = 0
+            else:
+                self.dropped += events
+
+    def _schedule_retry(self) -> None:
+        # The exponent is capped: a float times 2**1024 overflows
+        delay = min(
+            self.max_retry_backoff, self.retry_backoff * 2 ** min(self._failures, 32)
+        )
+        self._failures += 1
+        self._next_retry = time.monotonic() + delay
+
+    async def _spool_batch(self, body: bytes, events: int) -> None:
+        """Write a failed batch to the spool, evicting the oldest batches to make room"""
+        if self.spool_dir is None or len(body) > self.max_spool_bytes:
+            self.dropped += events
+            return
+
+        while self._spool and self._spool_bytes + len(body) > self.max_spool_bytes:
+            old_path, old_events, old_size = self._spool.popleft()
+            self._spool_bytes -= old_size
+            self.dropped += old_events
+            old_path.unlink(missing_ok=True)
+
+        suffix = ".ndjson.gz" if self.compress else ".ndjson"
+        path = self.spool_dir / f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}-{events}{suffix}"
+        try:
+            await asyncio.to_thread(path.write_bytes, body)
+        except OSError as e:
+            print(f"Error spooling log events to {path}: {e}")
+            self.dropped += events
+            return
+        self._spool.append((path, events, len(body)))
+        self._spool_bytes += len(body)
+        self.spooled += events
+
+    async def _post(self, body: bytes) -> Literal["sent", "retry", "reject"]:
+        """POST an NDJSON body; 'retry' for failures worth retrying"""
+        if not self._session:
+            await self.start()
+
+        headers = {"Content-Type": "application/x-ndjson"}
+        if body[:2] == b"\x1f\x8b":
+            headers["Content-Encoding"] = "gzip"
+        try:
+            async with self._session.post(
+                self.endpoint, data=body, headers=headers
+            ) as response:
+                if response.status < 400:
+                    return "sent"
+                text = await response.text()
+                print(
+                    f"Error sending log events to {self.endpoint}. "
+                    f"Status: {response.status}, Response: {text}"
+                )
+                if response.status in (408, 429) or response.status >= 500:
+                    return "retry"
+                return "reject"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error sending log events to {self.endpoint}: {e!r}")
+            return "retry"
+
+
+_STOP = object()
+"""Queued by AsyncEventBus.stop() to end event processing"""
 
 
 class AsyncEventBus:
     """
     Async event bus with local in-process listeners + optional remote transport.
     Also injects distributed tracing (trace_id, span_id) if there's a current span.
+
+    A single consumer task drains the queue in batches of up to
+    `max_batch_size` events and hands each batch to every listener:
+    synchronous listeners are called inline, the others through
+    handle_events().
     """
 
     _instance = None
 
+    max_batch_size: int = 256
+
     def __init__(self, transport: EventTransport | None = None):
         self.transport: EventTransport = transport or NoOpTransport()
         self.listeners: Dict[str, EventListener] = {}
         self._task: asyncio.Task | None = None
         self._running = False
+        # Bumped whenever listeners or the transport change, so loggers can
+        # recompute which levels anything consumes
+        self.version = 0
 
     def init_queue(self):
         if self._running:
             return
         self._queue = asyncio.Queue()
-        self._stop_event = asyncio.Event()
         # Store the loop we're created on
         try:
             self._loop = asyncio.get_running_loop()
@@ -313,6 +768,7 @@ class AsyncEventBus:
         elif transport is not None:
             # Update transport if provided
             cls._instance.transport = transport
+            cls._instance.version += 1
         return cls._instance
 
     @classmethod
@@ -324,17 +780,17 @@ class AsyncEventBus:
         """
         if cls._instance:
             # Signal shutdown
-            cls._instance._running = False
-            if hasattr(cls._instance, "_stop_event"):
+            if cls._instance._running and hasattr(cls._instance, "_queue"):
                 try:
-                    # _stop_event.set() schedules on the event's loop; this can fail if
-                    # the loop is already closed in test teardown. Swallow to ensure
-                    # reset never raises in those cases.
-                    cls._instance._stop_event.set()
+                    # Waking the consumer schedules on the queue's loop; this can
+                    # fail if the loop is already closed in test teardown. Swallow
+                    # to ensure reset never raises in those cases.
+                    cls._instance._queue.put_nowait(_STOP)
                 except RuntimeError:
                     pass
                 except Exception:
                     pass
+            cls._instance._running = False
 
             # Clear the singleton instance
             cls._instance = None
@@ -353,8 +809,6 @@ class AsyncEventBus:
 
         # If not already running, start the event processing task
         if not self._running:
-            # Clear stop event and start processing
-            self._stop_event.clear()
             self._running = True
             self._task = asyncio.create_task(self._process_events())
 
@@ -363,39 +817,26 @@ class AsyncEventBus:
         if not self._running:
             return
 
-        # Signal processing to stop
+        # Signal processing to stop once the events queued so far are handled
         self._running = False
-        if hasattr(self, "_stop_event"):
-            self._stop_event.set()
+        if hasattr(self, "_queue"):
+            self._queue.put_nowait(_STOP)
 
-        # Try to process remaining items with a timeout if queue exists
-        if hasattr(self, "_queue") and not self._queue.empty():
+        if self._task and not self._task.done():
             try:
                 # Give some time for remaining items to be processed
-                await asyncio.wait_for(self._queue.join(), timeout=5.0)
+                await asyncio.wait_for(asyncio.shield(self._task), timeout=5.0)
             except asyncio.TimeoutError:
-                # If we timeout, drain the queue to prevent deadlock
-                while not self._queue.empty():
-                    try:
-                        self._queue.get_nowait()
-                        self._queue.task_done()
-                    except asyncio.QueueEmpty:
-                        break
-            except Exception as e:
-                print(f"Error during queue cleanup: {e}")
-
-        # Cancel and wait for task with timeout
-        if self._task and not self._task.done():
-            self._task.cancel()
-            try:
-                # Wait for task to complete with timeout
-                await asyncio.wait_for(self._task, timeout=5.0)
-            except (asyncio.CancelledError, asyncio.TimeoutError):
-                pass  # Task was cancelled or timed out
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+            except asyncio.CancelledError:
+                pass
             except Exception as e:
-                print(f"Error cancelling process task: {e}")
-            finally:
-                self._task = None
+                print(f"Error stopping process task: {e}")
+        self._task = None
 
         # Stop each lifecycle-aware listener
         for listener in self.listeners.values():
@@ -430,8 +871,8 @@ class AsyncEventBus:
                 self._running = True
                 self._task = asyncio.create_task(self._process_events())
 
-        # Then queue for listeners
-        await self._queue.put(event)
+        # Then queue for listeners (the queue is unbounded)
+        self._queue.put_nowait(event)
 
     def emit_with_stderr_transport(self, event: Event):
         print(
@@ -459,92 +900,82 @@ class AsyncEventBus:
     def add_listener(self, name: str, listener: EventListener):
         """Add a listener to the event bus."""
         self.listeners[name] = listener
+        self.version += 1
 
     def remove_listener(self, name: str):
         """Remove a listener from the event bus."""
         self.listeners.pop(name, None)
+        self.version += 1
 
     async def _process_events(self):
-        """Process events from the queue until stopped."""
-        while self._running:
-            event = None
+        """Process events from the queue in batches until the stop sentinel."""
+        queue = self._queue
+        stopping = False
+        while True:
             try:
-                # Use wait with both queue.get() and stop_event.wait() to avoid timeout delays
-                try:
-                    # Check if we should be stopping first
-                    if not self._running or self._stop_event.is_set():
-                        break
-
-                    # Wait for either an event or stop signal without timeout
-                    queue_task = asyncio.create_task(self._queue.get())
-                    stop_task = asyncio.create_task(self._stop_event.wait())
-
-                    done, pending = await asyncio.wait(
-                        [queue_task, stop_task], return_when=asyncio.FIRST_COMPLETED
-                    )
-
-                    # Cancel pending tasks
-                    for task in pending:
-                        task.cancel()
-                        try:
-                            await task
-                        except asyncio.CancelledError:
-                            pass
-
-                    # Check which task completed
-                    if stop_task in done:
+                if stopping:
+                    # Handle whatever was emitted before the sentinel was seen
+                    if queue.empty():
                         break
+                    item = queue.get_nowait()
+                else:
+                    item = await queue.get()
+            except asyncio.CancelledError:
+                break
 
-                    if queue_task in done:
-                        event = queue_task.result()
-                    else:
-                        continue
-                except asyncio.CancelledError:
+            batch = [item]
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
                     break
 
-                # Process the event through all listeners
-                tasks = []
-                for listener in self.listeners.values():
-                    try:
-                        tasks.append(listener.handle_event(event))
-                    except Exception as e:
-                        print(f"Error creating listener task: {e}")
-
-                if tasks:
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    for r in results:
-                        if isinstance(r, Exception):
-                            print(f"Error in listener: {r}")
-                            print(
-                                f"Stacktrace: {''.join(traceback.format_exception(type(r), r, r.__traceback__))}"
-                            )
-
+            try:
+                events = [item for item in batch if item is not _STOP]
+                if len(events) < len(batch):
+                    stopping = True
+                if events:
+                    await self._dispatch(events)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 print(f"Error in event processing loop: {e}")
-                continue
             finally:
-                # Always mark the task as done if we got an event
-                if event is not None:
-                    self._queue.task_done()
+                for _ in batch:
+                    queue.task_done()
 
-        # Process remaining events in queue if it exists
-        if hasattr(self, "_queue"):
-            while not self._queue.empty():
-                try:
-                    event = self._queue.get_nowait()
-                    tasks = []
-                    for listener in self.listeners.values():
-                        try:
-                            tasks.append(listener.handle_event(event))
-                        except Exception:
-                            pass
-                    if tasks:
-                        await asyncio.gather(*tasks, return_exceptions=True)
-                    self._queue.task_done()
-                except asyncio.QueueEmpty:
-                    break
+    async def _dispatch(self, events: List[Event]):
+        """Hand a batch of events to every listener."""
+        pending = []
+        for listener in list(self.listeners.values()):
+            try:
+                if getattr(listener, "synchronous", False):
+                    listener.handle_events_sync(events)
+                else:
+                    pending.append(self._handle_events(listener, events))
+            except Exception as e:
+                self._report_listener_error(e)
+
+        if len(pending) == 1:
+            try:
+                await pending[0]
+            except Exception as e:
+                self._report_listener_error(e)
+        elif pending:
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for r in results:
+                if isinstance(r, Exception):
+                    self._report_listener_error(r)
+
+    @staticmethod
+    def _handle_events(listener: EventListener, events: List[Event]):
+        handle_events = getattr(listener, "handle_events", None)
+        if handle_events is not None:
+            return handle_events(events)
+        # Duck-typed listener that only implements handle_event
+        return EventListener.handle_events(listener, events)
+
+    _report_listener_error = staticmethod(report_listener_error)
 
 
 class MultiTransport(EventTransport):
@@ -584,6 +1015,16 @@ class MultiTransport(EventTransport):
             for transport, exc in exceptions:
                 print(f"  {transport.__class__.__name__}: {exc}")
 
+    async def close(self) -> None:
+        """Close the transports that support closing."""
+        for transport in self.transports:
+            close = getattr(transport, "close", None)
+            if close is not None:
+                try:
+                    await close()
+                except Exception as e:
+                    print(f"Error closing {transport.__class__.__name__}: {e}")
+
 
 def get_log_filename(settings: LoggerSettings, session_id: str | None = None) -> str:
     """Generate a log filename based on the configuration.
@@ -646,7 +1087,16 @@ def create_transport(
                 )
 
             transports.append(
-                FileTransport(filepath=filepath, event_filter=event_filter)
+                FileTransport(
+                    filepath=filepath,
+                    event_filter=event_filter,
+                    max_queue_size=settings.max_queue_size,
+                    flush_interval=settings.file_flush_interval,
+                    fsync_interval=settings.file_fsync_interval,
+                    max_bytes=settings.file_max_bytes,
+                    backup_count=settings.file_backup_count,
+                    overflow=settings.file_overflow,
+                )
             )
         elif transport_type == "http":
             if not settings.http_endpoint:
@@ -659,6 +1109,14 @@ def create_transport(
                     batch_size=settings.batch_size,
                     timeout=settings.http_timeout,
                     event_filter=event_filter,
+                    max_latency=settings.flush_interval,
+                    max_batch_bytes=settings.http_max_batch_bytes,
+                    max_queue_size=settings.max_queue_size,
+                    compress=settings.http_compress,
+                    spool_dir=settings.http_spool_dir,
+                    max_spool_bytes=settings.http_max_spool_bytes,
+                    retry_backoff=settings.http_retry_backoff,
+                    max_retry_backoff=settings.http_max_retry_backoff,
                 )
             )
         else:
@@ -279,7 +279,7 @@ class MCPAgentClientSession(ClientSession, ContextDependent):
     ) -> None:
         logger.debug(
             f"send_response: request_id={request_id}, response=",
-            data=response.model_dump(),
+            data=response.model_dump,
         )
         return await super()._send_response(request_id, response)
 
@@ -1,8 +1,16 @@
 import asyncio
-from typing import List, Literal, Dict, Optional, TypeVar, TYPE_CHECKING
+from typing import (
+    List,
+    Literal,
+    Dict,
+    Optional,
+    Tuple,
+    TypeVar,
+    TYPE_CHECKING,
+)
 
 from opentelemetry import trace
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from mcp.client.session import ClientSession
 from mcp.server.lowlevel.server import Server
 from mcp.server.stdio import stdio_server
@@ -58,6 +66,19 @@ class NamespacedTool(BaseModel):
     server_name: str
     namespaced_tool_name: str
 
+    _listed_tool: Tool | None = PrivateAttr(default=None)
+
+    def listed_tool(self) -> Tool:
+        """
+        The tool renamed to its namespaced name, as returned by list_tools.
+        Built once and shared by all callers, so treat it as read-only.
+        """
+        if self._listed_tool is None:
+            self._listed_tool = self.tool.model_copy(
+                update={"name": self.namespaced_tool_name}
+            )
+        return self._listed_tool
+
 
 class NamespacedPrompt(BaseModel):
     """
@@ -79,6 +100,21 @@ class NamespacedResource(BaseModel):
     namespaced_resource_name: str
 
 
+class ToolListSnapshot:
+    """
+    An immutable list of namespaced tools, shared by every list_tools() call
+    until the aggregator's tools change. `version` increases on each change.
+    """
+
+    def __init__(self, version: int, tools: List[Tool]):
+        self.version = version
+        self.tools: Tuple[Tool, ...] = tuple(tools)
+
+    def result(self) -> ListToolsResult:
+        """A new ListToolsResult over the shared tools; callers may filter or extend its list"""
+        return ListToolsResult(tools=list(self.tools))
+
+
 class MCPAggregator(ContextDependent):
     """
     Aggregates multiple MCP servers. When a developer calls, e.g. call_tool(...),
@@ -147,6 +183,19 @@ class MCPAggregator(ContextDependent):
         self._server_to_resource_map: Dict[str, List[NamespacedResource]] = {}
         self._resource_map_lock = asyncio.Lock()
 
+        # Reverse indexes for name resolution, local name (or resource URI) ->
+        # first server in server_names order that provides it. Rebuilt as new
+        # dicts and swapped in after loading, so lookups never take a lock.
+        self._server_name_set: frozenset[str] = frozenset(server_names)
+        self._tool_index: Dict[str, str] = {}
+        self._prompt_index: Dict[str, str] = {}
+        self._resource_index: Dict[str, str] = {}
+        self._bulk_loading = False
+
+        # list_tools snapshots, keyed by server name (None for all servers)
+        self._tools_version = 0
+        self._tool_snapshots: Dict[str | None, ToolListSnapshot] = {}
+
     async def initialize(self, force: bool = False):
         """Initialize the application."""
         tracer = get_tracer(self.context)
@@ -335,7 +384,7 @@ class MCPAggregator(ContextDependent):
 
             # Process tools
             async with self._tool_map_lock:
-                self._server_to_tool_map[server_name] = []
+                server_tools: List[NamespacedTool] = []
 
                 # Get server configuration to check for tool filtering
                 allowed_tools = None
@@ -368,14 +417,30 @@ class MCPAggregator(ContextDependent):
                         continue
 
                     namespaced_tool_name = f"{server_name}{SEP}{tool.name}"
-                    namespaced_tool = NamespacedTool(
-                        tool=tool,
-                        server_name=server_name,
-                        namespaced_tool_name=namespaced_tool_name,
+                    server_tools.append(
+                        NamespacedTool(
+                            tool=tool,
+                            server_name=server_name,
+                            namespaced_tool_name=namespaced_tool_name,
+                        )
                     )
 
-                    self._namespaced_tool_map[namespaced_tool_name] = namespaced_tool
-                    self._server_to_tool_map[server_name].append(namespaced_tool)
+                # Keep the current entries (and list_tools snapshots) when a
+                # refresh returns the same tools
+                previous_tools = self._server_to_tool_map.get(server_name)
+                if previous_tools is None or [t.tool for t in previous_tools] != [
+                    t.tool for t in server_tools
+                ]:
+                    for namespaced_tool in previous_tools or []:
+                        name = namespaced_tool.namespaced_tool_name
+                        if self._namespaced_tool_map.get(name) is namespaced_tool:
+                            del self._namespaced_tool_map[name]
+                    for namespaced_tool in server_tools:
+                        self._namespaced_tool_map[
+                            namespaced_tool.namespaced_tool_name
+                        ] = namespaced_tool
+                    self._server_to_tool_map[server_name] = server_tools
+                    self._invalidate_tool_snapshots()
 
             # Process prompts
             async with self._prompt_map_lock:
@@ -411,6 +476,10 @@ class MCPAggregator(ContextDependent):
                         namespaced_resource
                     )
 
+            # load_servers rebuilds once after all servers are loaded
+            if not self._bulk_loading:
+                self._rebuild_indexes()
+
             event_metadata = {
                 "server_name": server_name,
                 "agent_name": self.agent_name,
@@ -469,6 +538,7 @@ class MCPAggregator(ContextDependent):
             async with self._tool_map_lock:
                 self._namespaced_tool_map.clear()
                 self._server_to_tool_map.clear()
+                self._invalidate_tool_snapshots()
 
             async with self._prompt_map_lock:
                 self._namespaced_prompt_map.clear()
@@ -478,6 +548,8 @@ class MCPAggregator(ContextDependent):
                 self._namespaced_resource_map.clear()
                 self._server_to_resource_map.clear()
 
+            self._rebuild_indexes()
+
             # TODO: saqadri (FA1) - Verify that this can be removed
             # if self.connection_persistence:
             #     # Start all the servers
@@ -487,10 +559,15 @@ class MCPAggregator(ContextDependent):
             #     )
 
             # Load tools, prompts and resources from all servers concurrently
-            results = await asyncio.gather(
-                *(self.load_server(server_name) for server_name in self.server_names),
-                return_exceptions=True,
-            )
+            self._bulk_loading = True
+            try:
+                results = await asyncio.gather(
+                    *(self.load_server(server_name) for server_name in self.server_names),
+                    return_exceptions=True,
+                )
+            finally:
+                self._bulk_loading = False
+                self._rebuild_indexes()
 
             for server_name, result in zip(self.server_names, results):
                 if isinstance(result, BaseException):
@@ -648,26 +725,9 @@ class MCPAggregator(ContextDependent):
 
             if server_name:
                 span.set_attribute("server_name", server_name)
-                result = ListToolsResult(
-                    tools=[
-                        namespaced_tool.tool.model_copy(
-                            update={"name": namespaced_tool.namespaced_tool_name}
-                        )
-                        for namespaced_tool in self._server_to_tool_map.get(
-                            server_name, []
-                        )
-                    ]
-                )
-            else:
-                async with self._tool_map_lock:
-                    result = ListToolsResult(
-                        tools=[
-                            namespaced_tool.tool.model_copy(
-                                update={"name": namespaced_tool_name}
-                            )
-                            for namespaced_tool_name, namespaced_tool in self._namespaced_tool_map.items()
-                        ]
-                    )
+            snapshot = self.tool_snapshot(server_name)
+            span.set_attribute("tools_version", snapshot.version)
+            result = snapshot.result()
 
             if self.context.tracing_enabled:
                 span.set_attribute("tool_count", len(result.tools))
@@ -678,6 +738,29 @@ class MCPAggregator(ContextDependent):
 
             return result
 
+    def tool_snapshot(self, server_name: str | None = None) -> ToolListSnapshot:
+        """
+        The current namespaced tools of one server (or of all servers) as a
+        shared, read-only snapshot. Snapshots are rebuilt only after a
+        load_server/load_servers call changes the tools.
+        """
+        snapshot = self._tool_snapshots.get(server_name)
+        if snapshot is None:
+            if server_name:
+                namespaced_tools = self._server_to_tool_map.get(server_name, [])
+            else:
+                namespaced_tools = self._namespaced_tool_map.values()
+            snapshot = ToolListSnapshot(
+                self._tools_version,
+                [namespaced_tool.listed_tool() for namespaced_tool in namespaced_tools],
+            )
+            self._tool_snapshots[server_name] = snapshot
+        return snapshot
+
+    def _invalidate_tool_snapshots(self):
+        self._tools_version += 1
+        self._tool_snapshots = {}
+
     async def list_resources(self, server_name: str | None = None):
         """
         :return: Resources from all servers aggregated, and renamed to be dot-namespaced by server name.
@@ -1182,46 +1265,56 @@ class MCPAggregator(ContextDependent):
 
         # First check if this is a namespaced name with a valid server prefix
         if SEP in name:
+            server_names = self._server_name_set
             parts = name.split(SEP)
 
             # Try matching from longest possible prefix to shortest
             for i in range(len(parts) - 1, 0, -1):
                 prefix = SEP.join(parts[:i])
-                if prefix in self.server_names:
+                if prefix in server_names:
                     return prefix, SEP.join(parts[i:])
 
-        # If no server name prefix is found, search all servers for a capability with this exact name
+        # If no server name prefix is found, look up the server providing a
+        # capability with this exact name (first in server_names order)
         if capability == "tool":
-            lock = self._tool_map_lock
-            capability_map = self._server_to_tool_map
-
-            def getter(item: NamespacedTool):
-                return item.tool.name
+            index = self._tool_index
         elif capability == "prompt":
-            lock = self._prompt_map_lock
-            capability_map = self._server_to_prompt_map
-
-            def getter(item: NamespacedPrompt):
-                return item.prompt.name
+            index = self._prompt_index
         elif capability == "resource":
-            lock = self._resource_map_lock
-            capability_map = self._server_to_resource_map
-
-            def getter(item: NamespacedResource):
-                return str(item.resource.uri)
+            index = self._resource_index
         else:
             raise ValueError(f"Unsupported capability: {capability}")
 
-        # Search servers in the order of self.server_names
-        async with lock:
-            for srv_name in self.server_names:
-                items = capability_map.get(srv_name, [])
-                for item in items:
-                    if getter(item) == name:
-                        return srv_name, name
+        server_name = index.get(name)
+        if server_name is None:
+            # No match found
+            return None, None
+        return server_name, name
+
+    def _rebuild_indexes(self):
+        """
+        Rebuild the name resolution indexes from the capability maps and swap
+        them in. Servers earlier in server_names win on duplicate names.
+        """
+        tool_index: Dict[str, str] = {}
+        prompt_index: Dict[str, str] = {}
+        resource_index: Dict[str, str] = {}
+        for server_name in self.server_names:
+            for namespaced_tool in self._server_to_tool_map.get(server_name, []):
+                tool_index.setdefault(namespaced_tool.tool.name, server_name)
+            for namespaced_prompt in self._server_to_prompt_map.get(server_name, []):
+                prompt_index.setdefault(namespaced_prompt.prompt.name, server_name)
+            for namespaced_resource in self._server_to_resource_map.get(
+                server_name, []
+            ):
+                resource_index.setdefault(
+                    str(namespaced_resource.resource.uri), server_name
+                )
 
-        # No match found
-        return None, None
+        self._server_name_set = frozenset(self.server_names)
+        self._tool_index = tool_index
+        self._prompt_index = prompt_index
+        self._resource_index = resource_index
 
     async def _start_server(self, server_name: str):
         if self.connection_persistence:
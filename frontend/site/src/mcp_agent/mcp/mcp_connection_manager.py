@@ -433,7 +433,7 @@ class MCPConnectionManager(ContextDependent):
             raise ValueError(f"Server '{server_name}' not found in registry.")
 
         logger.debug(
-            f"{server_name}: Found server configuration=", data=config.model_dump()
+            f"{server_name}: Found server configuration=", data=config.model_dump
         )
 
         def transport_context_factory():
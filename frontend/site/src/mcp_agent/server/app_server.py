@@ -102,7 +102,7 @@ class ServerContext(ContextDependent):
 
         # Initialize workflow registry if not already present
         if not self.context.workflow_registry:
-            if self.context.config.execution_engine == "asyncio":
+            if self.context.config.execution_engine in ("asyncio", "process"):
                 self.context.workflow_registry = InMemoryWorkflowRegistry()
             elif self.context.config.execution_engine == "temporal":
                 from mcp_agent.executor.temporal.workflow_registry import (
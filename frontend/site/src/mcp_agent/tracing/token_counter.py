@@ -16,6 +16,7 @@ import atexit
 from typing import AsyncContextManager
 
 from mcp_agent.workflows.llm.llm_selector import load_default_models, ModelInfo
+from mcp_agent.workflows.llm.model_catalog import get_default_model_index
 from mcp_agent.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -120,15 +121,25 @@ class TokenNode:
     metadata: Dict[str, Any] = field(default_factory=dict)
     """Additional metadata for this node"""
 
-    _cached_aggregate: Optional[TokenUsage] = field(default=None, init=False)
-    """Cached aggregate usage to avoid deep recursion"""
-
-    _cache_valid: bool = field(default=False, init=False)
-    """Whether the cached aggregate is valid"""
+    # Running totals of this node's usage plus all descendants'. Every usage
+    # change pushes its delta up through the ancestors, so aggregates are
+    # always current without recursive recomputation.
+    _aggregate_input_tokens: int = field(default=0, init=False, repr=False)
+    _aggregate_output_tokens: int = field(default=0, init=False, repr=False)
+    _aggregate_total_tokens: int = field(default=0, init=False, repr=False)
 
     # Internal reference back to the TokenCounter for convenience methods
     _counter: Optional["TokenCounter"] = field(default=None, init=False, repr=False)
 
+    def __post_init__(self):
+        self._aggregate_input_tokens = self.usage.input_tokens
+        self._aggregate_output_tokens = self.usage.output_tokens
+        self._aggregate_total_tokens = self.usage.total_tokens
+        for child in self.children:
+            self._aggregate_input_tokens += child._aggregate_input_tokens
+            self._aggregate_output_tokens += child._aggregate_output_tokens
+            self._aggregate_total_tokens += child._aggregate_total_tokens
+
     def add_child(self, child: "TokenNode") -> None:
         """Add a child node"""
         child.parent = self
@@ -136,8 +147,28 @@ class TokenNode:
         if self._counter and not child._counter:
             child._counter = self._counter
         self.children.append(child)
-        # Invalidate cache when structure changes
-        self.invalidate_cache()
+        # The child's existing usage now counts towards this subtree
+        self._push_up(
+            child._aggregate_input_tokens,
+            child._aggregate_output_tokens,
+            child._aggregate_total_tokens,
+        )
+
+    def add_usage(self, input_tokens: int, output_tokens: int) -> None:
+        """Add to this node's direct usage and to the aggregates of it and its ancestors, O(depth)"""
+        total_tokens = input_tokens + output_tokens
+        self.usage.input_tokens += input_tokens
+        self.usage.output_tokens += output_tokens
+        self.usage.total_tokens += total_tokens
+        self._push_up(input_tokens, output_tokens, total_tokens)
+
+    def _push_up(self, input_tokens: int, output_tokens: int, total_tokens: int) -> None:
+        node = self
+        while node is not None:
+            node._aggregate_input_tokens += input_tokens
+            node._aggregate_output_tokens += output_tokens
+            node._aggregate_total_tokens += total_tokens
+            node = node.parent
 
     async def watch(
         self,
@@ -171,43 +202,31 @@ class TokenNode:
         return await self._counter.unwatch(watch_id)
 
     def invalidate_cache(self) -> None:
-        """Invalidate cache for this node and all ancestors"""
-        self._cache_valid = False
-        self._cached_aggregate = None
-        if self.parent:
-            self.parent.invalidate_cache()
+        """
+        Resynchronise this node's aggregate after its `usage` was modified
+        directly (rather than through add_usage), and push the difference up
+        to all ancestors.
+        """
+        input_tokens = self.usage.input_tokens
+        output_tokens = self.usage.output_tokens
+        total_tokens = self.usage.total_tokens
+        for child in self.children:
+            input_tokens += child._aggregate_input_tokens
+            output_tokens += child._aggregate_output_tokens
+            total_tokens += child._aggregate_total_tokens
+        self._push_up(
+            input_tokens - self._aggregate_input_tokens,
+            output_tokens - self._aggregate_output_tokens,
+            total_tokens - self._aggregate_total_tokens,
+        )
 
     def aggregate_usage(self) -> TokenUsage:
-        """Recursively aggregate usage from this node and all children (with caching)"""
-        try:
-            # Return cached value if valid
-            if self._cache_valid and self._cached_aggregate is not None:
-                return self._cached_aggregate
-
-            # Compute aggregated usage
-            total = TokenUsage(
-                input_tokens=self.usage.input_tokens,
-                output_tokens=self.usage.output_tokens,
-                total_tokens=self.usage.total_tokens,
-            )
-
-            for child in self.children:
-                try:
-                    child_usage = child.aggregate_usage()
-                    total.input_tokens += child_usage.input_tokens
-                    total.output_tokens += child_usage.output_tokens
-                    total.total_tokens += child_usage.total_tokens
-                except Exception as e:
-                    logger.error(f"Error aggregating usage for child {child.name}: {e}")
-
-            # Cache the result
-            self._cached_aggregate = total
-            self._cache_valid = True
-
-            return total
-        except Exception as e:
-            logger.error(f"Error in aggregate_usage: {e}")
-            return TokenUsage()
+        """Usage of this node and all its descendants, O(1)"""
+        return TokenUsage(
+            input_tokens=self._aggregate_input_tokens,
+            output_tokens=self._aggregate_output_tokens,
+            total_tokens=self._aggregate_total_tokens,
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -487,6 +506,8 @@ class TokenCounter:
             for model in self._models
         }
         self._models_by_provider = self._build_provider_lookup()
+        # Shared name index answering fuzzy lookups without scoring every model
+        self._model_index = get_default_model_index()
 
         # Cache for model lookups to avoid repeated fuzzy matching
         # Key: (model_name, provider), Value: ModelInfo or None
@@ -665,11 +686,15 @@ class TokenCounter:
         provider_models: Dict[str, ModelInfo] = (
             self._models_by_provider.get(provider, None) if provider else None
         )
+        provider_catalog = (
+            self._model_index.by_provider.get(provider) if provider else None
+        )
         if provider and not provider_models:
             # If no provider models, try case-insensitive match
             for key, models in self._models_by_provider.items():
                 if key.lower() == provider.lower():
                     provider_models = models
+                    provider_catalog = self._model_index.by_provider[key]
                     break
 
         if provider_models:
@@ -680,65 +705,14 @@ class TokenCounter:
                     self._model_cache[cache_key] = result
                     return result
 
-            # Try fuzzy match within provider - prefer longer matches
-            best_match = None
-            best_match_score = 0
-
-            for known_name, known_model in provider_models.items():
-                score = 0
-
-                # Calculate match score
-                if model_name.lower() == known_name:
-                    score = 1000  # Exact match
-                elif known_name.startswith(model_name.lower()):
-                    # Prefer matches where search term is a prefix (e.g., gpt-4o-mini matches gpt-4o-mini-2024-07-18)
-                    score = 500 + (len(model_name) / len(known_name) * 100)
-                elif model_name.lower() in known_name:
-                    score = len(model_name) / len(known_name) * 100
-                elif known_name in model_name.lower():
-                    score = (
-                        len(known_name) / len(model_name) * 50
-                    )  # Lower score for partial matches
-
-                if score > best_match_score:
-                    best_match = known_model
-                    best_match_score = score
-
+            # Fuzzy match within provider - prefer prefix, then longer matches
+            best_match = provider_catalog.best_match(model_name)
             if best_match:
                 self._model_cache[cache_key] = best_match
                 return best_match
 
-        # Try fuzzy match across all models - prefer longer matches
-        best_match = None
-        best_match_score = 0
-
-        for (prov_key, name_key), known_model in self._model_lookup.items():
-            score = 0
-
-            # Calculate match score
-            if model_name.lower() == name_key:
-                score = 1000  # Exact match
-            elif name_key.startswith(model_name.lower()):
-                # Prefer matches where search term is a prefix (e.g., gpt-4o-mini matches gpt-4o-mini-2024-07-18)
-                score = 500 + (len(model_name) / len(name_key) * 100)
-            elif model_name.lower() in name_key:
-                score = len(model_name) / len(name_key) * 100
-            elif name_key in model_name.lower():
-                score = (
-                    len(name_key) / len(model_name) * 50
-                )  # Lower score for partial matches
-
-            # Boost score if provider matches
-            if (
-                score > 0
-                and provider
-                and provider.lower() in known_model.provider.lower()
-            ):
-                score += 50
-
-            if score > best_match_score:
-                best_match = known_model
-                best_match_score = score
+        # Fuzzy match across all models, boosting the provider's own models
+        best_match = self._model_index.all.best_match(model_name, provider)
 
         if best_match:
             # Cache the result
@@ -852,70 +826,56 @@ class TokenCounter:
                     logger.error(f"Failed to bind to root context: {e}")
                     return
 
-            async with self._lock:
-                # If we have model_name but no model_info, try to look it up
-                if model_name and not model_info:
-                    try:
-                        model_info = self.find_model_info(model_name, provider)
-                    except Exception as e:
-                        logger.debug(f"Failed to find model info for {model_name}: {e}")
-
-                # Update current node's usage
-                current_node = self._get_current_node()
-                if current_node and hasattr(current_node, "usage"):
-                    current_node.usage.input_tokens += input_tokens
-                    current_node.usage.output_tokens += output_tokens
-                    current_node.usage.total_tokens += input_tokens + output_tokens
-
-                    # Store model information
-                    if model_name and not current_node.usage.model_name:
-                        current_node.usage.model_name = model_name
-                    if model_info and not current_node.usage.model_info:
-                        current_node.usage.model_info = model_info
-
-                    # logger.debug(
-                    #     f"Recording {input_tokens + output_tokens} tokens for node {self._current.name} "
-                    #     f"({self._current.node_type}), total before: {self._current.usage.total_tokens - input_tokens - output_tokens}"
-                    # )
-
-                    # Only invalidate the current node's cache (not ancestors)
-                    # This prevents cascade invalidation up the tree
-                    current_node._cache_valid = False
-                    current_node._cached_aggregate = None
-                    # logger.debug(
-                    #     f"Invalidated cache for {self._current.name} (targeted)"
-                    # )
-
-                    # Trigger watches which will handle ancestor updates
+            # No lock is needed from here on: nothing below awaits, so each
+            # record is atomic with respect to other tasks on the loop.
+
+            # If we have model_name but no model_info, try to look it up
+            if model_name and not model_info:
+                try:
+                    model_info = self.find_model_info(model_name, provider)
+                except Exception as e:
+                    logger.debug(f"Failed to find model info for {model_name}: {e}")
+
+            # Update current node's usage and its ancestors' aggregates
+            current_node = self._get_current_node()
+            if current_node and hasattr(current_node, "usage"):
+                current_node.add_usage(input_tokens, output_tokens)
+
+                # Store model information
+                if model_name and not current_node.usage.model_name:
+                    current_node.usage.model_name = model_name
+                if model_info and not current_node.usage.model_info:
+                    current_node.usage.model_info = model_info
+
+                if self._watches:
                     self._trigger_watches(current_node)
-                    # logger.debug(f"Triggered watches for {self._current.name}")
 
-                # Track global usage by model and provider
-                if model_name:
-                    try:
-                        # Use provider from model_info if available, otherwise use the passed provider
-                        provider_key = (
-                            model_info.provider
-                            if model_info and hasattr(model_info, "provider")
-                            else provider
-                        )
-                        usage_key = (model_name, provider_key)
-
-                        model_usage = self._usage_by_model[usage_key]
-                        model_usage.input_tokens += input_tokens
-                        model_usage.output_tokens += output_tokens
-                        model_usage.total_tokens += input_tokens + output_tokens
-                        model_usage.model_name = model_name
-                        if model_info and not model_usage.model_info:
-                            model_usage.model_info = model_info
-                    except Exception as e:
-                        logger.error(f"Failed to track global usage: {e}")
+            # Track global usage by model and provider
+            if model_name:
+                try:
+                    # Use provider from model_info if available, otherwise use the passed provider
+                    provider_key = (
+                        model_info.provider
+                        if model_info and hasattr(model_info, "provider")
+                        else provider
+                    )
+                    usage_key = (model_name, provider_key)
+
+                    model_usage = self._usage_by_model[usage_key]
+                    model_usage.input_tokens += input_tokens
+                    model_usage.output_tokens += output_tokens
+                    model_usage.total_tokens += input_tokens + output_tokens
+                    model_usage.model_name = model_name
+                    if model_info and not model_usage.model_info:
+                        model_usage.model_info = model_info
+                except Exception as e:
+                    logger.error(f"Failed to track global usage: {e}")
 
-                # logger.debug(
-                #     f"Recorded {input_tokens + output_tokens} tokens "
-                #     f"(in: {input_tokens}, out: {output_tokens}) "
-                #     f"for {getattr(self._current, 'name', 'unknown')} using {model_name or 'unknown model'}"
-                # )
+            # logger.debug(
+            #     f"Recorded {input_tokens + output_tokens} tokens "
+            #     f"(in: {input_tokens}, out: {output_tokens}) "
+            #     f"for {getattr(self._current, 'name', 'unknown')} using {model_name or 'unknown model'}"
+            # )
         except Exception as e:
             logger.error(f"Error in TokenCounter.record_usage: {e}", exc_info=True)
             # Continue execution - don't break the program
@@ -1776,14 +1736,13 @@ class TokenCounter:
     def _trigger_watches(self, node: TokenNode) -> None:
         """Trigger watches for a node and its ancestors
 
-        Note: This is called from within record_usage which already holds the lock,
-        so we don't acquire it again here.
+        Note: This is called from record_usage without awaiting in between, so
+        the usage read here is consistent without taking the lock.
         """
         try:
             callbacks_to_execute: List[Tuple[WatchConfig, TokenNode, TokenUsage]] = []
             # logger.debug(f"_trigger_watches called for {node.name} ({node.node_type})")
 
-            # No lock needed - caller already holds it
             current = node
             triggered_nodes = set()
             is_original_node = True
@@ -1794,12 +1753,7 @@ class TokenCounter:
                     break
                 triggered_nodes.add(id(current))
 
-                # Invalidate this node's cache to ensure fresh aggregation
-                # This is more targeted than cascade invalidation
-                current._cache_valid = False
-                current._cached_aggregate = None
-
-                # Get aggregated usage with fresh data
+                # Aggregates are kept current by TokenNode.add_usage
                 usage = current.aggregate_usage()
 
                 # Check all watches
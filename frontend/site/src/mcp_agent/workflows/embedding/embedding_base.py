@@ -1,12 +1,29 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Collection, Dict, Hashable, List, Tuple, TYPE_CHECKING
 
-from numpy import float32
+from numpy import (
+    arange,
+    argpartition,
+    asarray,
+    empty,
+    flatnonzero,
+    float32,
+    int32,
+    isin,
+    lexsort,
+    stack,
+    take_along_axis,
+)
+from numpy.linalg import norm
 from numpy.typing import NDArray
 from sklearn.metrics.pairwise import cosine_similarity
 
 from mcp_agent.core.context_dependent import ContextDependent
 
+if TYPE_CHECKING:
+    from mcp_agent.workflows.embedding.embedding_store import EmbeddingStore
+
 
 FloatArray = NDArray[float32]
 
@@ -14,6 +31,9 @@ FloatArray = NDArray[float32]
 class EmbeddingModel(ABC, ContextDependent):
     """Abstract interface for embedding models"""
 
+    max_batch_size: int = 96
+    """Most texts the provider accepts in one embed call"""
+
     @abstractmethod
     async def embed(self, data: List[str]) -> FloatArray:
         """
@@ -32,6 +52,52 @@ class EmbeddingModel(ABC, ContextDependent):
         """Return the dimensionality of the embeddings"""
 
 
+async def embed_batched(
+    embedding_model: EmbeddingModel,
+    texts: List[str],
+    store: "EmbeddingStore | None" = None,
+    max_concurrency: int = 4,
+) -> FloatArray:
+    """
+    Embed many texts with as few provider calls as possible
+
+    Duplicate texts are embedded once, texts already in the store are not
+    embedded at all, and the rest are split into batches of the model's
+    max_batch_size which are embedded concurrently (at most max_concurrency
+    calls in flight). New vectors are written back to the store. Batches only
+    overlap if the model's embed() awaits its I/O rather than blocking.
+
+    Returns an array of shape (len(texts), embedding_dim) in input order.
+    """
+    if not texts:
+        return empty((0, embedding_model.embedding_dim), dtype=float32)
+
+    unique = list(dict.fromkeys(texts))
+    vectors: Dict[str, FloatArray] = {}
+    if store is not None:
+        for text, vector in zip(unique, store.get(unique)):
+            if vector is not None:
+                vectors[text] = vector
+
+    missing = [text for text in unique if text not in vectors]
+    batch_size = max(1, embedding_model.max_batch_size)
+    batches = [missing[i : i + batch_size] for i in range(0, len(missing), batch_size)]
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def embed_batch(batch: List[str]) -> FloatArray:
+        async with semaphore:
+            return await embedding_model.embed(batch)
+
+    for batch, embeddings in zip(
+        batches, await asyncio.gather(*(embed_batch(batch) for batch in batches))
+    ):
+        if store is not None:
+            store.put(batch, embeddings)
+        vectors.update(zip(batch, asarray(embeddings, dtype=float32)))
+
+    return stack([vectors[text] for text in texts])
+
+
 def compute_similarity_scores(
     embedding_a: FloatArray, embedding_b: FloatArray
 ) -> Dict[str, float]:
@@ -59,3 +125,137 @@ def compute_confidence(similarity_scores: Dict[str, float]) -> float:
     # For now, just use cosine similarity as confidence
     # Could implement more sophisticated combination of scores
     return similarity_scores["cosine"]
+
+
+def l2_normalize(embeddings: FloatArray) -> FloatArray:
+    """
+    Scale each row of a 2-D array to unit length (all-zero rows stay zero),
+    returning float32
+    """
+    embeddings = asarray(embeddings, dtype=float32)
+    norms = norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return embeddings / norms
+
+
+class EmbeddingIndex:
+    """
+    A matrix of L2-normalised float32 embeddings, one row per key, for
+    scoring queries against every entry at once.
+
+    Cosine similarity against all entries is a single matrix-vector product
+    (or matrix-matrix product for a batch of queries), and the top k are
+    selected with argpartition rather than a full sort. Rows can be added
+    or replaced incrementally; storage grows geometrically.
+
+    Each row carries an integer group so callers can restrict scoring to a
+    subset (e.g. only server categories) without rebuilding the matrix.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self._capacity = max(1, capacity)
+        self._matrix: FloatArray | None = None
+        self._groups = empty(self._capacity, dtype=int32)
+        self._keys: List[Hashable] = []
+        self._positions: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._positions
+
+    @property
+    def keys(self) -> List[Hashable]:
+        return list(self._keys)
+
+    @property
+    def embedding_dim(self) -> int | None:
+        return None if self._matrix is None else self._matrix.shape[1]
+
+    def add(self, key: Hashable, embedding: FloatArray, group: int = 0) -> None:
+        """Add an embedding under key, replacing any existing one"""
+        row = l2_normalize(asarray(embedding).reshape(1, -1))[0]
+        if self._matrix is None:
+            self._matrix = empty((self._capacity, row.shape[0]), dtype=float32)
+        elif row.shape[0] != self._matrix.shape[1]:
+            raise ValueError(
+                f"Embedding dimension {row.shape[0]} does not match index dimension {self._matrix.shape[1]}"
+            )
+
+        position = self._positions.get(key)
+        if position is None:
+            position = len(self._keys)
+            if position == self._matrix.shape[0]:
+                self._grow()
+            self._keys.append(key)
+            self._positions[key] = position
+
+        self._matrix[position] = row
+        self._groups[position] = group
+
+    def _grow(self) -> None:
+        size = self._matrix.shape[0]
+        matrix = empty((size * 2, self._matrix.shape[1]), dtype=float32)
+        matrix[:size] = self._matrix
+        groups = empty(size * 2, dtype=int32)
+        groups[:size] = self._groups
+        self._matrix, self._groups = matrix, groups
+
+    def scores(self, queries: FloatArray) -> FloatArray:
+        """
+        Cosine similarity of each query (rows of a 2-D array) against every
+        entry, shape (len(queries), len(self))
+        """
+        if self._matrix is None:
+            return empty((len(queries), 0), dtype=float32)
+        return l2_normalize(queries) @ self._matrix[: len(self._keys)].T
+
+    def top_k(
+        self,
+        query: FloatArray,
+        k: int = 1,
+        groups: Collection[int] | None = None,
+    ) -> List[Tuple[Hashable, float]]:
+        """The k most similar (key, score) pairs for a single query"""
+        return self.top_k_many(asarray(query).reshape(1, -1), k, groups)[0]
+
+    def top_k_many(
+        self,
+        queries: FloatArray,
+        k: int = 1,
+        groups: Collection[int] | None = None,
+    ) -> List[List[Tuple[Hashable, float]]]:
+        """
+        The k most similar (key, score) pairs for each query, best first.
+        Ties are broken by insertion order. If groups is given, only entries
+        in those groups are considered.
+        """
+        queries = asarray(queries).reshape(len(queries), -1)
+        scores = self.scores(queries)
+
+        candidates = None
+        if groups is not None and scores.shape[1]:
+            candidates = flatnonzero(isin(self._groups[: len(self._keys)], list(groups)))
+            scores = scores[:, candidates]
+
+        k = min(k, scores.shape[1])
+        if k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        if k < scores.shape[1]:
+            top = argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top = arange(k)[None, :].repeat(len(queries), axis=0)
+        top_scores = take_along_axis(scores, top, axis=1)
+        order = lexsort((top, -top_scores), axis=1)
+        top = take_along_axis(top, order, axis=1)
+        top_scores = take_along_axis(top_scores, order, axis=1)
+        if candidates is not None:
+            top = candidates[top]
+
+        keys = self._keys
+        return [
+            [(keys[i], float(score)) for i, score in zip(row, row_scores)]
+            for row, row_scores in zip(top.tolist(), top_scores.tolist())
+        ]
@@ -0,0 +1,168 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from numpy import asarray, float32, stack
+
+from mcp_agent.tracing.telemetry import get_tracer
+from mcp_agent.workflows.embedding.embedding_base import EmbeddingModel, FloatArray
+from mcp_agent.workflows.embedding.embedding_store import (
+    EmbeddingStore,
+    model_name,
+    text_key,
+)
+
+if TYPE_CHECKING:
+    from mcp_agent.core.context import Context
+
+
+class CachingEmbeddingModel(EmbeddingModel):
+    """
+    An EmbeddingModel that caches another model's embeddings by content.
+
+    Each embed(data) batch is split into cache hits and misses; only the
+    distinct misses are sent to the wrapped model, and the result is
+    reassembled in input order. Vectors are kept in an in-memory LRU bounded
+    by bytes and, optionally, in an on-disk EmbeddingStore (memory-mapped
+    float32) shared across restarts and processes.
+
+    Hit, miss and bytes-saved counts are recorded on each embed span and
+    accumulated in stats().
+
+    Example usage:
+        embedding_model = CachingEmbeddingModel(
+            OpenAIEmbeddingModel(model="text-embedding-3-small"),
+            max_bytes=64 * 1024 * 1024,
+            store_path=".mcp-agent/embeddings",
+        )
+    """
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModel,
+        max_bytes: int = 64 * 1024 * 1024,
+        store: EmbeddingStore | None = None,
+        store_path: str | None = None,
+        context: Optional["Context"] = None,
+        **kwargs,
+    ):
+        super().__init__(context=context, **kwargs)
+        self.embedding_model = embedding_model
+        self.model = model_name(embedding_model)
+        self.max_bytes = max_bytes
+        if store is None and store_path is not None:
+            store = EmbeddingStore.for_model(store_path, embedding_model)
+        self.store = store
+
+        self._entries: "OrderedDict[str, FloatArray]" = OrderedDict()
+        self._bytes = 0
+        self.requested = 0
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+
+    @property
+    def embedding_dim(self) -> int:
+        return self.embedding_model.embedding_dim
+
+    @property
+    def max_batch_size(self) -> int:
+        return self.embedding_model.max_batch_size
+
+    def _remember(self, key: str, vector: FloatArray) -> None:
+        if vector.nbytes > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.nbytes
+        # Own the row: a view into a batch array would keep the whole batch
+        # alive, so nbytes would undercount what the cache holds
+        vector = vector.copy()
+        self._entries[key] = vector
+        self._bytes += vector.nbytes
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self.evictions += 1
+
+    async def embed(self, data: List[str]) -> FloatArray:
+        tracer = get_tracer(self.context)
+        with tracer.start_as_current_span(f"{self.__class__.__name__}.embed") as span:
+            keys = [text_key(text) for text in data]
+            vectors: Dict[str, FloatArray] = {}
+            hits = 0
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    vectors[key] = vector
+                    hits += 1
+
+            # Distinct texts not in memory, in first-seen order
+            pending: Dict[str, str] = {}
+            for key, text in zip(keys, data):
+                if key not in vectors:
+                    pending.setdefault(key, text)
+
+            store_hits = 0
+            if pending and self.store is not None:
+                for (key, text), vector in zip(
+                    list(pending.items()), self.store.get(list(pending.values()))
+                ):
+                    if vector is not None:
+                        vectors[key] = vector
+                        self._remember(key, vector)
+                        del pending[key]
+                        store_hits += 1
+
+            if pending:
+                texts = list(pending.values())
+                embeddings = asarray(await self.embedding_model.embed(texts), dtype=float32)
+                if self.store is not None:
+                    self.store.put(texts, embeddings)
+                for key, vector in zip(pending, embeddings):
+                    vectors[key] = vector
+                    self._remember(key, vector)
+
+            # Texts not sent upstream, including repeats within this batch
+            saved = len(data) - len(pending)
+            bytes_saved = saved * self.embedding_dim * 4
+            self.requested += len(data)
+            self.hits += hits
+            self.store_hits += store_hits
+            self.misses += len(pending)
+            self.bytes_saved += bytes_saved
+
+            if self.context.tracing_enabled:
+                span.set_attribute("embedding_cache.requested", len(data))
+                span.set_attribute("embedding_cache.hits", hits)
+                span.set_attribute("embedding_cache.store_hits", store_hits)
+                span.set_attribute("embedding_cache.misses", len(pending))
+                span.set_attribute("embedding_cache.bytes_saved", bytes_saved)
+                span.set_attribute("embedding_cache.hit_rate", self.hit_rate)
+
+            if not data:
+                return asarray([], dtype=float32).reshape(0, self.embedding_dim)
+            return stack([vectors[key] for key in keys])
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of requested texts served without calling the wrapped model"""
+        if not self.requested:
+            return 0.0
+        return (self.requested - self.misses) / self.requested
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "requested": self.requested,
+            "hits": self.hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "bytes_saved": self.bytes_saved,
+            "evictions": self.evictions,
+        }
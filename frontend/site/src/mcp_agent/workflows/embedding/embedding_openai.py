@@ -1,7 +1,7 @@
+import base64
 from typing import List, Optional, TYPE_CHECKING
 
-from numpy import array, float32, stack
-from openai import OpenAI
+from numpy import float32, frombuffer, stack
 
 from mcp_agent.tracing.semconv import (
     GEN_AI_OPERATION_NAME,
@@ -11,19 +11,23 @@ from mcp_agent.tracing.semconv import (
 )
 from mcp_agent.tracing.telemetry import get_tracer
 from mcp_agent.workflows.embedding.embedding_base import EmbeddingModel, FloatArray
+from mcp_agent.workflows.llm.provider_clients import provider_clients
 
 if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
     from mcp_agent.core.context import Context
 
 
 class OpenAIEmbeddingModel(EmbeddingModel):
     """OpenAI embedding model implementation"""
 
+    max_batch_size = 2048
+
     def __init__(
         self, model: str = "text-embedding-3-small", context: Optional["Context"] = None
     ):
         super().__init__(context=context)
-        self.client = OpenAI(api_key=self.context.config.openai.api_key)
         self.model = model
         # Cache the dimension since it's fixed per model
         self._embedding_dim = {
@@ -39,8 +43,10 @@ class OpenAIEmbeddingModel(EmbeddingModel):
             span.set_attribute("data", data)
             span.set_attribute("embedding_dim", self.embedding_dim)
 
-            response = self.client.embeddings.create(
-                model=self.model, input=data, encoding_format="float"
+            # base64 is decoded straight into float32 rows; with "float" the
+            # SDK builds a Python float per component on the event loop
+            response = await self.client.embeddings.create(
+                model=self.model, input=data, encoding_format="base64"
             )
 
             span.set_attribute(GEN_AI_RESPONSE_MODEL, response.model)
@@ -60,12 +66,17 @@ class OpenAIEmbeddingModel(EmbeddingModel):
             # Stack all embeddings into a single array
             embeddings = stack(
                 [
-                    array(embedding.embedding, dtype=float32)
+                    frombuffer(base64.b64decode(embedding.embedding), dtype=float32)
                     for embedding in sorted_embeddings
                 ]
             )
             return embeddings
 
+    @property
+    def client(self) -> "AsyncOpenAI":
+        """The shared AsyncOpenAI client for the running event loop"""
+        return provider_clients.get_openai(api_key=self.context.config.openai.api_key)
+
     @property
     def embedding_dim(self) -> int:
         return self._embedding_dim
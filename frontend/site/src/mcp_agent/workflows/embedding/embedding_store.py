@@ -0,0 +1,141 @@
+"""
+Persistent on-disk store of embedding vectors.
+
+Vectors are keyed by (embedding model, dimension, sha256 of the text) so that
+routers and intent classifiers can reuse category embeddings across restarts
+and across worker processes instead of re-embedding them on every start.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+from numpy import asarray, float32, memmap
+
+from mcp_agent.workflows.embedding.embedding_base import EmbeddingModel, FloatArray
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process appends only
+    fcntl = None
+
+
+def text_key(text: str) -> str:
+    """Content hash used to key a text's embedding"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def model_name(embedding_model: EmbeddingModel) -> str:
+    """Best-effort identifier of the model behind an EmbeddingModel"""
+    return getattr(embedding_model, "model", None) or type(embedding_model).__name__
+
+
+class EmbeddingStore:
+    """
+    Append-only store of float32 vectors for one (model, dimension) pair.
+
+    Layout, under `<path>/<model>-<dim>/`:
+    - vectors.f32: raw float32 rows, memory-mapped for reads
+    - keys.txt: one text hash per line; line i names row i
+
+    Appends write the vectors before the keys, so a key is only visible once
+    its row is complete. Appends from several processes are serialised with
+    an advisory file lock (where available) and each writer first picks up
+    rows appended by others.
+    """
+
+    def __init__(self, path: str | Path, model: str, dim: int):
+        safe_model = re.sub(r"[^A-Za-z0-9._-]+", "_", model)
+        self.directory = Path(path) / f"{safe_model}-{dim}"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.model = model
+        self.dim = dim
+        self._vectors_path = self.directory / "vectors.f32"
+        self._keys_path = self.directory / "keys.txt"
+        self._lock_path = self.directory / ".lock"
+        self._rows: Dict[str, int] = {}
+        self._count = 0
+        self._keys_offset = 0
+        self._matrix: memmap | None = None
+        self._lock = threading.Lock()
+        self._load_new_keys()
+
+    @classmethod
+    def for_model(cls, path: str | Path, embedding_model: EmbeddingModel) -> "EmbeddingStore":
+        """Open the store for an EmbeddingModel's name and dimension"""
+        return cls(path, model_name(embedding_model), embedding_model.embedding_dim)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _load_new_keys(self) -> None:
+        """Read key lines appended since the last load"""
+        if not self._keys_path.exists():
+            return
+        with open(self._keys_path, "rb") as keys_file:
+            keys_file.seek(self._keys_offset)
+            data = keys_file.read()
+        # Only consume complete lines
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            self._rows.setdefault(line.decode("ascii", errors="replace").strip(), self._count)
+            self._count += 1
+        if end:
+            self._keys_offset += end
+            self._matrix = None
+
+    def _vectors(self) -> memmap | None:
+        if self._matrix is None and self._count:
+            self._matrix = memmap(
+                self._vectors_path, dtype=float32, mode="r", shape=(self._count, self.dim)
+            )
+        return self._matrix
+
+    def get(self, texts: List[str]) -> List[FloatArray | None]:
+        """Stored vectors for texts, None where a text has not been stored"""
+        with self._lock:
+            keys = [text_key(text) for text in texts]
+            if any(key not in self._rows for key in keys):
+                # Pick up rows other processes have appended since
+                self._load_new_keys()
+            rows = [self._rows.get(key) for key in keys]
+            if all(row is None for row in rows):
+                return [None] * len(texts)
+            matrix = self._vectors()
+            return [None if row is None else asarray(matrix[row]).copy() for row in rows]
+
+    def put(self, texts: List[str], embeddings: FloatArray) -> None:
+        """Append vectors for texts that are not stored yet"""
+        embeddings = asarray(embeddings, dtype=float32).reshape(len(texts), -1)
+        if embeddings.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-d embeddings, got {embeddings.shape[1]}-d")
+
+        with self._lock, open(self._lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                self._load_new_keys()
+                new_rows: Dict[str, int] = {}
+                for index, text in enumerate(texts):
+                    key = text_key(text)
+                    if key not in self._rows and key not in new_rows:
+                        new_rows[key] = index
+                if not new_rows:
+                    return
+
+                # Drop any torn row or key line left by a crashed writer
+                with open(self._vectors_path, "ab") as vectors_file:
+                    vectors_file.truncate(self._count * self.dim * 4)
+                    vectors_file.write(embeddings[list(new_rows.values())].tobytes())
+                    vectors_file.flush()
+                    os.fsync(vectors_file.fileno())
+                with open(self._keys_path, "ab") as keys_file:
+                    keys_file.truncate(self._keys_offset)
+                    keys_file.write("".join(f"{key}\n" for key in new_rows).encode("ascii"))
+                self._load_new_keys()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
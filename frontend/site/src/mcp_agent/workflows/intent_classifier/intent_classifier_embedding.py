@@ -6,11 +6,12 @@ from pydantic import ConfigDict
 from mcp_agent.tracing.semconv import GEN_AI_REQUEST_TOP_K
 from mcp_agent.tracing.telemetry import get_tracer, record_attributes
 from mcp_agent.workflows.embedding.embedding_base import (
+    EmbeddingIndex,
     FloatArray,
     EmbeddingModel,
-    compute_confidence,
-    compute_similarity_scores,
+    embed_batched,
 )
+from mcp_agent.workflows.embedding.embedding_store import EmbeddingStore
 from mcp_agent.workflows.intent_classifier.intent_classifier_base import (
     Intent,
     IntentClassifier,
@@ -40,6 +41,10 @@ class EmbeddingIntentClassifier(IntentClassifier):
     - Support for example-based learning
     - Flexible embedding model support
     - Multiple similarity computation strategies
+    - All intent embeddings are scored in one matrix-vector product
+      (see EmbeddingIndex), and classify_many scores a batch of requests at once
+    - Intent embeddings are computed in batches at initialization and can be
+      persisted in an EmbeddingStore shared across restarts and workers
     """
 
     def __init__(
@@ -47,17 +52,25 @@ class EmbeddingIntentClassifier(IntentClassifier):
         intents: List[Intent],
         embedding_model: EmbeddingModel,
         context: Optional["Context"] = None,
+        embedding_store: EmbeddingStore | None = None,
+        max_concurrency: int = 4,
         **kwargs,
     ):
         super().__init__(intents=intents, context=context, **kwargs)
         self.embedding_model = embedding_model
+        self.embedding_store = embedding_store
+        self.max_concurrency = max_concurrency
         self.initialized = False
 
+        # Normalised intent embeddings, keyed by intent name
+        self.index = EmbeddingIndex()
+
     @classmethod
     async def create(
         cls,
         intents: List[Intent],
         embedding_model: EmbeddingModel,
+        embedding_store: EmbeddingStore | None = None,
     ) -> "EmbeddingIntentClassifier":
         """
         Factory method to create and initialize a classifier.
@@ -66,6 +79,7 @@ class EmbeddingIntentClassifier(IntentClassifier):
         instance = cls(
             intents=intents,
             embedding_model=embedding_model,
+            embedding_store=embedding_store,
         )
         await instance.initialize()
         return instance
@@ -78,23 +92,43 @@ class EmbeddingIntentClassifier(IntentClassifier):
         if self.initialized:
             return
 
-        for intent in self.intents.values():
-            # Combine all text for a rich intent representation
-            intent_texts = [intent.name, intent.description] + intent.examples
+        self.index = EmbeddingIndex()
+        await self._add_intents(list(self.intents.values()))
 
-            # Get embeddings for all texts
-            embeddings = await self.embedding_model.embed(intent_texts)
+        self.initialized = True
 
+    async def add_intent(self, intent: Intent) -> None:
+        """Add (or replace) an intent without recomputing the others"""
+        if not self.initialized:
+            await self.initialize()
+        await self._add_intents([intent])
+
+    async def _add_intents(self, intents: List[Intent]) -> None:
+        # Combine all text for a rich intent representation
+        intent_texts = [
+            [intent.name, intent.description] + intent.examples for intent in intents
+        ]
+
+        # Get embeddings for the texts of all intents in batched calls
+        embeddings = await embed_batched(
+            self.embedding_model,
+            [text for texts in intent_texts for text in texts],
+            store=self.embedding_store,
+            max_concurrency=self.max_concurrency,
+        )
+
+        start = 0
+        for intent, texts in zip(intents, intent_texts):
             # Use mean pooling to combine embeddings
-            embedding = mean(embeddings, axis=0)
+            embedding = mean(embeddings[start : start + len(texts)], axis=0)
+            start += len(texts)
 
             # Create intents with embeddings
             self.intents[intent.name] = EmbeddingIntent(
                 **intent.model_dump(),
                 embedding=embedding,
             )
-
-        self.initialized = True
+            self.index.add(intent.name, embedding)
 
     async def classify(
         self, request: str, top_k: int = 1
@@ -139,36 +173,19 @@ class EmbeddingIntentClassifier(IntentClassifier):
                 0
             ]  # Take first since we only embedded one text
 
-            results: List[IntentClassificationResult] = []
-            for intent_name, intent in self.intents.items():
-                if intent.embedding is None:
-                    continue
-
-                similarity_scores = compute_similarity_scores(
-                    request_embedding, intent.embedding
-                )
-
-                # Compute overall confidence score
-                confidence = compute_confidence(similarity_scores)
-
-                if self.context.tracing_enabled:
+            if self.context.tracing_enabled:
+                # Full score vector only when it is recorded
+                scores = self.index.scores(request_embedding.reshape(1, -1))[0]
+                for intent_name, score in zip(self.index.keys, scores.tolist()):
                     span.set_attribute(
-                        f"classification.{intent_name}.p_score", confidence
-                    )
-                    for metric, score in similarity_scores.items():
-                        span.set_attribute(
-                            f"classification.{intent_name}.{metric}", score
-                        )
-
-                results.append(
-                    IntentClassificationResult(
-                        intent=intent_name,
-                        p_score=confidence,
+                        f"classification.{intent_name}.p_score", score
                     )
-                )
+                    span.set_attribute(f"classification.{intent_name}.cosine", score)
 
-            results.sort(key=lambda x: x.p_score, reverse=True)
-            top_results = results[:top_k]
+            top_results = [
+                IntentClassificationResult(intent=intent_name, p_score=score)
+                for intent_name, score in self.index.top_k(request_embedding, top_k)
+            ]
 
             if self.context.tracing_enabled:
                 for i, result in enumerate(top_results):
@@ -176,3 +193,25 @@ class EmbeddingIntentClassifier(IntentClassifier):
                     span.set_attribute(f"result.{i}.p_score", result.p_score)
 
             return top_results
+
+    async def classify_many(
+        self, requests: List[str], top_k: int = 1
+    ) -> List[List[IntentClassificationResult]]:
+        """
+        Classify a batch of requests with one embedding call and one
+        matrix-matrix product. Returns one result list per request.
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        if not requests:
+            return []
+
+        embeddings = await self.embedding_model.embed(requests)
+        return [
+            [
+                IntentClassificationResult(intent=intent_name, p_score=score)
+                for intent_name, score in matches
+            ]
+            for matches in self.index.top_k_many(embeddings, top_k)
+        ]
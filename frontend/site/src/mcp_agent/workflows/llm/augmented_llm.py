@@ -2,6 +2,7 @@ from abc import abstractmethod
 
 from typing import (
     Any,
+    Callable,
     Dict,
     Generic,
     List,
@@ -30,6 +31,7 @@ from mcp.types import (
     SamplingMessage,
     TextContent,
     PromptMessage,
+    Tool,
 )
 
 from mcp_agent.core.context_dependent import ContextDependent
@@ -319,6 +321,9 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol[MessageParamT, Message
         self.model_selector = self.context.model_selector
         self.type_converter = type_converter
 
+        # Provider tool schemas by id(tool), kept with the Tool they came from
+        self._tool_schemas: Dict[int, tuple[Tool, Any]] = {}
+
     async def __aenter__(self):
         if self.agent:
             await self.agent.__aenter__()
@@ -570,6 +575,25 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol[MessageParamT, Message
             server_name=server_name, tool_filter=tool_filter
         )
 
+    def convert_tools(self, tools: List[Tool], convert: Callable[[Tool], Any]) -> List[Any]:
+        """
+        Provider tool schemas for tools, converting each Tool once. The
+        agent's MCP tools are shared Tool objects that only change when a
+        server's tools do, so their schemas are reused across generate calls
+        and iterations; only the current tools' schemas are kept.
+        """
+        previous = self._tool_schemas
+        current: Dict[int, tuple[Tool, Any]] = {}
+        schemas = []
+        for tool in tools:
+            entry = previous.get(id(tool))
+            if entry is None or entry[0] is not tool:
+                entry = (tool, convert(tool))
+            current[id(tool)] = entry
+            schemas.append(entry[1])
+        self._tool_schemas = current
+        return schemas
+
     async def list_resources(
         self, server_name: str | None = None
     ) -> ListResourcesResult:
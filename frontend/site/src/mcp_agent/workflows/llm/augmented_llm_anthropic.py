@@ -4,7 +4,7 @@ from typing import Any, Iterable, List, Type, Union, cast
 
 from pydantic import BaseModel
 
-from anthropic import Anthropic, AnthropicBedrock, AnthropicVertex, AsyncAnthropic
+from anthropic import Anthropic, AnthropicBedrock, AnthropicVertex
 from anthropic.types import (
     ContentBlock,
     DocumentBlockParam,
@@ -60,6 +60,7 @@ from mcp_agent.workflows.llm.augmented_llm import (
 )
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.workflows.llm.multipart_converter_anthropic import AnthropicConverter
+from mcp_agent.workflows.llm.provider_clients import provider_clients
 
 MessageParamContent = Union[
     str,
@@ -183,14 +184,14 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
             list_tools_result = await self.agent.list_tools(
                 tool_filter=params.tool_filter
             )
-            available_tools: List[ToolParam] = [
-                {
+            available_tools: List[ToolParam] = self.convert_tools(
+                list_tools_result.tools,
+                lambda tool: {
                     "name": tool.name,
                     "description": tool.description,
                     "input_schema": tool.inputSchema,
-                }
-                for tool in list_tools_result.tools
-            ]
+                },
+            )
 
             responses: List[Message] = []
             model = await self.select_model(params)
@@ -462,17 +463,16 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
                 args["stop_sequences"] = params.stopSequences
 
             # Call Anthropic directly (one-turn streaming for consistency)
-            base_url = None
             if self.context and self.context.config and self.context.config.anthropic:
-                base_url = self.context.config.anthropic.base_url
-                api_key = self.context.config.anthropic.api_key
-                client = AsyncAnthropic(api_key=api_key, base_url=base_url)
+                client = provider_clients.get_anthropic(
+                    api_key=self.context.config.anthropic.api_key,
+                    base_url=self.context.config.anthropic.base_url,
+                )
             else:
-                client = AsyncAnthropic()
+                client = provider_clients.get_anthropic()
 
-            async with client:
-                async with client.messages.stream(**args) as stream:
-                    final = await stream.get_final_message()
+            async with client.messages.stream(**args) as stream:
+                final = await stream.get_final_message()
 
             # Extract tool_use input and validate
             for block in final.content:
@@ -766,7 +766,10 @@ class AnthropicCompletionTasks:
         """
         # Prefer async client where available to avoid blocking the event loop
         if request.config.provider in (None, "", "anthropic"):
-            client = AsyncAnthropic(api_key=request.config.api_key)
+            client = provider_clients.get_anthropic(
+                api_key=request.config.api_key,
+                base_url=getattr(request.config, "base_url", None),
+            )
             payload = request.payload
             response = await client.messages.create(**payload)
             response = ensure_serializable(response)
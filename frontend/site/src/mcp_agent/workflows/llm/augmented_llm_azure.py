@@ -162,16 +162,16 @@ class AzureAugmentedLLM(AugmentedLLM[MessageParam, ResponseMessage]):
 
             response = await self.agent.list_tools(tool_filter=params.tool_filter)
 
-            tools: list[ChatCompletionsToolDefinition] = [
-                ChatCompletionsToolDefinition(
+            tools: list[ChatCompletionsToolDefinition] = self.convert_tools(
+                response.tools,
+                lambda tool: ChatCompletionsToolDefinition(
                     function=FunctionDefinition(
                         name=tool.name,
                         description=tool.description,
                         parameters=tool.inputSchema,
                     )
-                )
-                for tool in response.tools
-            ]
+                ),
+            )
 
             span.set_attribute(
                 "available_tools",
@@ -266,7 +266,7 @@ class AzureAugmentedLLM(AugmentedLLM[MessageParam, ResponseMessage]):
                         tool_results = await self.executor.execute_many(tool_tasks)
 
                         self.logger.debug(
-                            f"Iteration {i}: Tool call results: {str(tool_results) if tool_results else 'None'}"
+                            lambda: f"Iteration {i}: Tool call results: {str(tool_results) if tool_results else 'None'}"
                         )
 
                         for result in tool_results:
@@ -110,16 +110,16 @@ class BedrockAugmentedLLM(AugmentedLLM[MessageUnionTypeDef, MessageUnionTypeDef]
         response = await self.agent.list_tools(tool_filter=params.tool_filter)
 
         tool_config: ToolConfigurationTypeDef = {
-            "tools": [
-                {
+            "tools": self.convert_tools(
+                response.tools,
+                lambda tool: {
                     "toolSpec": {
                         "name": tool.name,
                         "description": tool.description,
                         "inputSchema": {"json": tool.inputSchema},
                     }
-                }
-                for tool in response.tools
-            ],
+                },
+            ),
             "toolChoice": {"auto": {}},
         }
 
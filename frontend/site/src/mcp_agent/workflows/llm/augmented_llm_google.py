@@ -91,8 +91,9 @@ class GoogleAugmentedLLM(
 
         response = await self.agent.list_tools(tool_filter=params.tool_filter)
 
-        tools = [
-            types.Tool(
+        tools = self.convert_tools(
+            response.tools,
+            lambda tool: types.Tool(
                 function_declarations=[
                     types.FunctionDeclaration(
                         name=tool.name,
@@ -100,9 +101,8 @@ class GoogleAugmentedLLM(
                         parameters=transform_mcp_tool_schema(tool.inputSchema),
                     )
                 ]
-            )
-            for tool in response.tools
-        ]
+            ),
+        )
 
         responses: list[types.Content] = []
         model = await self.select_model(params)
@@ -172,7 +172,7 @@ class GoogleAugmentedLLM(
                 ] = await self.executor.execute_many(function_calls)
 
                 self.logger.debug(
-                    f"Iteration {i}: Tool call results: {str(results) if results else 'None'}"
+                    lambda: f"Iteration {i}: Tool call results: {str(results) if results else 'None'}"
                 )
 
                 function_response_parts: list[types.Part] = []
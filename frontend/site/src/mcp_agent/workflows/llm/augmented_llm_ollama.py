@@ -1,7 +1,5 @@
 from typing import Type
 
-from openai import AsyncOpenAI
-
 from mcp_agent.executor.workflow_task import workflow_task
 from mcp_agent.utils.pydantic_type_serializer import serialize_model, deserialize_model
 from mcp_agent.workflows.llm.augmented_llm import (
@@ -12,6 +10,7 @@ from mcp_agent.workflows.llm.augmented_llm_openai import (
     OpenAIAugmentedLLM,
     RequestStructuredCompletionRequest,
 )
+from mcp_agent.workflows.llm.provider_clients import provider_clients
 
 
 class OllamaAugmentedLLM(OpenAIAugmentedLLM):
@@ -100,25 +99,23 @@ class OllamaCompletionTasks:
             )
 
         # Next we pass the text through instructor to extract structured data
-        async with AsyncOpenAI(
+        async_client = provider_clients.get_openai(
             api_key=request.config.api_key,
             base_url=request.config.base_url,
-            http_client=request.config.http_client
-            if hasattr(request.config, "http_client")
-            else None,
-        ) as async_client:
-            client = instructor.from_openai(
-                async_client,
-                mode=instructor.Mode.JSON,
-            )
+            http_client=getattr(request.config, "http_client", None),
+        )
+        client = instructor.from_openai(
+            async_client,
+            mode=instructor.Mode.JSON,
+        )
 
-            # Extract structured data from natural language
-            structured_response = await client.chat.completions.create(
-                model=request.model,
-                response_model=response_model,
-                messages=[
-                    {"role": "user", "content": request.response_str},
-                ],
-            )
+        # Extract structured data from natural language
+        structured_response = await client.chat.completions.create(
+            model=request.model,
+            response_model=response_model,
+            messages=[
+                {"role": "user", "content": request.response_str},
+            ],
+        )
 
-            return structured_response
+        return structured_response
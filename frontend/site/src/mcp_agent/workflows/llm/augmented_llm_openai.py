@@ -6,7 +6,6 @@ from typing import Any, Dict, Iterable, List, Type, cast
 from pydantic import BaseModel
 
 
-from openai import AsyncOpenAI
 from openai.types.chat import (
     ChatCompletionAssistantMessageParam,
     ChatCompletionContentPartParam,
@@ -63,6 +62,7 @@ from mcp_agent.workflows.llm.augmented_llm import (
 )
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.workflows.llm.multipart_converter_openai import OpenAIConverter
+from mcp_agent.workflows.llm.provider_clients import provider_clients
 
 
 class RequestCompletionRequest(BaseModel):
@@ -192,8 +192,9 @@ class OpenAIAugmentedLLM(
             response: ListToolsResult = await self.agent.list_tools(
                 tool_filter=params.tool_filter
             )
-            available_tools: List[ChatCompletionToolParam] = [
-                ChatCompletionToolParam(
+            available_tools: List[ChatCompletionToolParam] = self.convert_tools(
+                response.tools,
+                lambda tool: ChatCompletionToolParam(
                     type="function",
                     function={
                         "name": tool.name,
@@ -201,9 +202,8 @@ class OpenAIAugmentedLLM(
                         "parameters": tool.inputSchema,
                         # TODO: saqadri - determine if we should specify "strict" to True by default
                     },
-                )
-                for tool in response.tools
-            ]
+                ),
+            )
 
             if self.context.tracing_enabled:
                 span.set_attribute(
@@ -336,7 +336,7 @@ class OpenAIAugmentedLLM(
                     # Wait for all tool calls to complete.
                     tool_results = await self.executor.execute_many(tool_tasks)
                     self.logger.debug(
-                        f"Iteration {i}: Tool call results: {str(tool_results) if tool_results else 'None'}"
+                        lambda: f"Iteration {i}: Tool call results: {str(tool_results) if tool_results else 'None'}"
                     )
                     # Add non-None results to messages.
                     for result in tool_results:
@@ -932,20 +932,16 @@ class OpenAICompletionTasks:
         """
         Request a completion from OpenAI's API.
         """
-        async with AsyncOpenAI(
+        async_openai_client = provider_clients.get_openai(
             api_key=request.config.api_key,
             base_url=request.config.base_url,
-            http_client=request.config.http_client
-            if hasattr(request.config, "http_client")
-            else None,
-            default_headers=request.config.default_headers
-            if hasattr(request.config, "default_headers")
-            else None,
-        ) as async_openai_client:
-            payload = request.payload
-            response = await async_openai_client.chat.completions.create(**payload)
-            response = ensure_serializable(response)
-            return response
+            http_client=getattr(request.config, "http_client", None),
+            default_headers=getattr(request.config, "default_headers", None),
+        )
+        payload = request.payload
+        response = await async_openai_client.chat.completions.create(**payload)
+        response = ensure_serializable(response)
+        return response
 
     @staticmethod
     @workflow_task
@@ -977,38 +973,34 @@ class OpenAICompletionTasks:
             },
         }
 
-        async with AsyncOpenAI(
+        async_openai_client = provider_clients.get_openai(
             api_key=request.config.api_key,
             base_url=request.config.base_url,
-            http_client=request.config.http_client
-            if hasattr(request.config, "http_client")
-            else None,
-            default_headers=request.config.default_headers
-            if hasattr(request.config, "default_headers")
-            else None,
-        ) as async_openai_client:
-            payload = {
-                "model": request.model,
-                "messages": [{"role": "user", "content": request.response_str}],
-                "response_format": response_format,
-            }
-            if request.user:
-                payload["user"] = request.user
+            http_client=getattr(request.config, "http_client", None),
+            default_headers=getattr(request.config, "default_headers", None),
+        )
+        payload = {
+            "model": request.model,
+            "messages": [{"role": "user", "content": request.response_str}],
+            "response_format": response_format,
+        }
+        if request.user:
+            payload["user"] = request.user
 
-            completion = await async_openai_client.chat.completions.create(**payload)
+        completion = await async_openai_client.chat.completions.create(**payload)
 
-            if not completion.choices or completion.choices[0].message.content is None:
-                raise ValueError("No structured content returned by model")
+        if not completion.choices or completion.choices[0].message.content is None:
+            raise ValueError("No structured content returned by model")
 
-            content = completion.choices[0].message.content
-            # message.content is expected to be JSON string
-            try:
-                data = json.loads(content)
-            except Exception:
-                # Some models may already return a dict-like; fall back to string validation
-                return response_model.model_validate_json(content)
+        content = completion.choices[0].message.content
+        # message.content is expected to be JSON string
+        try:
+            data = json.loads(content)
+        except Exception:
+            # Some models may already return a dict-like; fall back to string validation
+            return response_model.model_validate_json(content)
 
-            return response_model.model_validate(data)
+        return response_model.model_validate(data)
 
 
 class MCPOpenAITypeConverter(
@@ -1,7 +1,7 @@
 import json
 from difflib import SequenceMatcher
 from importlib import resources
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, TYPE_CHECKING
 import os
 
 from numpy import average
@@ -10,6 +10,7 @@ from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from mcp.types import ModelHint, ModelPreferences
 from mcp_agent.core.context_dependent import ContextDependent
 from mcp_agent.tracing.telemetry import get_tracer
+from mcp_agent.workflows.llm.model_catalog import ModelCatalog, get_default_model_index
 
 if TYPE_CHECKING:
     from mcp_agent.core.context import Context
@@ -117,8 +118,11 @@ class ModelSelector(ContextDependent):
         super().__init__(context=context)
         if not models:
             self.models = load_default_models()
+            # Shared index over the catalogue's names, for hint matching
+            self.catalog = get_default_model_index().all
         else:
             self.models = models
+            self.catalog = ModelCatalog((model.name or "", model) for model in models)
 
         if benchmark_weights:
             self.benchmark_weights = benchmark_weights
@@ -200,9 +204,13 @@ class ModelSelector(ContextDependent):
             # First check the model hints
             if model_preferences.hints:
                 candidate_models = []
+                # Names matching each hint, looked up once in the catalogue
+                hint_names = [
+                    self._hint_matching_names(hint) for hint in model_preferences.hints
+                ]
                 for model in models:
-                    for hint in model_preferences.hints:
-                        passes_hint = self._check_model_hint(model, hint)
+                    for hint, names in zip(model_preferences.hints, hint_names):
+                        passes_hint = self._check_model_hint(model, hint, names)
                         span.set_attribute(f"model_hint.{hint.name}", passes_hint)
                         if passes_hint:
                             candidate_models.append(model)
@@ -297,12 +305,11 @@ class ModelSelector(ContextDependent):
             provider_models[key].append(model)
         return provider_models
 
-    def _check_model_hint(self, model: ModelInfo, hint: ModelHint) -> bool:
+    def _parse_model_hint(self, hint: ModelHint) -> tuple[str | None, str | None]:
         """
-        Check if a model matches a specific hint.
+        Derive the desired (name, provider) from a hint. Supports
+        "provider:model" in hint.name.
         """
-
-        # Derive desired provider/name from hint. Support "provider:model" in hint.name
         desired_name: str | None = hint.name
         desired_provider: str | None = getattr(hint, "provider", None)
         if desired_name and ":" in desired_name and not desired_provider:
@@ -310,13 +317,39 @@ class ModelSelector(ContextDependent):
             if lhs.strip() and rhs.strip():
                 desired_provider = lhs.strip()
                 desired_name = rhs.strip()
+        return desired_name, desired_provider
+
+    def _hint_matching_names(self, hint: ModelHint) -> Set[str] | None:
+        """
+        Lowercased catalogue names matching a hint's name (see
+        _check_model_hint), or None if the hint doesn't constrain the name.
+        """
+        desired_name, _ = self._parse_model_hint(hint)
+        if not desired_name:
+            return None
+        return self.catalog.related(desired_name)
+
+    def _check_model_hint(
+        self,
+        model: ModelInfo,
+        hint: ModelHint,
+        matching_names: Set[str] | None = None,
+    ) -> bool:
+        """
+        Check if a model matches a specific hint. matching_names, from
+        _hint_matching_names, saves comparing names model by model.
+        """
+        desired_name, desired_provider = self._parse_model_hint(hint)
 
         # Name match: exact (case-insensitive) then substring fallback
         name_match = True
         if desired_name:
-            dn = desired_name.lower()
             mn = (model.name or "").lower()
-            name_match = dn == mn or dn in mn or mn in dn
+            if matching_names is not None:
+                name_match = mn in matching_names
+            else:
+                dn = desired_name.lower()
+                name_match = dn == mn or dn in mn or mn in dn
 
         # Provider match: exact (case-insensitive)
         provider_match = True
@@ -0,0 +1,191 @@
+"""
+Indexed name lookup over the model catalogue.
+
+TokenCounter.find_model_info and ModelSelector resolve free-form model names
+("gpt-4o", "claude-3-5-sonnet-20241022", "openai/gpt-4.1") against the
+benchmark catalogue by prefix and substring matching, which used to mean
+scoring every catalogue entry for every new name. A ModelCatalog answers the
+same questions from two structures built once over the lowercased names:
+
+- a character trie, giving the names that start with a query (the walk is
+  O(len(query))) and the names contained in a query, such as the undated
+  "gpt-4o" inside a date-stamped "gpt-4o-2024-08-06";
+- a sorted list of every name suffix, giving the names that contain a query
+  with one binary search.
+
+Only the few names these return are scored, with the same scores as the
+linear scans, so results (including tie-breaking by catalogue order) do not
+change.
+"""
+
+import bisect
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mcp_agent.workflows.llm.llm_selector import ModelInfo
+
+
+class _TrieNode:
+    __slots__ = ("children", "under", "ends")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.under: List[int] = []
+        """Positions of the names starting with this node's prefix"""
+        self.ends: List[int] = []
+        """Positions of the names equal to this node's prefix"""
+
+
+class ModelCatalog:
+    """
+    Name index over (name, ModelInfo) entries. Entries keep their input order,
+    which decides ties between equally scored matches.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, "ModelInfo"]]):
+        self.names: List[str] = []
+        self.models: List["ModelInfo"] = []
+        self._root = _TrieNode()
+
+        for name, model in entries:
+            name = name.lower()
+            position = len(self.names)
+            self.names.append(name)
+            self.models.append(model)
+
+            node = self._root
+            node.under.append(position)
+            for char in name:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = _TrieNode()
+                node = child
+                node.under.append(position)
+            node.ends.append(position)
+
+        suffixes = sorted(
+            (name[start:], position)
+            for position, name in enumerate(self.names)
+            for start in range(len(name))
+        )
+        self._suffixes = [suffix for suffix, _ in suffixes]
+        self._suffix_positions = [position for _, position in suffixes]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def starting_with(self, query: str) -> List[int]:
+        """Positions of the names starting with query, in catalogue order"""
+        node = self._root
+        for char in query.lower():
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.under
+
+    def containing(self, query: str) -> Set[int]:
+        """Positions of the names containing query"""
+        query = query.lower()
+        positions = set()
+        for i in range(bisect.bisect_left(self._suffixes, query), len(self._suffixes)):
+            if not self._suffixes[i].startswith(query):
+                break
+            positions.add(self._suffix_positions[i])
+        return positions
+
+    def contained_in(self, query: str) -> Set[int]:
+        """Positions of the names occurring in query"""
+        query = query.lower()
+        positions = set(self._root.ends)
+        for start in range(len(query)):
+            node = self._root
+            for char in query[start:]:
+                node = node.children.get(char)
+                if node is None:
+                    break
+                positions.update(node.ends)
+        return positions
+
+    def related(self, query: str) -> Set[str]:
+        """Names equal to, containing or contained in query"""
+        positions = self.containing(query) | self.contained_in(query)
+        return {self.names[position] for position in positions}
+
+    def best_match(
+        self, model_name: str, provider: Optional[str] = None
+    ) -> Optional["ModelInfo"]:
+        """
+        The model find_model_info's fuzzy scan would pick: exact (1000) and
+        prefix (500-600) matches outrank names containing model_name (< 100)
+        and names contained in it (< 50). When provider is given, scores of
+        models whose provider contains it get +50.
+        """
+        query = model_name.lower()
+        candidates = self.starting_with(query)
+        if not candidates:
+            candidates = sorted(self.containing(query) | self.contained_in(query))
+
+        best_match = None
+        best_match_score = 0
+        for position in candidates:
+            name = self.names[position]
+            known_model = self.models[position]
+            if query == name:
+                score = 1000
+            elif name.startswith(query):
+                score = 500 + (len(model_name) / len(name) * 100)
+            elif query in name:
+                score = len(model_name) / len(name) * 100
+            else:
+                score = len(name) / len(model_name) * 50
+
+            if (
+                score > 0
+                and provider
+                and provider.lower() in known_model.provider.lower()
+            ):
+                score += 50
+
+            if score > best_match_score:
+                best_match = known_model
+                best_match_score = score
+        return best_match
+
+
+class ModelCatalogIndex:
+    """
+    Catalogues over a model list, keyed the way TokenCounter looks models up:
+    `all` has one entry per (provider, name), `by_provider` one catalogue per
+    provider with one entry per name. Later duplicates replace earlier ones
+    but keep the earlier position.
+    """
+
+    def __init__(self, models: List["ModelInfo"]):
+        lookup: Dict[Tuple[str, str], "ModelInfo"] = {}
+        by_provider: Dict[str, Dict[str, "ModelInfo"]] = {}
+        for model in models:
+            lookup[(model.provider.lower(), model.name.lower())] = model
+            by_provider.setdefault(model.provider, {})[model.name.lower()] = model
+
+        self.all = ModelCatalog((name, model) for (_, name), model in lookup.items())
+        self.by_provider: Dict[str, ModelCatalog] = {
+            provider: ModelCatalog(entries.items())
+            for provider, entries in by_provider.items()
+        }
+
+
+_DEFAULT_INDEX: Tuple[List["ModelInfo"], ModelCatalogIndex] | None = None
+
+
+def get_default_model_index() -> ModelCatalogIndex:
+    """
+    The index over load_default_models(), built on first use and shared by
+    all TokenCounters and ModelSelectors.
+    """
+    global _DEFAULT_INDEX
+    from mcp_agent.workflows.llm.llm_selector import load_default_models
+
+    models = load_default_models()
+    if _DEFAULT_INDEX is None or _DEFAULT_INDEX[0] is not models:
+        _DEFAULT_INDEX = (models, ModelCatalogIndex(models))
+    return _DEFAULT_INDEX[1]
@@ -0,0 +1,154 @@
+"""
+Process-wide registry of long-lived LLM provider clients.
+
+Completion tasks used to build a new AsyncOpenAI / AsyncAnthropic client (and
+with it a new HTTP connection pool) for every request, so every LLM turn paid
+a fresh TCP and TLS handshake. The registry hands out one client per
+(provider, api key, base URL, headers) instead, with tunable connection limits
+and keep-alive.
+
+Clients are also keyed by the running event loop: an httpx pool cannot be
+shared across loops, and Temporal activities or nested asyncio.run() calls
+may run on a different loop than the app. Entries for a loop disappear when
+the loop is garbage collected.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Callable, Dict, Hashable, Mapping, TYPE_CHECKING
+
+import httpx
+
+from mcp_agent.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+    from openai import AsyncOpenAI
+
+    from mcp_agent.config import ProviderClientSettings
+
+logger = get_logger(__name__)
+
+
+def _headers_key(headers: Mapping[str, str] | None) -> Hashable:
+    return tuple(sorted(headers.items())) if headers else ()
+
+
+class ProviderClientRegistry:
+    """Shares async provider clients per event loop and client configuration"""
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, Any]]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def configure(self, settings: "ProviderClientSettings") -> None:
+        """Apply pool settings; clients created afterwards use them"""
+        self.limits = httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        )
+
+    def _get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is not None and not client.is_closed():
+                self.reused += 1
+                return client
+            client = factory()
+            clients[key] = client
+            self.created += 1
+            return client
+
+    def get_openai(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        default_headers: Mapping[str, str] | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> "AsyncOpenAI":
+        """
+        A shared AsyncOpenAI client for this configuration. Callers must not
+        close it. A caller-provided http_client is wrapped but never pooled
+        or closed by the registry.
+        """
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+        if http_client is not None:
+            return AsyncOpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                http_client=http_client,
+                default_headers=default_headers,
+            )
+
+        return self._get(
+            ("openai", api_key, base_url, _headers_key(default_headers)),
+            lambda: AsyncOpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                default_headers=default_headers,
+                http_client=DefaultAsyncHttpxClient(limits=self.limits),
+            ),
+        )
+
+    def get_anthropic(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        default_headers: Mapping[str, str] | None = None,
+    ) -> "AsyncAnthropic":
+        """A shared AsyncAnthropic client for this configuration. Callers must not close it."""
+        from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+
+        return self._get(
+            ("anthropic", api_key, base_url, _headers_key(default_headers)),
+            lambda: AsyncAnthropic(
+                api_key=api_key,
+                base_url=base_url,
+                default_headers=default_headers,
+                http_client=DefaultAsyncHttpxClient(limits=self.limits),
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """
+        Close the clients owned by the running loop and forget clients of
+        loops that are already closed
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._clients.pop(loop, {})
+            for other_loop in list(self._clients):
+                if other_loop.is_closed():
+                    del self._clients[other_loop]
+
+        for client in clients.values():
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Error closing provider client: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            open_clients = sum(len(clients) for clients in self._clients.values())
+        return {"open": open_clients, "created": self.created, "reused": self.reused}
+
+
+provider_clients = ProviderClientRegistry()
+"""The process-wide registry used by the built-in completion tasks"""
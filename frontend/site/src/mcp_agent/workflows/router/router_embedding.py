@@ -1,14 +1,15 @@
-from typing import Callable, List, Optional, TYPE_CHECKING
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from numpy import mean
 
 from mcp_agent.agents.agent import Agent
 from mcp_agent.workflows.embedding.embedding_base import (
+    EmbeddingIndex,
     EmbeddingModel,
     FloatArray,
-    compute_similarity_scores,
-    compute_confidence,
+    embed_batched,
 )
+from mcp_agent.workflows.embedding.embedding_store import EmbeddingStore
 from mcp_agent.workflows.llm.augmented_llm import AugmentedLLM
 from mcp_agent.workflows.router.router_base import (
     Router,
@@ -27,6 +28,12 @@ class EmbeddingRouterCategory(RouterCategory):
     """Pre-computed embedding for this category"""
 
 
+# EmbeddingIndex groups for each kind of category
+SERVER_GROUP = 0
+AGENT_GROUP = 1
+FUNCTION_GROUP = 2
+
+
 class EmbeddingRouter(Router):
     """
     A router that uses embedding similarity to route requests to appropriate categories.
@@ -37,6 +44,10 @@ class EmbeddingRouter(Router):
     - Semantic similarity based routing using embeddings
     - Flexible embedding model support
     - Support for formatting and combining category metadata
+    - All category embeddings are scored in one matrix-vector product
+      (see EmbeddingIndex), and route_many scores a batch of requests at once
+    - Category embeddings are computed in batches at initialization and can be
+      persisted in an EmbeddingStore shared across restarts and workers
 
     Example usage:
         # Initialize router with embedding model
@@ -47,6 +58,11 @@ class EmbeddingRouter(Router):
 
         # Route a request
         results = await router.route("My laptop keeps crashing")
+
+    Args:
+        embedding_store: Optional on-disk store of category embeddings, so
+            restarts and other workers reuse them instead of re-embedding.
+        max_concurrency: Most embedding calls in flight during initialization.
     """
 
     def __init__(
@@ -56,6 +72,8 @@ class EmbeddingRouter(Router):
         agents: List[Agent | AugmentedLLM] | None = None,
         functions: List[Callable] | None = None,
         context: Optional["Context"] = None,
+        embedding_store: EmbeddingStore | None = None,
+        max_concurrency: int = 4,
         **kwargs,
     ):
         super().__init__(
@@ -67,6 +85,11 @@ class EmbeddingRouter(Router):
         )
 
         self.embedding_model = embedding_model
+        self.embedding_store = embedding_store
+        self.max_concurrency = max_concurrency
+
+        # Normalised category embeddings, keyed by (group, category name)
+        self.index = EmbeddingIndex()
 
     @classmethod
     async def create(
@@ -76,6 +99,7 @@ class EmbeddingRouter(Router):
         agents: List[Agent | AugmentedLLM] | None = None,
         functions: List[Callable] | None = None,
         context: Optional["Context"] = None,
+        embedding_store: EmbeddingStore | None = None,
     ) -> "EmbeddingRouter":
         """
         Factory method to create and initialize a router.
@@ -87,6 +111,7 @@ class EmbeddingRouter(Router):
             agents=agents,
             functions=functions,
             context=context,
+            embedding_store=embedding_store,
         )
         await instance.initialize()
         return instance
@@ -94,18 +119,6 @@ class EmbeddingRouter(Router):
     async def initialize(self):
         """Initialize by computing embeddings for all categories"""
 
-        async def create_category_with_embedding(
-            category: RouterCategory,
-        ) -> EmbeddingRouterCategory:
-            # Get formatted text representation of category
-            category_text = self.format_category(category)
-            embedding = await self._compute_embedding([category_text])
-            category_with_embedding = EmbeddingRouterCategory(
-                **category.model_dump(), embedding=embedding
-            )
-
-            return category_with_embedding
-
         if self.initialized:
             return
 
@@ -113,22 +126,72 @@ class EmbeddingRouter(Router):
         await super().initialize()
         self.initialized = False  # We are not initialized yet
 
-        for name, category in self.server_categories.items():
-            category_with_embedding = await create_category_with_embedding(category)
-            self.server_categories[name] = category_with_embedding
-            self.categories[name] = category_with_embedding
+        # Embed every category text in as few batched calls as possible
+        self.index = EmbeddingIndex()
+        await self._add_categories(
+            [
+                (group, category)
+                for group, categories in self._category_groups().items()
+                for category in list(categories.values())
+            ]
+        )
 
-        for name, category in self.agent_categories.items():
-            category_with_embedding = await create_category_with_embedding(category)
-            self.agent_categories[name] = category_with_embedding
-            self.categories[name] = category_with_embedding
+        self.initialized = True
 
-        for name, category in self.function_categories.items():
-            category_with_embedding = await create_category_with_embedding(category)
-            self.function_categories[name] = category_with_embedding
-            self.categories[name] = category_with_embedding
+    async def add_server(self, server_name: str) -> None:
+        """Add an MCP server category without recomputing existing embeddings"""
+        if not self.initialized:
+            await self.initialize()
+        if server_name not in self.server_names:
+            self.server_names.append(server_name)
+        await self._add_categories([(SERVER_GROUP, self.get_server_category(server_name))])
 
-        self.initialized = True
+    async def add_agent(self, agent: Agent | AugmentedLLM) -> None:
+        """Add an agent category without recomputing existing embeddings"""
+        if not self.initialized:
+            await self.initialize()
+        if agent not in self.agents:
+            self.agents.append(agent)
+        await self._add_categories([(AGENT_GROUP, self.get_agent_category(agent))])
+
+    async def add_function(self, function: Callable) -> None:
+        """Add a function category without recomputing existing embeddings"""
+        if not self.initialized:
+            await self.initialize()
+        if function not in self.functions:
+            self.functions.append(function)
+        await self._add_categories(
+            [(FUNCTION_GROUP, self.get_function_category(function))]
+        )
+
+    def _category_groups(self) -> Dict[int, Dict[str, RouterCategory]]:
+        return {
+            SERVER_GROUP: self.server_categories,
+            AGENT_GROUP: self.agent_categories,
+            FUNCTION_GROUP: self.function_categories,
+        }
+
+    async def _add_categories(
+        self, categories: List[Tuple[int, RouterCategory]]
+    ) -> None:
+        """Embed categories and store them in their groups and the index"""
+        # Get formatted text representation of each category
+        category_texts = [self.format_category(category) for _, category in categories]
+        embeddings = await embed_batched(
+            self.embedding_model,
+            category_texts,
+            store=self.embedding_store,
+            max_concurrency=self.max_concurrency,
+        )
+
+        category_groups = self._category_groups()
+        for (group, category), embedding in zip(categories, embeddings):
+            category_with_embedding = EmbeddingRouterCategory(
+                **category.model_dump(), embedding=embedding
+            )
+            category_groups[group][category.name] = category_with_embedding
+            self.categories[category.name] = category_with_embedding
+            self.index.add((group, category.name), embedding, group=group)
 
     async def route(
         self, request: str, top_k: int = 1
@@ -187,6 +250,22 @@ class EmbeddingRouter(Router):
         )
         return [r.result for r in results[:top_k]]
 
+    async def route_many(
+        self, requests: List[str], top_k: int = 1
+    ) -> List[List[RouterResult[str | Agent | AugmentedLLM | Callable]]]:
+        """
+        Route a batch of requests with one embedding call and one
+        matrix-matrix product. Returns one result list per request.
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        if not requests:
+            return []
+
+        request_embeddings = await self.embedding_model.embed(requests)
+        return self._results_for(self.index.top_k_many(request_embeddings, top_k))
+
     async def _route_with_embedding(
         self,
         request: str,
@@ -195,41 +274,37 @@ class EmbeddingRouter(Router):
         include_agents: bool = True,
         include_functions: bool = True,
     ) -> List[RouterResult]:
-        def create_result(category: RouterCategory, request_embedding):
-            if category.embedding is None:
-                return None
-
-            similarity = compute_similarity_scores(
-                request_embedding, category.embedding
-            )
-
-            return RouterResult(
-                p_score=compute_confidence(similarity), result=category.category
-            )
-
         request_embedding = await self._compute_embedding([request])
 
-        results: List[RouterResult] = []
-        if include_servers:
-            for _, category in self.server_categories.items():
-                result = create_result(category, request_embedding)
-                if result:
-                    results.append(result)
-
-        if include_agents:
-            for _, category in self.agent_categories.items():
-                result = create_result(category, request_embedding)
-                if result:
-                    results.append(result)
-
-        if include_functions:
-            for _, category in self.function_categories.items():
-                result = create_result(category, request_embedding)
-                if result:
-                    results.append(result)
-
-        results.sort(key=lambda x: x.p_score, reverse=True)
-        return results[:top_k]
+        groups = None
+        if not (include_servers and include_agents and include_functions):
+            groups = [
+                group
+                for group, included in (
+                    (SERVER_GROUP, include_servers),
+                    (AGENT_GROUP, include_agents),
+                    (FUNCTION_GROUP, include_functions),
+                )
+                if included
+            ]
+
+        matches = self.index.top_k(request_embedding, top_k, groups=groups)
+        return self._results_for([matches])[0]
+
+    def _results_for(
+        self, matches: List[List[Tuple[Tuple[int, str], float]]]
+    ) -> List[List[RouterResult]]:
+        """Turn EmbeddingIndex matches into RouterResults"""
+        category_groups = self._category_groups()
+        return [
+            [
+                RouterResult(
+                    p_score=score, result=category_groups[group][name].category
+                )
+                for (group, name), score in row
+            ]
+            for row in matches
+        ]
 
     async def _compute_embedding(self, data: List[str]):
         # Get embedding for the provided text
@@ -0,0 +1,171 @@
+"""
+Tests for AsyncioExecutor.imap, the bounded worker pool behind map()
+"""
+
+import asyncio
+
+import pytest
+
+import mcp_agent.logging.logger  # noqa: F401  (import order: breaks a cycle)
+from mcp_agent.executor.executor import AsyncioExecutor, ExecutorConfig
+
+
+async def collect(iterator):
+    return [result async for result in iterator]
+
+
+def test_ordered_delivery_with_out_of_order_completion():
+    finished = []
+
+    async def work(item):
+        # Later items finish first
+        await asyncio.sleep((10 - item) * 0.005)
+        finished.append(item)
+        return item * 2
+
+    async def main():
+        executor = AsyncioExecutor()
+        ordered = await collect(executor.imap(work, range(10), concurrency=10))
+        unordered = await collect(
+            executor.imap(work, range(10), concurrency=10, ordered=False)
+        )
+        return ordered, unordered
+
+    ordered, unordered = asyncio.run(main())
+    assert finished[:10] != sorted(finished[:10])
+    assert ordered == [item * 2 for item in range(10)]
+    assert unordered == [item * 2 for item in finished[10:]]
+
+
+def test_in_flight_and_buffered_items_are_bounded():
+    pulled = 0
+    delivered = 0
+    high_water = 0
+
+    def inputs():
+        nonlocal pulled, high_water
+        for item in range(200):
+            pulled += 1
+            high_water = max(high_water, pulled - delivered)
+            yield item
+
+    async def work(item):
+        # Item 0 of every 20 is slow, so the results behind it pile up
+        await asyncio.sleep(0.01 if item % 20 == 0 else 0)
+        return item
+
+    async def main():
+        nonlocal delivered
+        executor = AsyncioExecutor()
+        results = []
+        async for result in executor.imap(work, inputs(), concurrency=4):
+            delivered += 1
+            results.append(result)
+        return results
+
+    assert asyncio.run(main()) == list(range(200))
+    assert high_water <= 4
+
+
+def test_concurrency_defaults_to_max_concurrent_activities():
+    running = 0
+    peak = 0
+
+    async def work(item):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return item
+
+    async def main():
+        executor = AsyncioExecutor(config=ExecutorConfig(max_concurrent_activities=3))
+        return await executor.map(work, list(range(30)))
+
+    assert asyncio.run(main()) == list(range(30))
+    assert peak == 3
+
+
+def test_timeout_yields_timeout_error():
+    async def work(item):
+        await asyncio.sleep(1 if item == 2 else 0)
+        return item
+
+    async def main():
+        executor = AsyncioExecutor()
+        return await collect(executor.imap(work, range(4), concurrency=4, timeout=0.05))
+
+    results = asyncio.run(main())
+    assert results[:2] == [0, 1] and results[3] == 3
+    assert isinstance(results[2], asyncio.TimeoutError)
+
+
+def test_cancel_on_error_cancels_remaining_workers():
+    cancelled = []
+
+    async def work(item):
+        if item == 1:
+            raise ValueError("boom")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+        return item
+
+    async def main():
+        executor = AsyncioExecutor()
+        with pytest.raises(ValueError, match="boom"):
+            await collect(
+                executor.imap(work, range(100), concurrency=4, cancel_on_error=True)
+            )
+
+    asyncio.run(asyncio.wait_for(main(), 5))
+    assert sorted(cancelled) == [0, 2, 3]
+
+
+def test_closing_early_cancels_workers():
+    pulled = []
+    cancelled = []
+
+    def inputs():
+        for item in range(100):
+            pulled.append(item)
+            yield item
+
+    async def work(item):
+        try:
+            await asyncio.sleep(0 if item == 0 else 10)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+        return item
+
+    async def main():
+        executor = AsyncioExecutor()
+        results = executor.imap(work, inputs(), concurrency=3)
+        first = await results.__anext__()
+        await results.aclose()
+        return first
+
+    assert asyncio.run(asyncio.wait_for(main(), 5)) == 0
+    assert len(pulled) <= 4
+    assert sorted(cancelled) == sorted(pulled[1:])
+
+
+def test_async_iterable_inputs():
+    async def inputs():
+        for item in range(50):
+            await asyncio.sleep(0)
+            yield item
+
+    async def work(item):
+        await asyncio.sleep(0.001 * (item % 3))
+        return item + 1
+
+    async def main():
+        executor = AsyncioExecutor()
+        return await collect(executor.imap(work, inputs(), concurrency=8))
+
+    assert asyncio.run(main()) == list(range(1, 51))
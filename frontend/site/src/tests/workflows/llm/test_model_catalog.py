@@ -0,0 +1,222 @@
+"""
+Equivalence tests for the model catalogue index
+
+TokenCounter.find_model_info and ModelSelector's hint matching look names up
+in a ModelCatalog instead of scoring every catalogue entry. The oracles below
+are the linear scans they replaced; both must agree on every query built
+from the bundled catalogue, including which of several equally scored models
+wins.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+import mcp_agent.logging.logger  # noqa: F401  (import order: breaks a cycle)
+from mcp.types import ModelHint
+from mcp_agent.tracing.token_counter import TokenCounter
+from mcp_agent.workflows.llm.llm_selector import (
+    ModelInfo,
+    ModelSelector,
+    load_default_models,
+)
+from mcp_agent.workflows.llm.model_catalog import ModelCatalog
+
+
+def _score(model_name: str, known_name: str) -> float:
+    """The fuzzy score of the linear scan"""
+    if model_name.lower() == known_name:
+        return 1000
+    if known_name.startswith(model_name.lower()):
+        return 500 + (len(model_name) / len(known_name) * 100)
+    if model_name.lower() in known_name:
+        return len(model_name) / len(known_name) * 100
+    if known_name in model_name.lower():
+        return len(known_name) / len(model_name) * 50
+    return 0
+
+
+def linear_find_model_info(
+    model_lookup: Dict[Tuple[str, str], ModelInfo],
+    models_by_provider: Dict[str, Dict[str, ModelInfo]],
+    model_name: str,
+    provider: Optional[str] = None,
+) -> Optional[ModelInfo]:
+    """find_model_info as it was before the index, without its cache"""
+    nl = (model_name or "").lower()
+    candidates = []
+    if nl:
+        candidates.append(nl)
+        if "/" in nl:
+            candidates.append(nl.rsplit("/", 1)[-1])
+        if provider and nl.startswith(provider.lower() + "_"):
+            candidates.append(nl[len(provider) + 1 :])
+    candidates = list(dict.fromkeys(candidates))
+
+    if provider:
+        for candidate in candidates:
+            model = model_lookup.get((provider.lower(), candidate))
+            if model:
+                return model
+
+    provider_models = models_by_provider.get(provider) if provider else None
+    if provider and not provider_models:
+        for key, models in models_by_provider.items():
+            if key.lower() == provider.lower():
+                provider_models = models
+                break
+
+    if provider_models:
+        for candidate in candidates:
+            if candidate in provider_models:
+                return provider_models[candidate]
+
+        best_match, best_match_score = None, 0
+        for known_name, known_model in provider_models.items():
+            score = _score(model_name, known_name)
+            if score > best_match_score:
+                best_match, best_match_score = known_model, score
+        if best_match:
+            return best_match
+
+    best_match, best_match_score = None, 0
+    for (_, known_name), known_model in model_lookup.items():
+        score = _score(model_name, known_name)
+        if score > 0 and provider and provider.lower() in known_model.provider.lower():
+            score += 50
+        if score > best_match_score:
+            best_match, best_match_score = known_model, score
+    return best_match
+
+
+def linear_check_model_hint(model: ModelInfo, hint: ModelHint) -> bool:
+    """ModelSelector._check_model_hint as it was before the index"""
+    desired_name: Optional[str] = hint.name
+    desired_provider: Optional[str] = getattr(hint, "provider", None)
+    if desired_name and ":" in desired_name and not desired_provider:
+        lhs, rhs = desired_name.split(":", 1)
+        if lhs.strip() and rhs.strip():
+            desired_provider, desired_name = lhs.strip(), rhs.strip()
+
+    name_match = True
+    if desired_name:
+        dn, mn = desired_name.lower(), (model.name or "").lower()
+        name_match = dn == mn or dn in mn or mn in dn
+
+    provider_match = True
+    if desired_provider:
+        provider_match = desired_provider.lower() == (model.provider or "").lower()
+    return name_match and provider_match
+
+
+def name_queries(name: str) -> List[str]:
+    """Exact, truncated, infix, upper-cased and date-stamped forms of a name"""
+    queries = [name, name.upper(), f"{name}-2024-11-20", f"{name}-20250219"]
+    for length in {1, 3, len(name) // 2, len(name) - 1}:
+        if 0 < length < len(name):
+            queries.append(name[:length])
+    if len(name) > 4:
+        queries.append(name[1:-1])
+        queries.append(name[len(name) // 3 : 2 * len(name) // 3 + 1])
+    return queries
+
+
+@pytest.fixture(scope="module")
+def models() -> List[ModelInfo]:
+    return load_default_models()
+
+
+@pytest.fixture(scope="module")
+def queries(models) -> List[str]:
+    names = dict.fromkeys(model.name for model in models)
+    queries = [""]
+    for name in names:
+        queries.extend(name_queries(name))
+    # Names no catalogue entry is related to
+    queries.extend(["no-such-model", "x"])
+    return list(dict.fromkeys(queries))
+
+
+def test_find_model_info_matches_linear_scan(models, queries):
+    counter = TokenCounter()
+    providers = sorted({model.provider for model in models})
+    # The model's own provider, another provider, an upper-cased provider
+    # (boosted by substring), a provider prefix and an unknown provider
+    provider_options = [None, "unknown-provider"] + providers + [
+        providers[0].upper(),
+        "google",
+        "azure",
+    ]
+
+    mismatches = []
+    for i, query in enumerate(queries):
+        for provider in (None, provider_options[i % len(provider_options)], "OpenAI"):
+            expected = linear_find_model_info(
+                counter._model_lookup, counter._models_by_provider, query, provider
+            )
+            counter._model_cache.clear()
+            actual = counter.find_model_info(query, provider)
+            if actual is not expected:
+                mismatches.append((query, provider, expected, actual))
+
+    assert not mismatches, mismatches[:5]
+
+
+def test_provider_prefixed_names_match_linear_scan(models):
+    counter = TokenCounter()
+    for model in models[::7]:
+        for query, provider in (
+            (f"{model.provider}/{model.name}", None),
+            (f"{model.provider.lower()}_{model.name}", model.provider),
+            (model.name, model.provider.lower()),
+        ):
+            expected = linear_find_model_info(
+                counter._model_lookup, counter._models_by_provider, query, provider
+            )
+            assert counter.find_model_info(query, provider) is expected, (query, provider)
+
+
+def test_prefix_outranks_substring_and_ties_keep_catalogue_order(models):
+    def model(name: str, provider: str) -> ModelInfo:
+        return models[0].model_copy(update={"name": name, "provider": provider})
+
+    entries = [
+        model("xgpt-4o", "A"),
+        model("gpt-4o-bbbb", "B"),
+        model("gpt-4o-aaaa", "B"),
+        model("gpt-4o-mini-long-name", "A"),
+    ]
+    catalog = ModelCatalog((entry.name, entry) for entry in entries)
+    lookup = {(entry.provider.lower(), entry.name.lower()): entry for entry in entries}
+
+    for query, provider in (
+        ("gpt-4o", None),
+        ("gpt-4o", "A"),
+        ("GPT-4O-MINI", None),
+        ("4o", "A"),
+        ("gpt-4o-bbbb-2024-11-20", None),
+    ):
+        expected = linear_find_model_info(lookup, {}, query, provider)
+        assert catalog.best_match(query, provider) is expected, (query, provider)
+
+    # A boosted substring match never beats a prefix match; the boost only
+    # decides between prefix matches
+    assert catalog.best_match("gpt-4o", "A").name == "gpt-4o-mini-long-name"
+    # Equal scores: the earlier catalogue entry wins
+    assert catalog.best_match("gpt-4o").name == "gpt-4o-bbbb"
+
+
+def test_model_hints_match_linear_check(models, queries):
+    selector = ModelSelector()
+    hint_names = queries[::3] + ["OpenAI:gpt-4o", "anthropic:claude", " : gpt", "gpt:"]
+    hints = [ModelHint(name=name) for name in hint_names]
+
+    mismatches = []
+    for hint in hints:
+        matching = selector._hint_matching_names(hint)
+        for model in models:
+            expected = linear_check_model_hint(model, hint)
+            if selector._check_model_hint(model, hint, matching) != expected:
+                mismatches.append((hint.name, model.provider, model.name, expected))
+
+    assert not mismatches, mismatches[:5]
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of per-request authentication overhead
+
+Times the gateway's `authenticate` dependency for API-key and JWT requests
+and compares it with the previous implementation, which re-read and split
+VALID_API_KEYS and fully decoded the JWT on every call. The dependency is
+called directly so the numbers exclude HTTP and routing costs.
+
+Results are printed as JSON (microseconds per call). Usage (from the gateway
+directory):
+    python benchmarks/bench_auth.py --iterations 20000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from common import GATEWAY_DIR
+
+sys.path.insert(0, GATEWAY_DIR)
+os.environ.setdefault("VALID_API_KEYS", ",".join(f"key-{i:04d}" for i in range(50)))
+
+import gateway  # noqa: E402
+
+
+def legacy_authenticate(bearer_token, api_key):
+    """The pre-cache authentication path, kept for comparison"""
+    if api_key:
+        valid_api_keys = os.getenv("VALID_API_KEYS", "dev-api-key-1,dev-api-key-2").split(",")
+        if api_key in valid_api_keys:
+            return {"auth_type": "api_key", "api_key": api_key}
+    if bearer_token:
+        payload = jwt.decode(bearer_token.credentials, gateway.API_SECRET_KEY, algorithms=[gateway.JWT_ALGORITHM])
+        return {"auth_type": "jwt", "username": payload["sub"]}
+    raise HTTPException(status_code=401)
+
+
+def time_calls(func, iterations: int) -> float:
+    """Return microseconds per call"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    
+    api_key = os.environ["VALID_API_KEYS"].split(",")[-1]
+    token = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=gateway.create_access_token({"sub": "bench-user"})
+    )
+    loop = asyncio.new_event_loop()
+    
+    def current(bearer, key):
+        return lambda: loop.run_until_complete(gateway.authenticate(bearer, key))
+    
+    def legacy(bearer, key):
+        async def call():
+            return legacy_authenticate(bearer, key)
+        return lambda: loop.run_until_complete(call())
+    
+    # Baseline for the event loop round trip shared by both variants
+    async def noop():
+        return None
+    loop_overhead = time_calls(lambda: loop.run_until_complete(noop()), args.iterations)
+    
+    report = {"iterations": args.iterations, "api_keys_configured": len(gateway.api_key_registry), "results_us": {}}
+    for name, bearer, key in (("api_key", None, api_key), ("jwt", token, None)):
+        before = time_calls(legacy(bearer, key), args.iterations) - loop_overhead
+        after = time_calls(current(bearer, key), args.iterations) - loop_overhead
+        report["results_us"][name] = {
+            "before": round(before, 2),
+            "after": round(after, 2),
+            "speedup": round(before / after, 1) if after > 0 else None,
+        }
+    loop.close()
+    
+    json.dump(report, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Load test of the gateway's proxy routes against a stub upstream
+
+Starts the stub upstream (with STUB_LATENCY_MS / STUB_RESPONSE_BYTES set from
+the command line) and a gateway process pointing every microservice at it.
+Each selected route is then driven in turn by `--concurrency` closed-loop
+clients for `--duration` seconds, after a short warm-up. Per route the
+benchmark reports:
+
+- rps: completed requests per second
+- latency_ms: p50, p95, p99 and max client-observed latency
+- error_rate: share of requests that raised or returned a non-2xx status
+- peak_rss_mb: the gateway's highest resident set size while the route ran
+
+plus the gateway's overall peak RSS (VmHWM). Rate limiting is disabled and
+/research bodies are unique per request (so every call reaches the upstream)
+unless --research-cache-hits is given.
+
+Results are printed as JSON, or written to --output. Usage (from the gateway
+directory):
+    python benchmarks/bench_load.py --concurrency 32 --duration 10
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import sys
+import time
+
+import httpx
+
+from common import GATEWAY_DIR, BENCHMARKS_DIR, free_port, start_server, stop_server, memory_kb
+
+ROUTES = ("upload", "generate-listing", "syndicate", "research")
+BOUNDARY = "loadboundary5c1e"
+
+
+def percentile(ordered: list, pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples"""
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def upload_body(files: int, file_size: int) -> bytes:
+    """A multipart body of `files` images, built once and reused"""
+    parts = []
+    for index in range(files):
+        parts.append(
+            f"--{BOUNDARY}\r\n"
+            f'Content-Disposition: form-data; name="files"; filename="image-{index}.jpg"\r\n'
+            "Content-Type: image/jpeg\r\n\r\n".encode()
+            + b"\x00" * file_size
+            + b"\r\n"
+        )
+    parts.append(f"--{BOUNDARY}--\r\n".encode())
+    return b"".join(parts)
+
+
+def request_factory(route: str, args):
+    """Return a function building the keyword arguments for the next request"""
+    headers = {"X-API-Key": args.api_key}
+    if route == "upload":
+        body = upload_body(args.upload_files, args.upload_file_kb * 1024)
+        upload_headers = {**headers, "Content-Type": f"multipart/form-data; boundary={BOUNDARY}"}
+        return lambda: {"content": body, "headers": upload_headers}
+    if route == "generate-listing":
+        payload = {"images": ["https://example.com/item.jpg"], "title": "Vintage denim jacket"}
+        return lambda: {"json": payload, "headers": headers}
+    if route == "syndicate":
+        payload = {"listings": [{"sku": f"SKU-{i}", "price": 19.99} for i in range(args.syndicate_listings)]}
+        return lambda: {"json": payload, "headers": headers}
+    counter = itertools.count()
+    if args.research_cache_hits:
+        return lambda: {"json": {"keywords": "denim jacket"}, "headers": headers}
+    return lambda: {"json": {"keywords": "denim jacket", "n": next(counter)}, "headers": headers}
+
+
+async def sample_rss(pid: int, peak: list, interval: float = 0.05):
+    """Track the highest VmRSS seen in peak[0] until cancelled"""
+    while True:
+        rss = memory_kb(pid, "VmRSS")
+        if rss and rss > peak[0]:
+            peak[0] = rss
+        await asyncio.sleep(interval)
+
+
+async def run_route(base: str, route: str, pid: int, args) -> dict:
+    url = f"{base}/{route}"
+    next_request = request_factory(route, args)
+    latencies = []
+    errors = 0
+    status_codes = {}
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+        async def worker(deadline: float, record: bool):
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(url, **next_request())
+                    code = str(response.status_code)
+                    ok = response.is_success
+                except httpx.HTTPError as e:
+                    code = type(e).__name__
+                    ok = False
+                if record:
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    status_codes[code] = status_codes.get(code, 0) + 1
+                    errors += not ok
+
+        if args.warmup:
+            deadline = time.perf_counter() + args.warmup
+            await asyncio.gather(*(worker(deadline, False) for _ in range(args.concurrency)))
+
+        peak = [memory_kb(pid, "VmRSS") or 0]
+        sampler = asyncio.create_task(sample_rss(pid, peak))
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(worker(deadline, True) for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+        sampler.cancel()
+
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "rps": round(len(ordered) / elapsed, 1),
+        "error_rate": round(errors / len(ordered), 4) if ordered else None,
+        "status_codes": status_codes,
+        "latency_ms": {
+            "p50": round(percentile(ordered, 50), 2),
+            "p95": round(percentile(ordered, 95), 2),
+            "p99": round(percentile(ordered, 99), 2),
+            "max": round(ordered[-1], 2),
+        } if ordered else None,
+        "peak_rss_mb": round(peak[0] / 1024, 1) if peak[0] else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--routes", default=",".join(ROUTES), help="comma-separated routes to drive")
+    parser.add_argument("--concurrency", type=int, default=32, help="closed-loop clients per route")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds per route")
+    parser.add_argument("--warmup", type=float, default=1.0, help="unmeasured seconds per route")
+    parser.add_argument("--timeout", type=float, default=30.0, help="client timeout per request")
+    parser.add_argument("--upstream-latency-ms", type=float, default=20.0, help="stub upstream delay")
+    parser.add_argument("--response-bytes", type=int, default=1024, help="stub upstream response padding")
+    parser.add_argument("--upload-files", type=int, default=4, help="images per /upload request")
+    parser.add_argument("--upload-file-kb", type=int, default=64, help="size of each uploaded image")
+    parser.add_argument("--syndicate-listings", type=int, default=25, help="listings per /syndicate request")
+    parser.add_argument("--research-cache-hits", action="store_true", help="repeat one /research body")
+    parser.add_argument("--api-key", default="dev-api-key-1")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    routes = [route.strip() for route in args.routes.split(",") if route.strip()]
+    unknown = set(routes) - set(ROUTES)
+    if unknown:
+        parser.error(f"unknown routes: {', '.join(sorted(unknown))}")
+
+    upstream_port = free_port()
+    upstream = start_server("stub_upstream:app", BENCHMARKS_DIR, upstream_port, env={
+        "STUB_LATENCY_MS": str(args.upstream_latency_ms),
+        "STUB_RESPONSE_BYTES": str(args.response_bytes),
+    })
+    stub = f"http://127.0.0.1:{upstream_port}"
+    report = {"config": vars(args), "routes": {}}
+    try:
+        port = free_port()
+        gateway = start_server("gateway:app", GATEWAY_DIR, port, env={
+            "UPLOAD_SERVICE_URL": f"{stub}/api/analyze-images",
+            "GENERATE_LISTING_SERVICE_URL": f"{stub}/api/insights",
+            "SYNDICATE_SERVICE_URL": f"{stub}/api/bulk-upload-ebay",
+            "RESEARCH_SERVICE_URL": f"{stub}/api/ebay/str",
+            "RATE_LIMIT_ENABLED": "false",
+            "UPSTREAM_MAX_CONNECTIONS": str(max(args.concurrency, 100)),
+        })
+        try:
+            for route in routes:
+                report["routes"][route] = asyncio.run(
+                    run_route(f"http://127.0.0.1:{port}", route, gateway.pid, args)
+                )
+            peak_kb = memory_kb(gateway.pid, "VmHWM")
+            report["peak_rss_mb"] = round(peak_kb / 1024, 1) if peak_kb else None
+        finally:
+            stop_server(gateway)
+    finally:
+        stop_server(upstream)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
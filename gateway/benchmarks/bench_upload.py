@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark /upload: streaming multipart relay vs buffered proxying
+
+Starts the stub upstream and, for each upload mode, a gateway process with
+UPLOAD_STREAMING set accordingly. A client then uploads a bulk listing's
+worth of images at a paced rate (to mimic a real client link) and the
+benchmark reports, per mode:
+
+- peak_rss_mb: the gateway's peak resident set size (VmHWM)
+- rss_growth_mb: peak RSS minus RSS after startup
+- upstream_ttfb_ms: time from the start of the client upload until the
+  upload service receives the first body byte
+- total_ms: full request latency as seen by the client
+
+Results are printed as JSON. Usage (from the gateway directory):
+    python benchmarks/bench_upload.py --files 24 --file-size-kb 2048
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+import httpx
+
+from common import GATEWAY_DIR, BENCHMARKS_DIR, free_port, start_server, stop_server, memory_kb
+
+BOUNDARY = "benchboundary7f3a"
+
+
+async def multipart_body(files: int, file_size: int, chunk_size: int, delay: float):
+    """Yield a multipart body of `files` images, pacing chunks by `delay`"""
+    chunk = b"\x00" * chunk_size
+    for index in range(files):
+        yield (
+            f"--{BOUNDARY}\r\n"
+            f'Content-Disposition: form-data; name="files"; filename="image-{index}.jpg"\r\n'
+            "Content-Type: image/jpeg\r\n\r\n"
+        ).encode()
+        remaining = file_size
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            yield chunk[:size]
+            remaining -= size
+            if delay:
+                await asyncio.sleep(delay)
+        yield b"\r\n"
+    yield f"--{BOUNDARY}--\r\n".encode()
+
+
+async def upload_once(client: httpx.AsyncClient, url: str, args) -> dict:
+    started = time.time()
+    response = await client.post(
+        url,
+        content=multipart_body(args.files, args.file_size_kb * 1024, args.chunk_kb * 1024, args.client_delay_ms / 1000),
+        headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}", "X-API-Key": args.api_key},
+    )
+    finished = time.time()
+    response.raise_for_status()
+    body = response.json()
+    return {
+        "upstream_ttfb_ms": (body["first_byte_at"] - started) * 1000,
+        "total_ms": (finished - started) * 1000,
+        "bytes_forwarded": body["bytes_received"],
+    }
+
+
+async def run_mode(url: str, args) -> list:
+    results = []
+    async with httpx.AsyncClient(timeout=300) as client:
+        for _ in range(args.repeat):
+            batch = await asyncio.gather(*(upload_once(client, url, args) for _ in range(args.concurrency)))
+            results.extend(batch)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, default=24, help="images per upload")
+    parser.add_argument("--file-size-kb", type=int, default=1024, help="size of each image")
+    parser.add_argument("--chunk-kb", type=int, default=64, help="client write size")
+    parser.add_argument("--client-delay-ms", type=float, default=1.0, help="pause between client chunks")
+    parser.add_argument("--concurrency", type=int, default=4, help="simultaneous uploads")
+    parser.add_argument("--repeat", type=int, default=3, help="rounds of concurrent uploads")
+    parser.add_argument("--api-key", default="dev-api-key-1")
+    args = parser.parse_args()
+    
+    upstream_port = free_port()
+    upstream = start_server("stub_upstream:app", BENCHMARKS_DIR, upstream_port)
+    report = {"config": vars(args), "modes": {}}
+    try:
+        for mode in ("buffered", "streaming"):
+            port = free_port()
+            gateway = start_server("gateway:app", GATEWAY_DIR, port, env={
+                "UPLOAD_STREAMING": "true" if mode == "streaming" else "false",
+                "UPLOAD_SERVICE_URL": f"http://127.0.0.1:{upstream_port}/api/analyze-images",
+                "UPLOAD_MAX_BODY_BYTES": str(10 * 1024 ** 3),
+            })
+            try:
+                baseline_kb = memory_kb(gateway.pid, "VmRSS")
+                results = asyncio.run(run_mode(f"http://127.0.0.1:{port}/upload", args))
+                peak_kb = memory_kb(gateway.pid, "VmHWM")
+            finally:
+                stop_server(gateway)
+            
+            ttfb = [r["upstream_ttfb_ms"] for r in results]
+            total = [r["total_ms"] for r in results]
+            report["modes"][mode] = {
+                "requests": len(results),
+                "peak_rss_mb": round(peak_kb / 1024, 1) if peak_kb else None,
+                "rss_growth_mb": round((peak_kb - baseline_kb) / 1024, 1) if peak_kb and baseline_kb else None,
+                "upstream_ttfb_ms": {"median": round(statistics.median(ttfb), 1), "max": round(max(ttfb), 1)},
+                "total_ms": {"median": round(statistics.median(total), 1), "max": round(max(total), 1)},
+            }
+    finally:
+        stop_server(upstream)
+    
+    json.dump(report, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Process helpers shared by the gateway benchmarks
+
+Benchmarks run the gateway and the stub upstream as separate uvicorn
+processes so that memory and latency measurements reflect a real deployment
+rather than an in-process test client.
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+import httpx
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+GATEWAY_DIR = os.path.dirname(BENCHMARKS_DIR)
+
+
+def free_port() -> int:
+    """Ask the OS for an unused local TCP port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(
+    app: str,
+    app_dir: str,
+    port: int,
+    env: Optional[Dict[str, str]] = None,
+    health_path: str = "/health",
+    timeout: float = 15.0,
+) -> subprocess.Popen:
+    """Start a uvicorn server in a subprocess and wait until it is healthy"""
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", app,
+            "--app-dir", app_dir,
+            "--host", "127.0.0.1",
+            "--port", str(port),
+            "--log-level", "warning",
+        ],
+        env={**os.environ, **(env or {})},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{app} exited with code {process.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}{health_path}", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    stop_server(process)
+    raise RuntimeError(f"{app} did not become healthy within {timeout}s")
+
+
+@contextmanager
+def serve_in_thread(app, port: int) -> Iterator[str]:
+    """
+    Run an ASGI app with uvicorn on a background thread
+
+    Used by tests that need a real local upstream without a subprocess.
+    Yields the server's base URL.
+    """
+    import uvicorn
+    
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline or not thread.is_alive():
+            raise RuntimeError("stub server did not start")
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+
+
+def stop_server(process: subprocess.Popen):
+    """Terminate a server started with start_server"""
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def memory_kb(pid: int, field: str = "VmHWM") -> Optional[int]:
+    """
+    Read a memory counter for a process from /proc (Linux only)
+
+    VmHWM is the peak resident set size, VmRSS the current one.
+    """
+    try:
+        with open(f"/proc/{pid}/status") as status_file:
+            for line in status_file:
+                if line.startswith(f"{field}:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
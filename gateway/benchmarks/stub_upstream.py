@@ -0,0 +1,97 @@
+"""
+Stub upstream microservice for gateway benchmarks
+
+A minimal Starlette app that stands in for the html-tool microservices
+(analyze-images, insights, bulk-upload-ebay, ebay/str). Every POST path is
+accepted, the request body is drained as a stream and a JSON body is
+returned after an optional delay.
+
+Behaviour is controlled with environment variables:
+- STUB_LATENCY_MS: delay before responding (default 0)
+- STUB_RESPONSE_BYTES: size of the padding field in the response (default 0)
+
+Faults can be injected at runtime for resilience tests:
+- POST /__faults {"fail_next": 3, "status": 503} fails the next 3 requests
+- POST /__faults {"slow_next": 1, "slow_ms": 500} delays the next request
+- POST /__faults {"fail_rate": 0.2} fails a random share of requests
+- POST /__faults {} clears all faults
+- GET /__stats returns the number of requests and health checks handled
+
+Run standalone:
+    uvicorn stub_upstream:app --app-dir benchmarks --port 3000
+"""
+
+import asyncio
+import os
+import random
+import time
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+STUB_LATENCY_MS = float(os.getenv("STUB_LATENCY_MS", "0"))
+STUB_RESPONSE_BYTES = int(os.getenv("STUB_RESPONSE_BYTES", "0"))
+
+
+# Runtime fault injection state (see module docstring)
+faults = {}
+stats = {"requests": 0, "health_checks": 0}
+
+
+def _take(name: str) -> bool:
+    """Consume one use of a counted fault"""
+    if faults.get(name, 0) > 0:
+        faults[name] -= 1
+        return True
+    return False
+
+
+async def handle(request: Request) -> JSONResponse:
+    """Drain the body, record when its first byte arrived and respond"""
+    stats["requests"] += 1
+    if _take("fail_next") or random.random() < faults.get("fail_rate", 0):
+        return JSONResponse({"error": "injected fault"}, status_code=faults.get("status", 503))
+    if _take("slow_next"):
+        await asyncio.sleep(faults.get("slow_ms", 1000) / 1000)
+    
+    first_byte_at = None
+    bytes_received = 0
+    async for chunk in request.stream():
+        if chunk and first_byte_at is None:
+            first_byte_at = time.time()
+        bytes_received += len(chunk)
+    
+    if STUB_LATENCY_MS:
+        await asyncio.sleep(STUB_LATENCY_MS / 1000)
+    
+    return JSONResponse({
+        "path": request.url.path,
+        "bytes_received": bytes_received,
+        "first_byte_at": first_byte_at,
+        "padding": "x" * STUB_RESPONSE_BYTES,
+    })
+
+
+async def health(request: Request) -> JSONResponse:
+    stats["health_checks"] += 1
+    return JSONResponse({"status": "healthy"})
+
+
+async def set_faults(request: Request) -> JSONResponse:
+    faults.clear()
+    faults.update(await request.json())
+    return JSONResponse(faults)
+
+
+async def get_stats(request: Request) -> JSONResponse:
+    return JSONResponse(stats)
+
+
+app = Starlette(routes=[
+    Route("/health", health, methods=["GET"]),
+    Route("/__faults", set_faults, methods=["POST"]),
+    Route("/__stats", get_stats, methods=["GET"]),
+    Route("/{path:path}", handle, methods=["GET", "POST"]),
+])
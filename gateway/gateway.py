@@ -17,17 +17,36 @@ CLOUD SCALING NOTES (Google Cloud Run):
 """
 
 import os
+import sys
 import time
+import queue
+import random
 import logging
 import json
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
-
-from fastapi import FastAPI, Request, HTTPException, Depends, status, UploadFile, File, Form
+import math
+import secrets
+import signal
+import asyncio
+import hashlib
+import hmac
+import ipaddress
+import socket
+import sqlite3
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from typing import Optional, Dict, Any, AsyncIterator, Awaitable, Callable, List, Tuple
+from urllib.parse import urlparse
+from datetime import datetime, timedelta, timezone
+
+from fastapi import FastAPI, Request, HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials, APIKeyHeader
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import httpx
+import multipart
+from multipart.multipart import parse_options_header
 from jose import JWTError, jwt
 from pydantic import BaseModel, Field
 
@@ -41,6 +60,17 @@ API_SECRET_KEY = os.getenv("API_SECRET_KEY", "dev-secret-key-change-in-productio
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
 
+# Authentication fast path
+# VALID_API_KEYS_FILE (one key per line, e.g. a mounted Secret Manager
+# secret) takes precedence over VALID_API_KEYS. Keys are reloaded on SIGHUP
+# and, if API_KEYS_RELOAD_INTERVAL > 0, every that many seconds.
+VALID_API_KEYS_FILE = os.getenv("VALID_API_KEYS_FILE")
+API_KEYS_RELOAD_INTERVAL = float(os.getenv("API_KEYS_RELOAD_INTERVAL", "0"))
+# Verified JWTs are cached (by digest) until they expire, capped at
+# JWT_CACHE_MAX_AGE seconds
+JWT_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", "4096"))
+JWT_CACHE_MAX_AGE = float(os.getenv("JWT_CACHE_MAX_AGE", "300"))
+
 # Internal microservice endpoints (composable structure)
 # CLOUD SCALING NOTE: In production, these should point to:
 # - Internal service URLs within the same VPC/network
@@ -57,6 +87,124 @@ MICROSERVICE_ENDPOINTS = {
 # Timeout for proxied requests
 REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))
 
+# Per-upstream timeouts (seconds). Syndication talks to eBay bulk APIs and
+# gets a longer default.
+UPSTREAM_TIMEOUTS = {
+    "upload": float(os.getenv("UPLOAD_SERVICE_TIMEOUT", REQUEST_TIMEOUT)),
+    "generate_listing": float(os.getenv("GENERATE_LISTING_SERVICE_TIMEOUT", REQUEST_TIMEOUT)),
+    "syndicate": float(os.getenv("SYNDICATE_SERVICE_TIMEOUT", REQUEST_TIMEOUT * 2)),
+    "research": float(os.getenv("RESEARCH_SERVICE_TIMEOUT", REQUEST_TIMEOUT)),
+}
+
+# Keep-alive connection pool limits, applied to each upstream client
+# CLOUD SCALING NOTE: Keep UPSTREAM_MAX_CONNECTIONS at or above the Cloud Run
+# concurrency setting so requests do not queue for a free connection
+UPSTREAM_MAX_CONNECTIONS = int(os.getenv("UPSTREAM_MAX_CONNECTIONS", "100"))
+UPSTREAM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("UPSTREAM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+UPSTREAM_KEEPALIVE_EXPIRY = float(os.getenv("UPSTREAM_KEEPALIVE_EXPIRY", "30"))
+
+# HTTP/2 is negotiated via ALPN, so it only applies to https:// upstreams
+# that support it. Requires the optional "h2" package (httpx[http2]).
+UPSTREAM_HTTP2 = os.getenv("UPSTREAM_HTTP2", "true").lower() == "true"
+
+# Upstream resilience
+# Routes safe to send twice. Only these are retried after the request may
+# have reached the upstream (5xx / read timeout) or hedged; syndication
+# creates eBay listings, so it is only retried when the connection failed.
+UPSTREAM_IDEMPOTENT = {
+    "upload": True,
+    "generate_listing": True,
+    "syndicate": False,
+    "research": True,
+}
+UPSTREAM_MAX_RETRIES = int(os.getenv("UPSTREAM_MAX_RETRIES", "2"))
+UPSTREAM_RETRY_BACKOFF = float(os.getenv("UPSTREAM_RETRY_BACKOFF", "0.1"))
+UPSTREAM_RETRY_BACKOFF_MAX = float(os.getenv("UPSTREAM_RETRY_BACKOFF_MAX", "2"))
+# Retries and hedges may use at most this share of an upstream's traffic,
+# plus a small reserve for low-traffic periods
+UPSTREAM_RETRY_BUDGET_RATIO = float(os.getenv("UPSTREAM_RETRY_BUDGET_RATIO", "0.2"))
+UPSTREAM_RETRY_BUDGET_RESERVE = float(os.getenv("UPSTREAM_RETRY_BUDGET_RESERVE", "10"))
+# Circuit breaker: open after N consecutive failures, probe again after the
+# reset timeout (seconds)
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_TIMEOUT = float(os.getenv("BREAKER_RESET_TIMEOUT", "30"))
+# Hedged requests (idempotent routes only): send a second copy if the first
+# has not answered within this many seconds (0 disables)
+UPSTREAM_HEDGE_DELAYS = {
+    "upload": float(os.getenv("UPLOAD_SERVICE_HEDGE_DELAY", "0")),
+    "generate_listing": float(os.getenv("GENERATE_LISTING_SERVICE_HEDGE_DELAY", "0")),
+    "research": float(os.getenv("RESEARCH_SERVICE_HEDGE_DELAY", "0")),
+}
+
+# Background upstream health monitor. Every HEALTH_CHECK_INTERVAL seconds all
+# upstreams are probed concurrently at <origin>HEALTH_CHECK_PATH (override per
+# upstream with <NAME>_SERVICE_HEALTH_URL); /status and /health read the cached
+# results. Latency percentiles cover the last HEALTH_LATENCY_WINDOW probes.
+HEALTH_CHECK_INTERVAL = float(os.getenv("HEALTH_CHECK_INTERVAL", "15"))
+HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", "2"))
+HEALTH_CHECK_PATH = os.getenv("HEALTH_CHECK_PATH", "/health")
+HEALTH_LATENCY_WINDOW = int(os.getenv("HEALTH_LATENCY_WINDOW", "60"))
+UPSTREAM_HEALTH_URLS = {
+    "upload": os.getenv("UPLOAD_SERVICE_HEALTH_URL"),
+    "generate_listing": os.getenv("GENERATE_LISTING_SERVICE_HEALTH_URL"),
+    "syndicate": os.getenv("SYNDICATE_SERVICE_HEALTH_URL"),
+    "research": os.getenv("RESEARCH_SERVICE_HEALTH_URL"),
+}
+
+# Upload proxying: stream the multipart body to the upload service part by
+# part instead of buffering every image in memory first
+UPLOAD_STREAMING = os.getenv("UPLOAD_STREAMING", "true").lower() == "true"
+UPLOAD_MAX_BODY_BYTES = int(os.getenv("UPLOAD_MAX_BODY_BYTES", str(100 * 1024 * 1024)))
+
+# Gateway-side response cache. Per-route TTLs in seconds (0 disables caching
+# for that route); bounds apply to the in-process backend.
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")  # "memory" or "redis"
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+CACHE_ROUTE_TTLS = {
+    "research": float(os.getenv("RESEARCH_CACHE_TTL", "300")),
+}
+
+# Per-tenant, per-route rate limiting. Each limit is
+# "<requests per second>,<burst>,<max in flight>"; 0 disables that part.
+# Override per route with RATE_LIMIT_<ROUTE>, e.g. RATE_LIMIT_SYNDICATE=0.5,5,2
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")  # "memory" or "redis"
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL", CACHE_REDIS_URL)
+RATE_LIMIT_DEFAULTS = {
+    "upload": "5,20,10",
+    "generate_listing": "5,20,10",
+    "syndicate": "1,5,2",
+    "research": "20,50,20",
+}
+
+# Asynchronous job mode for long-running proxy calls (/generate-listing,
+# /syndicate). Jobs are persisted so a restart does not lose accepted work.
+JOB_STORE = os.getenv("JOB_STORE", "memory")  # "memory" or "sqlite"
+JOB_SQLITE_PATH = os.getenv("JOB_SQLITE_PATH", "gateway_jobs.db")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_QUEUE_MAX = int(os.getenv("JOB_QUEUE_MAX", "1000"))
+JOB_RETENTION_SECONDS = float(os.getenv("JOB_RETENTION_SECONDS", "3600"))
+JOB_WEBHOOK_TIMEOUT = float(os.getenv("JOB_WEBHOOK_TIMEOUT", "10"))
+# Comma-separated hosts webhooks may be sent to. When empty, any host that
+# resolves only to public addresses is allowed (never loopback, link-local,
+# private or multicast ones).
+JOB_WEBHOOK_ALLOWED_HOSTS = [
+    host.strip() for host in os.getenv("JOB_WEBHOOK_ALLOWED_HOSTS", "").split(",") if host.strip()
+]
+
+# Access logging: one JSON line per request, written by a background thread
+# Successful (2xx) requests are sampled at ACCESS_LOG_SAMPLE_RATE (0.0-1.0);
+# everything else is always logged. Only allowlisted request headers are logged.
+ACCESS_LOG_SAMPLE_RATE = float(os.getenv("ACCESS_LOG_SAMPLE_RATE", "1.0"))
+ACCESS_LOG_HEADERS = [
+    header.strip().lower()
+    for header in os.getenv("ACCESS_LOG_HEADERS", "user-agent,content-type,content-length,referer").split(",")
+    if header.strip()
+]
+ACCESS_LOG_QUEUE_SIZE = int(os.getenv("ACCESS_LOG_QUEUE_SIZE", "10000"))
+
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -69,6 +217,1423 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# UPSTREAM RESILIENCE
+# ============================================================================
+
+# Upstream status codes treated as failures worth retrying
+RETRYABLE_STATUS_CODES = {502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit breaker is open"""
+
+    def __init__(self, upstream: str, retry_after: float):
+        super().__init__(f"{upstream} service unavailable (circuit open)")
+        self.upstream = upstream
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker with half-open probing
+
+    closed -> open after `failure_threshold` consecutive failures. While open,
+    calls fail fast. After `reset_timeout` one probe request is let through
+    (half-open); its success closes the circuit, its failure re-opens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = BREAKER_FAILURE_THRESHOLD, reset_timeout: float = BREAKER_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self._probe_in_flight = False
+
+    def before_request(self):
+        """Raise CircuitOpenError unless a request may be sent now"""
+        if self.state == "closed":
+            return
+        now = time.monotonic()
+        if self.state == "open" and now - self.opened_at >= self.reset_timeout:
+            self.state = "half_open"
+        if self.state == "half_open" and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return
+        self.rejected += 1
+        raise CircuitOpenError(self.name, max(0.0, self.reset_timeout - (now - self.opened_at)))
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+        if self.state != "closed":
+            logger.info(f"Circuit for {self.name} closed")
+            self.state = "closed"
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            if self.state != "open":
+                logger.warning(f"Circuit for {self.name} opened after {self.consecutive_failures} failures")
+                self.times_opened += 1
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def release_probe(self):
+        """Let another probe through if the current one was abandoned"""
+        self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a share of total traffic
+
+    Every request deposits `ratio` tokens and every retry or hedge withdraws
+    one, so a struggling upstream never sees more than (1 + ratio) times its
+    normal load. `reserve` caps the bucket and allows a few retries at low
+    traffic.
+    """
+
+    def __init__(self, ratio: float = UPSTREAM_RETRY_BUDGET_RATIO, reserve: float = UPSTREAM_RETRY_BUDGET_RESERVE):
+        self.ratio = ratio
+        self.reserve = reserve
+        self.tokens = reserve
+        self.exhausted = 0
+
+    def deposit(self):
+        self.tokens = min(self.reserve, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        self.exhausted += 1
+        return False
+
+
+def _retry_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff"""
+    return random.uniform(0, min(UPSTREAM_RETRY_BACKOFF_MAX, UPSTREAM_RETRY_BACKOFF * (2 ** attempt)))
+
+
+# ============================================================================
+# UPSTREAM CONNECTION POOLS
+# ============================================================================
+
+def _http2_available() -> bool:
+    """Check whether the optional h2 package needed for HTTP/2 is installed"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class UpstreamClient:
+    """
+    Long-lived, pooled HTTP client for a single upstream microservice
+
+    One instance exists per entry in MICROSERVICE_ENDPOINTS so every proxied
+    request reuses keep-alive connections instead of paying TCP/TLS setup.
+    Requests go through the upstream's circuit breaker, are retried with
+    jittered backoff within the retry budget, and are optionally hedged.
+
+    CLOUD SCALING NOTE: Counters are per instance; aggregate them across
+    instances in Cloud Monitoring if you need fleet-wide utilisation.
+    """
+
+    def __init__(self, name: str, url: str, timeout: float):
+        self.name = name
+        self.url = url
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=UPSTREAM_MAX_CONNECTIONS,
+            max_keepalive_connections=UPSTREAM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=UPSTREAM_KEEPALIVE_EXPIRY,
+        )
+        self.http2 = UPSTREAM_HTTP2 and _http2_available()
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Resilience
+        self.idempotent = UPSTREAM_IDEMPOTENT.get(name, False)
+        self.max_retries = UPSTREAM_MAX_RETRIES
+        self.hedge_delay = UPSTREAM_HEDGE_DELAYS.get(name, 0.0) if self.idempotent else 0.0
+        self.breaker = CircuitBreaker(name)
+        self.retry_budget = RetryBudget()
+
+        # Pool utilisation counters
+        self.requests_total = 0
+        self.errors_total = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+            )
+        return self._client
+
+    async def _send(self, method: str, kwargs: Dict[str, Any]) -> httpx.Response:
+        """Send one attempt through the shared pool"""
+        client = self.get_client()
+        self.requests_total += 1
+        self.in_flight += 1
+        if self.in_flight > self.peak_in_flight:
+            self.peak_in_flight = self.in_flight
+        try:
+            return await client.request(method, self.url, **kwargs)
+        except httpx.HTTPError:
+            self.errors_total += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+    async def _send_hedged(self, method: str, kwargs: Dict[str, Any]) -> httpx.Response:
+        """Send a second copy if the first is slow; return whichever answers first"""
+        first = asyncio.create_task(self._send(method, kwargs))
+        done, _ = await asyncio.wait({first}, timeout=self.hedge_delay)
+        if done or not self.retry_budget.withdraw():
+            return await first
+        
+        self.hedges += 1
+        second = asyncio.create_task(self._send(method, kwargs))
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            # Wait for the loser to unwind (releasing its connection) and
+            # retrieve its outcome so no exception goes unobserved
+            await asyncio.gather(first, second, return_exceptions=True)
+
+    def _should_retry(self, attempt: int, replayable: bool, error: Optional[Exception] = None) -> bool:
+        if attempt >= self.max_retries or not replayable:
+            return False
+        if error is not None and not self.idempotent:
+            # The request may have reached the upstream unless connecting failed
+            if not isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+                return False
+        return self.retry_budget.withdraw()
+
+    async def request(self, method: str, **kwargs) -> httpx.Response:
+        """
+        Send a request to the upstream URL with breaker, retries and hedging
+
+        Streaming request bodies cannot be replayed, so they are sent once.
+        Raises CircuitOpenError without contacting the upstream while the
+        circuit is open.
+        """
+        content = kwargs.get("content")
+        replayable = content is None or isinstance(content, (bytes, str))
+        hedge = self.hedge_delay > 0 and replayable
+        self.retry_budget.deposit()
+        
+        attempt = 0
+        while True:
+            self.breaker.before_request()
+            try:
+                if hedge:
+                    response = await self._send_hedged(method, kwargs)
+                else:
+                    response = await self._send(method, kwargs)
+            except httpx.TransportError as e:
+                self.breaker.record_failure()
+                if not self._should_retry(attempt, replayable, e):
+                    raise
+            except BaseException:
+                self.breaker.release_probe()
+                raise
+            else:
+                if response.status_code < 500:
+                    self.breaker.record_success()
+                    return response
+                self.breaker.record_failure()
+                if (
+                    response.status_code not in RETRYABLE_STATUS_CODES
+                    or not self.idempotent
+                    or not self._should_retry(attempt, replayable)
+                ):
+                    return response
+            
+            self.retries += 1
+            await asyncio.sleep(_retry_delay(attempt))
+            attempt += 1
+
+    async def post(self, **kwargs) -> httpx.Response:
+        return await self.request("POST", **kwargs)
+
+    async def aclose(self):
+        """Close the pooled client and release all connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool utilisation and resilience counters for the /status endpoint"""
+        return {
+            "http2": self.http2,
+            "timeout_seconds": self.timeout,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "requests_total": self.requests_total,
+            "errors_total": self.errors_total,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "utilisation": round(self.in_flight / self.limits.max_connections, 3),
+            "circuit_breaker": self.breaker.stats(),
+            "retries": self.retries,
+            "retry_budget_exhausted": self.retry_budget.exhausted,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+        }
+
+
+# One pooled client per proxied upstream, opened in startup_event and closed
+# in shutdown_event
+upstream_clients: Dict[str, UpstreamClient] = {
+    name: UpstreamClient(name, url, UPSTREAM_TIMEOUTS.get(name, REQUEST_TIMEOUT))
+    for name, url in MICROSERVICE_ENDPOINTS.items()
+    if url != "internal"
+}
+
+
+# ============================================================================
+# UPSTREAM HEALTH MONITOR
+# ============================================================================
+
+def _percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples"""
+    index = max(0, math.ceil(pct / 100 * len(samples)) - 1)
+    return samples[index]
+
+
+def health_url_for(name: str, url: str) -> str:
+    """Health probe URL for an upstream: the override, or its origin + HEALTH_CHECK_PATH"""
+    override = UPSTREAM_HEALTH_URLS.get(name)
+    if override:
+        return override
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}{HEALTH_CHECK_PATH}"
+
+
+class HealthMonitor:
+    """
+    Probes every upstream in the background and caches the results
+    
+    Each round probes all distinct health URLs concurrently through the
+    upstreams' pooled clients (upstreams sharing an origin share one probe).
+    The per-upstream snapshot, including latency percentiles over the last
+    HEALTH_LATENCY_WINDOW probes, is rebuilt after each round so /status and
+    /health only read a dict.
+    
+    Probes bypass the circuit breakers and retry budgets, so a failing health
+    endpoint never opens a circuit and an open circuit does not hide recovery.
+    
+    CLOUD SCALING NOTE: Every instance runs its own monitor, so upstreams see
+    (instances / HEALTH_CHECK_INTERVAL) probes per second. Raise the interval
+    for large deployments.
+    """
+
+    def __init__(
+        self,
+        upstreams: Dict[str, UpstreamClient],
+        interval: float = HEALTH_CHECK_INTERVAL,
+        timeout: float = HEALTH_CHECK_TIMEOUT,
+        window: int = HEALTH_LATENCY_WINDOW,
+    ):
+        self.upstreams = upstreams
+        self.interval = interval
+        self.timeout = timeout
+        self.urls = {name: health_url_for(name, upstream.url) for name, upstream in upstreams.items()}
+        self.rounds = 0
+        self.last_round_ms: Optional[float] = None
+        self._latencies: Dict[str, "deque[float]"] = {name: deque(maxlen=window) for name in upstreams}
+        self._consecutive_failures: Dict[str, int] = {name: 0 for name in upstreams}
+        self._task: Optional[asyncio.Task] = None
+        self.snapshot: Dict[str, Dict[str, Any]] = {
+            name: {"status": "unknown", "url": url, "checked_at": None} for name, url in self.urls.items()
+        }
+        self.summary: Dict[str, str] = {name: "unknown" for name in upstreams}
+
+    @property
+    def started(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start the probe loop; the first round runs immediately"""
+        if self.started or self.interval <= 0:
+            return
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.check_now()
+            except Exception as e:
+                logger.error(f"Health monitor round failed: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    async def _probe(self, name: str, url: str) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            response = await self.upstreams[name].get_client().get(url, timeout=self.timeout)
+            result = {"healthy": response.status_code < 400, "status_code": response.status_code}
+        except httpx.HTTPError as e:
+            result = {"healthy": False, "error": type(e).__name__}
+        result["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return result
+
+    async def check_now(self):
+        """Run one probe round and rebuild the cached snapshot"""
+        started = time.perf_counter()
+        # One probe per distinct URL, sent through the first upstream using it
+        probes: Dict[str, str] = {}
+        for name, url in self.urls.items():
+            probes.setdefault(url, name)
+        results = await asyncio.gather(*(self._probe(name, url) for url, name in probes.items()))
+        by_url = dict(zip(probes, results))
+        checked_at = datetime.utcnow().isoformat()
+        
+        snapshot = {}
+        for name, url in self.urls.items():
+            result = by_url[url]
+            latencies = self._latencies[name]
+            if result["healthy"]:
+                latencies.append(result["latency_ms"])
+                self._consecutive_failures[name] = 0
+            else:
+                self._consecutive_failures[name] += 1
+            entry = {
+                "status": "healthy" if result["healthy"] else "unhealthy",
+                "url": url,
+                "checked_at": checked_at,
+                "consecutive_failures": self._consecutive_failures[name],
+                **{k: v for k, v in result.items() if k != "healthy"},
+            }
+            if latencies:
+                ordered = sorted(latencies)
+                entry["latency_p50_ms"] = _percentile(ordered, 50)
+                entry["latency_p95_ms"] = _percentile(ordered, 95)
+                entry["latency_p99_ms"] = _percentile(ordered, 99)
+            snapshot[name] = entry
+        
+        self.snapshot = snapshot
+        self.summary = {name: entry["status"] for name, entry in snapshot.items()}
+        self.rounds += 1
+        self.last_round_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.started,
+            "interval_seconds": self.interval,
+            "rounds": self.rounds,
+            "last_round_ms": self.last_round_ms,
+        }
+
+
+health_monitor = HealthMonitor(upstream_clients)
+
+
+# ============================================================================
+# STREAMING UPLOAD RELAY
+# ============================================================================
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload body exceeds UPLOAD_MAX_BODY_BYTES"""
+
+
+class MultipartRelayError(Exception):
+    """Raised when an incoming upload is not a usable multipart body"""
+
+
+def _quote_form_param(value: bytes) -> bytes:
+    """Escape a multipart header parameter the same way httpx does"""
+    return (
+        value.replace(b"\\", b"\\\\")
+        .replace(b'"', b"%22")
+        .replace(b"\r", b"%0D")
+        .replace(b"\n", b"%0A")
+    )
+
+
+class MultipartRelay:
+    """
+    Re-encode an incoming multipart/form-data stream for the upload service
+
+    The body is parsed incrementally and every file part is re-emitted under
+    the "images" field the upload service expects, exactly like the buffered
+    path. Only the current chunk is held in memory, so peak memory per request
+    stays bounded by the ASGI server's chunk size regardless of upload size.
+    """
+
+    upstream_field = b"images"
+
+    def __init__(self, content_type: str, max_body_bytes: Optional[int] = None):
+        mime_type, params = parse_options_header(content_type or "")
+        boundary = params.get(b"boundary")
+        if mime_type != b"multipart/form-data" or not boundary:
+            raise MultipartRelayError("Expected a multipart/form-data body with a boundary")
+        
+        self.max_body_bytes = max_body_bytes if max_body_bytes is not None else UPLOAD_MAX_BODY_BYTES
+        self.bytes_received = 0
+        self.files_forwarded = 0
+        self.boundary = secrets.token_hex(16).encode("ascii")
+        self.content_type = f"multipart/form-data; boundary={self.boundary.decode('ascii')}"
+        
+        self._out: List[bytes] = []
+        self._headers: Dict[bytes, bytes] = {}
+        self._header_field = bytearray()
+        self._header_value = bytearray()
+        self._forwarding = False
+        self._parser = multipart.MultipartParser(
+            boundary,
+            {
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+
+    def _on_part_begin(self):
+        self._headers = {}
+        self._forwarding = False
+
+    def _on_header_field(self, data: bytes, start: int, end: int):
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def _on_header_end(self):
+        self._headers[bytes(self._header_field).lower()] = bytes(self._header_value)
+        self._header_field.clear()
+        self._header_value.clear()
+
+    def _on_headers_finished(self):
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        filename = options.get(b"filename")
+        if options.get(b"name") != b"files" or filename is None:
+            # Only files in the "files" field are forwarded (same as the buffered path)
+            return
+        
+        self._forwarding = True
+        self.files_forwarded += 1
+        content_type = self._headers.get(b"content-type", b"application/octet-stream")
+        self._out.append(
+            b"--%s\r\n"
+            b'Content-Disposition: form-data; name="%s"; filename="%s"\r\n'
+            b"Content-Type: %s\r\n\r\n"
+            % (self.boundary, self.upstream_field, _quote_form_param(filename), content_type)
+        )
+
+    def _on_part_data(self, data: bytes, start: int, end: int):
+        if self._forwarding:
+            self._out.append(data[start:end])
+
+    def _on_part_end(self):
+        if self._forwarding:
+            self._out.append(b"\r\n")
+            self._forwarding = False
+
+    async def relay(self, stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """Yield the re-encoded body as the incoming body arrives"""
+        async for chunk in stream:
+            self.bytes_received += len(chunk)
+            if self.bytes_received > self.max_body_bytes:
+                raise UploadTooLargeError(
+                    f"Upload exceeds the {self.max_body_bytes} byte limit"
+                )
+            try:
+                self._parser.write(chunk)
+            except multipart.multipart.MultipartParseError as e:
+                raise MultipartRelayError(f"Malformed multipart body: {e}") from e
+            if self._out:
+                yield b"".join(self._out)
+                self._out.clear()
+        
+        self._parser.finalize()
+        if self.files_forwarded == 0:
+            raise MultipartRelayError("No files provided")
+        yield b"--%s--\r\n" % self.boundary
+
+
+async def _proxy_upload_streaming(request: Request) -> httpx.Response:
+    """Forward the upload to the upload service while it is still arriving"""
+    relay = MultipartRelay(request.headers.get("content-type", ""))
+    return await upstream_clients["upload"].post(
+        content=relay.relay(request.stream()),
+        headers={"Content-Type": relay.content_type},
+    )
+
+
+async def _proxy_upload_buffered(request: Request) -> httpx.Response:
+    """Read every file into memory, then forward them in one request"""
+    form = await request.form()
+    files = [f for f in form.getlist("files") if not isinstance(f, str)]
+    if not files:
+        raise MultipartRelayError("No files provided")
+    
+    files_payload = []
+    for file in files:
+        file_content = await file.read()
+        files_payload.append(
+            ("images", (file.filename, file_content, file.content_type))
+        )
+        await file.seek(0)  # Reset file pointer
+    
+    byte_count = sum(len(payload[1][1]) for payload in files_payload)
+    if byte_count > UPLOAD_MAX_BODY_BYTES:
+        raise UploadTooLargeError(f"Upload exceeds the {UPLOAD_MAX_BODY_BYTES} byte limit")
+    
+    return await upstream_clients["upload"].post(files=files_payload)
+
+
+# Request body schema for /upload. The endpoint reads the raw request stream,
+# so the multipart shape is declared here to keep the OpenAPI docs accurate.
+UPLOAD_OPENAPI_EXTRA = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["files"],
+                    "properties": {
+                        "files": {
+                            "type": "array",
+                            "items": {"type": "string", "format": "binary"},
+                        }
+                    },
+                }
+            }
+        },
+    }
+}
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+class CacheBackend(ABC):
+    """
+    Storage interface for the gateway response cache
+
+    Values are opaque bytes with a TTL. The in-process backend is the default;
+    anything speaking the Redis protocol (a local Redis or a Redis-compatible
+    stand-in) can back the cache through RedisCacheBackend so instances share
+    cached responses.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return the cached value, or None if missing or expired"""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float):
+        """Store a value that expires after `ttl` seconds"""
+
+    async def close(self):
+        """Release backend resources"""
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """LRU cache bounded by entry count and total value bytes"""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, max_bytes: int = CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        if len(value) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self.bytes += len(value)
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        _, value = self._entries.pop(key)
+        self.bytes -= len(value)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache backend for any Redis-compatible server
+
+    Requires the optional "redis" package. Eviction bounds are left to the
+    server's maxmemory policy.
+    """
+
+    def __init__(self, url: str = CACHE_REDIS_URL, prefix: str = "gateway:cache:"):
+        import redis.asyncio as redis  # Optional dependency
+        
+        self.prefix = prefix
+        self._redis = redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._redis.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        await self._redis.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    async def close(self):
+        await self._redis.aclose()
+
+
+class ResponseCache:
+    """
+    Per-route TTL cache with single-flight request coalescing
+
+    Concurrent misses for the same key share one upstream call: the first
+    caller fetches, later callers wait for its result instead of issuing
+    their own request.
+    """
+
+    def __init__(self, backend: CacheBackend, route_ttls: Dict[str, float]):
+        self.backend = backend
+        self.route_ttls = route_ttls
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.bypassed = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def enabled(self, route: str) -> bool:
+        return self.route_ttls.get(route, 0) > 0
+
+    @staticmethod
+    def make_key(route: str, tenant: str, body: Any) -> str:
+        """Build a cache key from the route, tenant and canonicalised JSON body"""
+        canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(f"{route}\x00{tenant}\x00{canonical}".encode("utf-8")).hexdigest()
+
+    async def get_or_fetch(
+        self,
+        route: str,
+        key: str,
+        fetch: Callable[[], Awaitable[bytes]],
+        refresh: bool = False,
+    ) -> Tuple[bytes, str]:
+        """
+        Return (value, cache_status) where cache_status is HIT, MISS,
+        COALESCED or BYPASS. `fetch` must raise on responses that should not
+        be cached. With `refresh` the cached value is ignored and replaced.
+        """
+        if not refresh:
+            cached = await self.backend.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached, "HIT"
+        
+        while key in self._inflight:
+            inflight = self._inflight[key]
+            try:
+                value = await asyncio.shield(inflight)
+                self.coalesced += 1
+                return value, "COALESCED"
+            except asyncio.CancelledError:
+                # Retry only if the leading request was cancelled, not this one
+                if not inflight.cancelled():
+                    raise
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        if refresh:
+            self.bypassed += 1
+        else:
+            self.misses += 1
+        try:
+            value = await fetch()
+            await self.backend.set(key, value, self.route_ttls[route])
+            future.set_result(value)
+            return value, "BYPASS" if refresh else "MISS"
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody is waiting
+            raise
+        finally:
+            del self._inflight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "backend": type(self.backend).__name__,
+            "route_ttls": self.route_ttls,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "bypassed": self.bypassed,
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 3) if lookups else 0.0,
+            "inflight": len(self._inflight),
+            **self.backend.stats(),
+        }
+
+
+def create_cache_backend() -> CacheBackend:
+    """Build the cache backend selected by CACHE_BACKEND"""
+    if CACHE_BACKEND == "redis":
+        return RedisCacheBackend(CACHE_REDIS_URL)
+    return InMemoryCacheBackend(CACHE_MAX_ENTRIES, CACHE_MAX_BYTES)
+
+
+response_cache = ResponseCache(create_cache_backend(), CACHE_ROUTE_TTLS)
+
+
+# ============================================================================
+# ASYNCHRONOUS JOBS
+# ============================================================================
+
+class Job(BaseModel):
+    """A proxied request accepted for background processing"""
+    id: str
+    route: str
+    tenant: str
+    status: str = "queued"  # queued, running, succeeded, failed
+    payload: Any = None
+    callback_url: Optional[str] = None
+    created_at: float = Field(default_factory=time.time)
+    updated_at: float = Field(default_factory=time.time)
+    result: Any = None
+    error: Optional[str] = None
+    upstream_status_code: Optional[int] = None
+
+    def public_view(self) -> Dict[str, Any]:
+        """Job fields returned to clients (the request payload is omitted)"""
+        return self.model_dump(exclude={"payload", "tenant"})
+
+
+class JobStore(ABC):
+    """Persistence interface for the job queue"""
+
+    @abstractmethod
+    async def save(self, job: Job):
+        """Insert or update a job"""
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by id"""
+
+    @abstractmethod
+    async def unfinished(self) -> List[Job]:
+        """Return queued and running jobs, oldest first"""
+
+    @abstractmethod
+    async def prune(self, finished_before: float) -> int:
+        """Delete finished jobs last updated before the given time"""
+
+    async def close(self):
+        """Release store resources"""
+
+
+class InMemoryJobStore(JobStore):
+    """Process-local job store (jobs are lost on restart)"""
+
+    def __init__(self):
+        self._jobs: Dict[str, Job] = {}
+
+    async def save(self, job: Job):
+        self._jobs[job.id] = job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    async def unfinished(self) -> List[Job]:
+        jobs = [job for job in self._jobs.values() if job.status in ("queued", "running")]
+        return sorted(jobs, key=lambda job: job.created_at)
+
+    async def prune(self, finished_before: float) -> int:
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.status in ("succeeded", "failed") and job.updated_at < finished_before
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        return len(expired)
+
+
+class SQLiteJobStore(JobStore):
+    """
+    Job store backed by a local SQLite file
+
+    Queries run in a worker thread so the event loop is never blocked on disk.
+
+    CLOUD SCALING NOTE: Cloud Run's filesystem is per instance and in-memory;
+    mount a persistent volume for JOB_SQLITE_PATH if jobs must survive
+    instance replacement.
+    """
+
+    def __init__(self, path: str = JOB_SQLITE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, status TEXT NOT NULL, "
+            "created_at REAL NOT NULL, updated_at REAL NOT NULL, data TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+        self._conn.commit()
+
+    def _execute(self, sql: str, params: tuple = ()) -> Tuple[List[tuple], int]:
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            rows = cursor.fetchall()
+            self._conn.commit()
+            return rows, cursor.rowcount
+
+    async def save(self, job: Job):
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT OR REPLACE INTO jobs (id, status, created_at, updated_at, data) VALUES (?, ?, ?, ?, ?)",
+            (job.id, job.status, job.created_at, job.updated_at, job.model_dump_json()),
+        )
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        rows, _ = await asyncio.to_thread(self._execute, "SELECT data FROM jobs WHERE id = ?", (job_id,))
+        return Job.model_validate_json(rows[0][0]) if rows else None
+
+    async def unfinished(self) -> List[Job]:
+        rows, _ = await asyncio.to_thread(
+            self._execute,
+            "SELECT data FROM jobs WHERE status IN ('queued', 'running') ORDER BY created_at",
+        )
+        return [Job.model_validate_json(row[0]) for row in rows]
+
+    async def prune(self, finished_before: float) -> int:
+        _, deleted = await asyncio.to_thread(
+            self._execute,
+            "DELETE FROM jobs WHERE status IN ('succeeded', 'failed') AND updated_at < ?",
+            (finished_before,),
+        )
+        return deleted
+
+    async def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class JobQueueFullError(Exception):
+    """Raised when the job queue has no room for another job"""
+
+
+class JobManager:
+    """
+    Bounded worker pool draining a queue of proxied requests
+
+    Accepted jobs are persisted before they are queued, so unfinished jobs
+    are re-queued from the store when the gateway starts again. Jobs that
+    were already running are only re-queued for idempotent routes; the
+    others (syndication) fail as interrupted instead of being replayed. On
+    completion the job is updated and, if a callback URL was given, POSTed to
+    that webhook with an HMAC-SHA256 signature in X-Gateway-Signature.
+    """
+
+    def __init__(self, store: JobStore, workers: int = JOB_WORKERS, max_queued: int = JOB_QUEUE_MAX):
+        self.store = store
+        self.worker_count = workers
+        self.max_queued = max_queued
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.webhooks_sent = 0
+        self.webhooks_failed = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._webhook_client: Optional[httpx.AsyncClient] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._last_prune = 0.0
+
+    @property
+    def started(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self):
+        """Start the workers and re-queue jobs left unfinished by a previous run"""
+        if self.started:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        # Submissions arriving while the store is read wait for the same start
+        async with self._start_lock:
+            if not self.started:
+                await self._start()
+
+    async def _start(self):
+        queue = asyncio.Queue()
+        interrupted = []
+        for job in await self.store.unfinished():
+            if job.status == "running" and not UPSTREAM_IDEMPOTENT.get(job.route, False):
+                interrupted.append(job)
+            else:
+                queue.put_nowait(job.id)
+        if queue.qsize():
+            logger.info(f"Re-queued {queue.qsize()} unfinished jobs")
+        
+        self._queue = queue
+        self._webhook_client = httpx.AsyncClient(timeout=JOB_WEBHOOK_TIMEOUT)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.worker_count)]
+        for job in interrupted:
+            # The upstream may or may not have acted on it; replaying a
+            # non-idempotent request could e.g. create a duplicate listing
+            logger.warning(f"Job {job.id} ({job.route}) was interrupted while running; marking it failed")
+            await self._fail(job, "Interrupted while running; outcome unknown")
+
+    async def stop(self):
+        """Stop the workers; running jobs are resumed or failed on next start"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._webhook_client is not None:
+            await self._webhook_client.aclose()
+            self._webhook_client = None
+
+    async def submit(self, route: str, tenant: str, payload: Any, callback_url: Optional[str] = None) -> Job:
+        """Persist and queue a job"""
+        await self.start()
+        if self._queue.qsize() >= self.max_queued:
+            raise JobQueueFullError(f"Job queue is full ({self.max_queued} jobs)")
+        job = Job(id=uuid.uuid4().hex, route=route, tenant=tenant, payload=payload, callback_url=callback_url)
+        await self.store.save(job)
+        self._queue.put_nowait(job.id)
+        self.submitted += 1
+        return job
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            job = None
+            try:
+                job = await self.store.get(job_id)
+                if job is not None and job.status in ("queued", "running"):
+                    await self._run(job)
+            except Exception as e:
+                logger.error(f"Job {job_id} worker error: {str(e)}")
+                if job is not None and job.status not in ("succeeded", "failed"):
+                    # Don't leave it "running" until the next restart
+                    try:
+                        await self._fail(job, f"Internal error: {str(e)}")
+                    except Exception as e:
+                        logger.error(f"Job {job_id} could not be marked failed: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    async def _fail(self, job: Job, error: str):
+        """Mark a job failed outside the normal upstream path and notify its webhook"""
+        job.status = "failed"
+        job.error = error
+        job.updated_at = time.time()
+        self.failed += 1
+        await self.store.save(job)
+        if job.callback_url:
+            await self._send_webhook(job)
+
+    async def _run(self, job: Job):
+        job.status = "running"
+        job.updated_at = time.time()
+        await self.store.save(job)
+        
+        try:
+            response = await upstream_clients[job.route].post(json=job.payload)
+            job.upstream_status_code = response.status_code
+            response.raise_for_status()
+            job.result = response.json()
+            job.status = "succeeded"
+            self.succeeded += 1
+        except (httpx.HTTPError, CircuitOpenError, ValueError) as e:
+            logger.error(f"Job {job.id} ({job.route}) failed: {str(e)}")
+            job.error = str(e)
+            job.status = "failed"
+            self.failed += 1
+        
+        job.updated_at = time.time()
+        await self.store.save(job)
+        if job.callback_url:
+            await self._send_webhook(job)
+        await self._maybe_prune()
+
+    async def _send_webhook(self, job: Job):
+        try:
+            # The host was checked on submission, but its DNS may have changed
+            await validate_callback_url(job.callback_url)
+        except ValueError as e:
+            logger.warning(f"Webhook for job {job.id} not sent: {str(e)}")
+            self.webhooks_failed += 1
+            return
+        body = json.dumps(job.public_view()).encode("utf-8")
+        signature = hmac.new(API_SECRET_KEY.encode("utf-8"), body, hashlib.sha256).hexdigest()
+        try:
+            response = await self._webhook_client.post(
+                job.callback_url,
+                content=body,
+                headers={"Content-Type": "application/json", "X-Gateway-Signature": f"sha256={signature}"},
+            )
+            response.raise_for_status()
+            self.webhooks_sent += 1
+        except httpx.HTTPError as e:
+            logger.warning(f"Webhook for job {job.id} failed: {str(e)}")
+            self.webhooks_failed += 1
+
+    async def _maybe_prune(self):
+        now = time.time()
+        if now - self._last_prune < 60:
+            return
+        self._last_prune = now
+        await self.store.prune(now - JOB_RETENTION_SECONDS)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "store": type(self.store).__name__,
+            "workers": len(self._workers),
+            "queued": self._queue.qsize() if self._queue else 0,
+            "submitted": self.submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "webhooks_sent": self.webhooks_sent,
+            "webhooks_failed": self.webhooks_failed,
+        }
+
+
+def is_public_address(address: str) -> bool:
+    """True for globally routable unicast IP addresses"""
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    return ip.is_global and not ip.is_multicast
+
+
+async def validate_callback_url(url: str) -> str:
+    """
+    Check a webhook URL's scheme and host
+
+    Hosts in JOB_WEBHOOK_ALLOWED_HOSTS are trusted as is. Without an
+    allowlist, the host must resolve only to public addresses, so job results
+    can't be sent to loopback, link-local (cloud metadata), private or
+    multicast addresses.
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        raise ValueError("Callback URL must be an absolute http(s) URL")
+    host = parsed.hostname
+    if JOB_WEBHOOK_ALLOWED_HOSTS:
+        if host not in JOB_WEBHOOK_ALLOWED_HOSTS:
+            raise ValueError(f"Callback host {host} is not allowed")
+        return url
+    
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    except (socket.gaierror, UnicodeError):
+        raise ValueError(f"Callback host {host} does not resolve")
+    for *_, sockaddr in infos:
+        if not is_public_address(sockaddr[0]):
+            raise ValueError(f"Callback host {host} resolves to non-public address {sockaddr[0]}")
+    return url
+
+
+def create_job_store() -> JobStore:
+    """Build the job store selected by JOB_STORE"""
+    if JOB_STORE == "sqlite":
+        return SQLiteJobStore(JOB_SQLITE_PATH)
+    return InMemoryJobStore()
+
+
+job_manager = JobManager(create_job_store(), JOB_WORKERS, JOB_QUEUE_MAX)
+
+
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+
+class RateLimit(BaseModel):
+    """Token bucket and concurrency cap for one route"""
+    rate: float  # tokens added per second (0 = no rate limit)
+    burst: float  # bucket capacity
+    max_in_flight: int  # concurrent requests (0 = no cap)
+
+    @classmethod
+    def parse(cls, spec: str) -> "RateLimit":
+        rate, burst, max_in_flight = (part.strip() for part in spec.split(","))
+        return cls(rate=float(rate), burst=max(1.0, float(burst)), max_in_flight=int(max_in_flight))
+
+
+RATE_LIMITS: Dict[str, RateLimit] = {
+    route: RateLimit.parse(os.getenv(f"RATE_LIMIT_{route.upper()}", default))
+    for route, default in RATE_LIMIT_DEFAULTS.items()
+}
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage interface for rate limiter state
+
+    The in-process backend keeps per-instance limits; RedisRateLimitBackend
+    shares them across instances via any Redis-compatible server.
+    """
+
+    @abstractmethod
+    async def acquire(self, key: str, limit: RateLimit) -> float:
+        """
+        Take a token and an in-flight slot for `key`. Returns 0 if allowed,
+        otherwise the number of seconds the caller should wait (negative for
+        a concurrency rejection).
+        """
+
+    @abstractmethod
+    async def release(self, key: str, limit: RateLimit):
+        """Return the in-flight slot taken by a successful acquire"""
+
+    async def close(self):
+        """Release backend resources"""
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated", "used", "in_flight")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+        self.used = updated
+        self.in_flight = 0
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Per-instance token buckets and in-flight counters
+
+    Each decision is a dict lookup plus a few float operations on a slotted
+    object. Buckets are kept in least-recently-used order and capped at
+    `max_keys`: a new key evicts the least recently used bucket with nothing
+    in flight, plus any idle buckets right behind it. If the first
+    `eviction_scan` candidates are all in flight, the new key is rejected.
+    """
+
+    def __init__(self, max_keys: int = 10000, idle_seconds: float = 300, eviction_scan: int = 32):
+        self.max_keys = max_keys
+        self.idle_seconds = idle_seconds
+        self.eviction_scan = eviction_scan
+        self.evictions = 0
+        self.rejected_full = 0
+        self._buckets: "OrderedDict[str, _Bucket]" = OrderedDict()
+
+    async def acquire(self, key: str, limit: RateLimit) -> float:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys and not self._evict(now):
+                self.rejected_full += 1
+                return -1.0
+            bucket = self._buckets[key] = _Bucket(limit.burst, now)
+        else:
+            self._buckets.move_to_end(key)
+        bucket.used = now
+        
+        if limit.max_in_flight and bucket.in_flight >= limit.max_in_flight:
+            return -1.0
+        if limit.rate:
+            tokens = min(limit.burst, bucket.tokens + (now - bucket.updated) * limit.rate)
+            bucket.updated = now
+            if tokens < 1.0:
+                bucket.tokens = tokens
+                return (1.0 - tokens) / limit.rate
+            bucket.tokens = tokens - 1.0
+        bucket.in_flight += 1
+        return 0.0
+
+    async def release(self, key: str, limit: RateLimit):
+        bucket = self._buckets.get(key)
+        if bucket is not None and bucket.in_flight > 0:
+            bucket.in_flight -= 1
+
+    def _evict(self, now: float) -> bool:
+        """
+        Make room for one bucket. Each bucket is evicted at most once, so the
+        cost is amortised O(1) per acquire. Returns False if no bucket could go.
+        """
+        buckets = self._buckets
+        idle_before = now - self.idle_seconds
+        evicted = False
+        for _ in range(self.eviction_scan):
+            if not buckets:
+                return True
+            key, bucket = next(iter(buckets.items()))
+            if bucket.in_flight:
+                # In use, so not really least recently used
+                buckets.move_to_end(key)
+                continue
+            if evicted and bucket.used >= idle_before:
+                return True
+            del buckets[key]
+            self.evictions += 1
+            evicted = True
+        return evicted
+
+    def stats(self) -> Dict[str, Any]:
+        return {"keys": len(self._buckets), "evictions": self.evictions, "rejected_full": self.rejected_full}
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Rate limiter state shared through a Redis-compatible server
+
+    The token bucket update and in-flight increment run atomically in one
+    Lua script using the server clock. Requires the optional "redis" package.
+    """
+
+    ACQUIRE_SCRIPT = """
+    local rate, burst, max_in_flight, ttl = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3]), tonumber(ARGV[4])
+    local t = redis.call('TIME')
+    local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+    if max_in_flight > 0 and tonumber(redis.call('GET', KEYS[2]) or '0') >= max_in_flight then
+        return '-1'
+    end
+    if rate > 0 then
+        local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+        local tokens = tonumber(state[1]) or burst
+        local updated = tonumber(state[2]) or now
+        tokens = math.min(burst, tokens + (now - updated) * rate)
+        if tokens < 1 then
+            redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+            return tostring((1 - tokens) / rate)
+        end
+        redis.call('HSET', KEYS[1], 'tokens', tokens - 1, 'updated', now)
+        redis.call('EXPIRE', KEYS[1], ttl)
+    end
+    if max_in_flight > 0 then
+        redis.call('INCR', KEYS[2])
+        redis.call('EXPIRE', KEYS[2], ttl)
+    end
+    return '0'
+    """
+
+    def __init__(self, url: str = RATE_LIMIT_REDIS_URL, prefix: str = "gateway:ratelimit:"):
+        import redis.asyncio as redis  # Optional dependency
+        
+        self.prefix = prefix
+        self._redis = redis.from_url(url)
+        self._acquire = self._redis.register_script(self.ACQUIRE_SCRIPT)
+
+    async def acquire(self, key: str, limit: RateLimit) -> float:
+        ttl = max(60, int(limit.burst / limit.rate) + 1) if limit.rate else 3600
+        result = await self._acquire(
+            keys=[f"{self.prefix}{key}:bucket", f"{self.prefix}{key}:inflight"],
+            args=[limit.rate, limit.burst, limit.max_in_flight, ttl],
+        )
+        return float(result)
+
+    async def release(self, key: str, limit: RateLimit):
+        if limit.max_in_flight:
+            await self._redis.decr(f"{self.prefix}{key}:inflight")
+
+    async def close(self):
+        await self._redis.aclose()
+
+
+class RateLimiter:
+    """Applies RATE_LIMITS through a backend and counts decisions"""
+
+    def __init__(self, backend: RateLimitBackend, limits: Dict[str, RateLimit]):
+        self.backend = backend
+        self.limits = limits
+        self.allowed = 0
+        self.rejected_rate = 0
+        self.rejected_concurrency = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": RATE_LIMIT_ENABLED,
+            "backend": type(self.backend).__name__,
+            "allowed": self.allowed,
+            "rejected_rate": self.rejected_rate,
+            "rejected_concurrency": self.rejected_concurrency,
+            **self.backend.stats(),
+        }
+
+
+def create_rate_limit_backend() -> RateLimitBackend:
+    """Build the rate limiter backend selected by RATE_LIMIT_BACKEND"""
+    if RATE_LIMIT_BACKEND == "redis":
+        return RedisRateLimitBackend(RATE_LIMIT_REDIS_URL)
+    return InMemoryRateLimitBackend()
+
+
+rate_limiter = RateLimiter(create_rate_limit_backend(), RATE_LIMITS)
+
+
 # ============================================================================
 # FASTAPI APP INITIALIZATION
 # ============================================================================
@@ -89,6 +1654,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+    """Fail fast with 503 while an upstream's circuit breaker is open"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+    )
+
+
 # ============================================================================
 # AUTHENTICATION MODELS & DEPENDENCIES
 # ============================================================================
@@ -115,6 +1690,107 @@ class TokenResponse(BaseModel):
     token_type: str = "bearer"
 
 
+class ApiKeyRegistry:
+    """
+    Set of valid API keys, loaded once and held as SHA-256 digests
+
+    Presented keys are hashed and looked up in a set, so verification is
+    O(1) and timing does not depend on how much of a valid key was guessed.
+    """
+
+    def __init__(self, reload_interval: float = API_KEYS_RELOAD_INTERVAL):
+        self.reload_interval = reload_interval
+        self.reloads = 0
+        self._digests: frozenset = frozenset()
+        self._next_reload = 0.0
+        self.reload()
+
+    @staticmethod
+    def _digest(api_key: str) -> bytes:
+        return hashlib.sha256(api_key.encode("utf-8")).digest()
+
+    @staticmethod
+    def _load_keys() -> List[str]:
+        if VALID_API_KEYS_FILE:
+            with open(VALID_API_KEYS_FILE) as keys_file:
+                raw = keys_file.read().replace(",", "\n").splitlines()
+        else:
+            raw = os.getenv("VALID_API_KEYS", "dev-api-key-1,dev-api-key-2").split(",")
+        return [key.strip() for key in raw if key.strip()]
+
+    def reload(self):
+        """Re-read the configured keys and swap them in atomically"""
+        try:
+            self._digests = frozenset(self._digest(key) for key in self._load_keys())
+            self.reloads += 1
+        except OSError as e:
+            logger.error(f"API key reload failed, keeping previous keys: {str(e)}")
+        if self.reload_interval > 0:
+            self._next_reload = time.monotonic() + self.reload_interval
+
+    def verify(self, api_key: str) -> bool:
+        if self.reload_interval > 0 and time.monotonic() >= self._next_reload:
+            self.reload()
+        return self._digest(api_key) in self._digests
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+
+class VerifiedTokenCache:
+    """
+    LRU of recently verified JWTs keyed by token digest
+
+    Entries expire at the token's own exp claim (or after JWT_CACHE_MAX_AGE,
+    whichever is sooner), so a cached token is never accepted past its
+    expiry. Failed verifications are not cached.
+    """
+
+    def __init__(self, max_size: int = JWT_CACHE_SIZE, max_age: float = JWT_CACHE_MAX_AGE):
+        self.max_size = max_size
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[str]:
+        """Return the username for a cached, unexpired token"""
+        digest = self._digest(token)
+        entry = self._entries.get(digest)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                del self._entries[digest]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, token: str, username: str, expires_at: Optional[float]):
+        if self.max_size <= 0:
+            return
+        valid_until = time.time() + self.max_age
+        if expires_at is not None:
+            valid_until = min(valid_until, expires_at)
+        self._entries[self._digest(token)] = (valid_until, username)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+api_key_registry = ApiKeyRegistry()
+verified_token_cache = VerifiedTokenCache()
+
+
 def create_access_token(data: dict) -> str:
     """
     Create a JWT access token
@@ -134,6 +1810,12 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security_be
     Verify JWT token from Authorization header
     """
     token = credentials.credentials
+    
+    # Fast path: token already verified and not yet expired
+    username = verified_token_cache.get(token)
+    if username is not None:
+        return TokenData(username=username)
+    
     try:
         payload = jwt.decode(token, API_SECRET_KEY, algorithms=[JWT_ALGORITHM])
         username: str = payload.get("sub")
@@ -142,6 +1824,8 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security_be
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid authentication token",
             )
+        expires_at = payload.get("exp")
+        verified_token_cache.put(token, username, float(expires_at) if expires_at is not None else None)
         return TokenData(username=username)
     except JWTError as e:
         logger.error(f"JWT verification failed: {str(e)}")
@@ -155,11 +1839,11 @@ def verify_api_key(api_key: str = Depends(security_api_key)) -> bool:
     """
     Verify API key from X-API-Key header
     
-    CLOUD SCALING NOTE: In production, store valid API keys in a database
-    or use Cloud Secret Manager for key rotation
+    CLOUD SCALING NOTE: In production, mount the keys from Cloud Secret
+    Manager via VALID_API_KEYS_FILE and rotate them with SIGHUP or
+    API_KEYS_RELOAD_INTERVAL
     """
-    valid_api_keys = os.getenv("VALID_API_KEYS", "dev-api-key-1,dev-api-key-2").split(",")
-    if api_key and api_key in valid_api_keys:
+    if api_key and api_key_registry.verify(api_key):
         return True
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -217,64 +1901,217 @@ def get_auth_identifier(auth: Dict[str, Any]) -> str:
     return "unknown"
 
 
+def get_auth_tenant(auth: Dict[str, Any]) -> str:
+    """
+    Get a stable, non-reversible tenant identifier for per-tenant state
+
+    Unlike get_auth_identifier this distinguishes API keys that share a
+    prefix, so it is safe to use as part of cache keys.
+    """
+    if auth.get('auth_type') == 'jwt':
+        return f"user:{auth.get('username', 'unknown')}"
+    elif auth.get('auth_type') == 'api_key':
+        digest = hashlib.sha256(auth.get('api_key', '').encode("utf-8")).hexdigest()
+        return f"api_key:{digest[:16]}"
+    return "unknown"
+
+
+def rate_limited(route: str):
+    """
+    Dependency factory: authenticate, then apply the route's rate limit
+    
+    Limits are keyed by tenant (see get_auth_tenant) and route. Rejections
+    return 429 with a Retry-After header; the in-flight slot is released
+    once the endpoint finishes.
+    """
+    limit = RATE_LIMITS[route]
+    
+    async def dependency(auth: Dict[str, Any] = Depends(authenticate)):
+        if not RATE_LIMIT_ENABLED:
+            yield auth
+            return
+        
+        key = f"{get_auth_tenant(auth)}:{route}"
+        wait = await rate_limiter.backend.acquire(key, limit)
+        if wait:
+            if wait < 0:
+                rate_limiter.rejected_concurrency += 1
+                detail = f"Too many concurrent {route} requests"
+            else:
+                rate_limiter.rejected_rate += 1
+                detail = f"Rate limit exceeded for {route}"
+            logger.warning(f"{detail} from {get_auth_identifier(auth)}")
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=detail,
+                headers={"Retry-After": str(max(1, math.ceil(wait)))},
+            )
+        
+        rate_limiter.allowed += 1
+        try:
+            yield auth
+        finally:
+            await rate_limiter.backend.release(key, limit)
+    
+    return dependency
+
+
 # ============================================================================
 # MIDDLEWARE FOR REQUEST/RESPONSE LOGGING
 # ============================================================================
 
+class AccessLogWriter:
+    """
+    Background writer for access log lines
+
+    The event loop only builds a small dict and enqueues it; JSON encoding,
+    timestamp formatting and the (possibly blocking) write to stdout happen
+    on a daemon thread that writes whatever has queued up in one batch. If
+    the queue is full the record is dropped and counted rather than
+    blocking request handling.
+
+    CLOUD SCALING NOTE: Cloud Logging parses each stdout JSON line as a
+    structured entry and maps "severity" to the log level.
+    """
+
+    _STOP = object()
+
+    def __init__(self, stream=None, max_queue: int = ACCESS_LOG_QUEUE_SIZE, batch_size: int = 512):
+        self.stream = stream
+        self.batch_size = batch_size
+        self.written = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="access-log-writer", daemon=True)
+                self._thread.start()
+
+    def submit(self, record: Dict[str, Any]):
+        """Queue a record without blocking"""
+        if self._thread is None:
+            self.start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self):
+        """Block until every queued record has been written"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def stop(self):
+        """Write remaining records and stop the writer thread"""
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    @staticmethod
+    def _format(record: Dict[str, Any]) -> str:
+        record["timestamp"] = datetime.fromtimestamp(record["timestamp"], timezone.utc).isoformat(
+            timespec="milliseconds"
+        )
+        return json.dumps(record, separators=(",", ":"), default=str) + "\n"
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stopping = False
+            lines = []
+            for record in batch:
+                if record is self._STOP:
+                    stopping = True
+                else:
+                    lines.append(self._format(record))
+            try:
+                stream = self.stream or sys.stdout
+                stream.write("".join(lines))
+                stream.flush()
+                self.written += len(lines)
+            except Exception:
+                self.dropped += len(lines)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stopping:
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "written": self.written,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "queued": self._queue.qsize(),
+            "sample_rate": ACCESS_LOG_SAMPLE_RATE,
+        }
+
+
+access_log = AccessLogWriter()
+
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """
     Middleware to log all requests and responses for auditability
     
+    Emits one JSON line per request (method, path, status, duration, client
+    IP and ACCESS_LOG_HEADERS) through the background AccessLogWriter.
+    Durations use the monotonic clock.
+    
     CLOUD SCALING NOTE: In Cloud Run, these logs appear in Cloud Logging
     and can be exported to BigQuery for analysis
     """
-    request_id = f"{time.time()}-{id(request)}"
-    start_time = time.time()
-    
-    # Log request
-    request_log = {
-        "request_id": request_id,
-        "timestamp": datetime.utcnow().isoformat(),
-        "method": request.method,
-        "url": str(request.url),
-        "client_ip": request.client.host if request.client else "unknown",
-        "headers": dict(request.headers),
-    }
-    logger.info(f"REQUEST: {json.dumps(request_log)}")
+    request_id = request.headers.get("x-request-id") or secrets.token_hex(8)
+    timestamp = time.time()
+    start_time = time.perf_counter()
+    status_code = 500
+    error = None
     
     # Process request
     try:
         response = await call_next(request)
-        duration = time.time() - start_time
-        
-        # Log response
-        response_log = {
-            "request_id": request_id,
-            "timestamp": datetime.utcnow().isoformat(),
-            "status_code": response.status_code,
-            "duration_seconds": round(duration, 3),
-        }
-        logger.info(f"RESPONSE: {json.dumps(response_log)}")
-        
+        status_code = response.status_code
         return response
     
     except Exception as e:
-        duration = time.time() - start_time
-        
-        # Log error
-        error_log = {
-            "request_id": request_id,
-            "timestamp": datetime.utcnow().isoformat(),
-            "error": str(e),
-            "duration_seconds": round(duration, 3),
-        }
-        logger.error(f"ERROR: {json.dumps(error_log)}")
-        
+        error = str(e)
         return JSONResponse(
             status_code=500,
             content={"error": "Internal server error", "request_id": request_id}
         )
+    
+    finally:
+        if 200 <= status_code < 300 and ACCESS_LOG_SAMPLE_RATE < 1.0 and random.random() >= ACCESS_LOG_SAMPLE_RATE:
+            access_log.sampled_out += 1
+        else:
+            headers = request.headers
+            record = {
+                "severity": "ERROR" if status_code >= 500 else "WARNING" if status_code >= 400 else "INFO",
+                "timestamp": timestamp,
+                "request_id": request_id,
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": status_code,
+                "duration_ms": round((time.perf_counter() - start_time) * 1000, 3),
+                "client_ip": request.client.host if request.client else "unknown",
+                "headers": {name: headers[name] for name in ACCESS_LOG_HEADERS if name in headers},
+            }
+            if error is not None:
+                record["error"] = error
+            access_log.submit(record)
 
 
 # ============================================================================
@@ -317,15 +2154,46 @@ async def verify_auth(auth: Dict = Depends(authenticate)):
 # GATEWAY ENDPOINTS
 # ============================================================================
 
-@app.post("/upload", tags=["Gateway"])
+def wants_async(request: Request) -> bool:
+    """True if the client opted into async job mode (Prefer: respond-async)"""
+    return "respond-async" in request.headers.get("prefer", "").lower()
+
+
+async def submit_job(route: str, request: Request, body: Any, auth: Dict[str, Any]) -> JSONResponse:
+    """Queue a proxied request as a job and answer 202 with its id"""
+    callback_url = request.headers.get("x-callback-url")
+    try:
+        if callback_url:
+            await validate_callback_url(callback_url)
+        job = await job_manager.submit(route, get_auth_tenant(auth), body, callback_url)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    
+    logger.info(f"Queued {route} job {job.id} for {get_auth_identifier(auth)}")
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={"job_id": job.id, "status": job.status, "status_url": f"/jobs/{job.id}"},
+        headers={"Location": f"/jobs/{job.id}", "Preference-Applied": "respond-async"},
+    )
+
+
+@app.post("/upload", tags=["Gateway"], openapi_extra=UPLOAD_OPENAPI_EXTRA)
 async def upload_endpoint(
-    files: list[UploadFile] = File(...),
-    auth: Dict = Depends(authenticate)
+    request: Request,
+    auth: Dict = Depends(rate_limited("upload"))
 ):
     """
     Upload and analyze product images
     
-    Proxies to the upload/image analysis microservice
+    Proxies to the upload/image analysis microservice. Images are sent as
+    multipart form data in the "files" field.
+    
+    With UPLOAD_STREAMING enabled (default) the body is relayed to the upload
+    service chunk by chunk as it arrives, so memory stays bounded and the
+    upstream can start work before the last image is received. The
+    UPLOAD_MAX_BODY_BYTES limit is enforced while streaming.
     
     CLOUD SCALING NOTE: For large file uploads, consider:
     - Streaming uploads to Cloud Storage
@@ -335,25 +2203,31 @@ async def upload_endpoint(
     try:
         logger.info(f"Upload request from {get_auth_identifier(auth)}")
         
-        # Prepare multipart form data for proxying
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            files_payload = []
-            for file in files:
-                file_content = await file.read()
-                files_payload.append(
-                    ("images", (file.filename, file_content, file.content_type))
-                )
-                await file.seek(0)  # Reset file pointer
-            
-            # Proxy request to upload service
-            response = await client.post(
-                MICROSERVICE_ENDPOINTS["upload"],
-                files=files_payload
-            )
-            
-            response.raise_for_status()
-            return response.json()
+        # Reject oversized uploads before reading any of the body
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > UPLOAD_MAX_BODY_BYTES:
+            raise UploadTooLargeError(f"Upload exceeds the {UPLOAD_MAX_BODY_BYTES} byte limit")
+        
+        # Proxy request to upload service
+        if UPLOAD_STREAMING:
+            response = await _proxy_upload_streaming(request)
+        else:
+            response = await _proxy_upload_buffered(request)
+        
+        response.raise_for_status()
+        return response.json()
     
+    except UploadTooLargeError as e:
+        logger.warning(f"Upload rejected: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+    except MultipartRelayError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
     except httpx.HTTPError as e:
         logger.error(f"Upload service error: {str(e)}")
         raise HTTPException(
@@ -365,12 +2239,14 @@ async def upload_endpoint(
 @app.post("/generate-listing", tags=["Gateway"])
 async def generate_listing_endpoint(
     request: Request,
-    auth: Dict = Depends(authenticate)
+    auth: Dict = Depends(rate_limited("generate_listing"))
 ):
     """
     Generate optimized product listing with AI insights
     
-    Proxies to the listing generation microservice
+    Proxies to the listing generation microservice. Send
+    "Prefer: respond-async" to get a 202 with a job id instead of waiting;
+    poll GET /jobs/{job_id} or pass "X-Callback-URL" for a webhook.
     
     CLOUD SCALING NOTE: This endpoint may be CPU/AI-intensive.
     Consider:
@@ -383,14 +2259,13 @@ async def generate_listing_endpoint(
         
         body = await request.json()
         
+        if wants_async(request):
+            return await submit_job("generate_listing", request, body, auth)
+        
         # Proxy request to listing generation service
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            response = await client.post(
-                MICROSERVICE_ENDPOINTS["generate_listing"],
-                json=body
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await upstream_clients["generate_listing"].post(json=body)
+        response.raise_for_status()
+        return response.json()
     
     except httpx.HTTPError as e:
         logger.error(f"Listing generation service error: {str(e)}")
@@ -403,33 +2278,35 @@ async def generate_listing_endpoint(
 @app.post("/syndicate", tags=["Gateway"])
 async def syndicate_endpoint(
     request: Request,
-    auth: Dict = Depends(authenticate)
+    auth: Dict = Depends(rate_limited("syndicate"))
 ):
     """
     Syndicate listings to marketplaces (e.g., eBay)
     
-    Proxies to the syndication microservice
+    Proxies to the syndication microservice. Supports the same async job
+    mode as /generate-listing ("Prefer: respond-async"). Rate limited per
+    tenant (RATE_LIMIT_SYNDICATE) to protect the shared eBay quota.
     
     CLOUD SCALING NOTE: Syndication may involve third-party API rate limits.
     Consider:
-    - Rate limiting at gateway level
     - Queue-based processing for bulk operations
-    - Retry logic with exponential backoff
-    - Circuit breaker pattern for external service failures
+    
+    Upstream failures trip the syndication circuit breaker (503 while open).
+    Because syndication is not idempotent, it is only retried when the
+    connection to the service could not be established.
     """
     try:
         logger.info(f"Syndication request from {get_auth_identifier(auth)}")
         
         body = await request.json()
         
+        if wants_async(request):
+            return await submit_job("syndicate", request, body, auth)
+        
         # Proxy request to syndication service
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT * 2) as client:  # Longer timeout
-            response = await client.post(
-                MICROSERVICE_ENDPOINTS["syndicate"],
-                json=body
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await upstream_clients["syndicate"].post(json=body)
+        response.raise_for_status()
+        return response.json()
     
     except httpx.HTTPError as e:
         logger.error(f"Syndication service error: {str(e)}")
@@ -442,16 +2319,20 @@ async def syndicate_endpoint(
 @app.post("/research", tags=["Gateway"])
 async def research_endpoint(
     request: Request,
-    auth: Dict = Depends(authenticate)
+    auth: Dict = Depends(rate_limited("research"))
 ):
     """
     Perform market research and competitive analysis
     
-    Proxies to the market research microservice
+    Proxies to the market research microservice. Successful responses are
+    cached per tenant for RESEARCH_CACHE_TTL seconds and concurrent identical
+    queries share one upstream call. The X-Cache response header reports
+    HIT, MISS, COALESCED or BYPASS; send "Cache-Control: no-cache" to force a
+    fresh lookup.
     
     CLOUD SCALING NOTE: Research may involve web scraping or API calls.
     Consider:
-    - Caching research results (Cloud Memorystore/Redis)
+    - Sharing cached results across instances (CACHE_BACKEND=redis with Cloud Memorystore)
     - Background processing for deep research
     - Result pagination for large datasets
     """
@@ -460,14 +2341,23 @@ async def research_endpoint(
         
         body = await request.json()
         
-        # Proxy request to research service
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            response = await client.post(
-                MICROSERVICE_ENDPOINTS["research"],
-                json=body
-            )
+        async def fetch() -> bytes:
+            # Proxy request to research service
+            response = await upstream_clients["research"].post(json=body)
             response.raise_for_status()
-            return response.json()
+            return response.content
+        
+        if not response_cache.enabled("research"):
+            return Response(content=await fetch(), media_type="application/json")
+        
+        key = ResponseCache.make_key("research", get_auth_tenant(auth), body)
+        refresh = "no-cache" in request.headers.get("cache-control", "")
+        content, cache_status = await response_cache.get_or_fetch("research", key, fetch, refresh=refresh)
+        return Response(
+            content=content,
+            media_type="application/json",
+            headers={"X-Cache": cache_status},
+        )
     
     except httpx.HTTPError as e:
         logger.error(f"Research service error: {str(e)}")
@@ -477,6 +2367,19 @@ async def research_endpoint(
         )
 
 
+@app.get("/jobs/{job_id}", tags=["Gateway"])
+async def get_job_endpoint(job_id: str, auth: Dict = Depends(authenticate)):
+    """
+    Get the status and, once finished, the result of an async job
+    
+    Jobs are only visible to the tenant that submitted them.
+    """
+    job = await job_manager.store.get(job_id)
+    if job is None or job.tenant != get_auth_tenant(auth):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return job.public_view()
+
+
 @app.get("/status", tags=["Gateway"])
 async def status_endpoint():
     """
@@ -496,18 +2399,33 @@ async def status_endpoint():
         "environment": os.getenv("ENVIRONMENT", "development"),
     }
     
-    # Optional: Check microservice health (comment out for faster response)
-    # microservice_health = {}
-    # for service_name, url in MICROSERVICE_ENDPOINTS.items():
-    #     if url != "internal":
-    #         try:
-    #             async with httpx.AsyncClient(timeout=2) as client:
-    #                 response = await client.get(url.replace("/api/", "/health"))
-    #                 microservice_health[service_name] = "healthy"
-    #         except:
-    #             microservice_health[service_name] = "unhealthy"
-    # 
-    # service_status["microservices"] = microservice_health
+    # Connection pool utilisation per upstream (no network calls)
+    service_status["upstreams"] = {
+        name: upstream.stats() for name, upstream in upstream_clients.items()
+    }
+    
+    # Response cache hit/miss/coalesced counters
+    service_status["cache"] = response_cache.stats()
+    
+    # Async job queue counters
+    service_status["jobs"] = job_manager.stats()
+    
+    # Rate limiter decisions
+    service_status["rate_limit"] = rate_limiter.stats()
+    
+    # Access log writer counters
+    service_status["access_log"] = access_log.stats()
+    
+    # Authentication fast path counters
+    service_status["auth"] = {
+        "api_key_reloads": api_key_registry.reloads,
+        "token_cache": verified_token_cache.stats(),
+    }
+    
+    # Microservice health from the background monitor's last round (no
+    # network calls here)
+    service_status["microservices"] = health_monitor.snapshot
+    service_status["health_monitor"] = health_monitor.stats()
     
     return service_status
 
@@ -527,7 +2445,7 @@ async def root():
         "status": "operational",
         "endpoints": {
             "authentication": ["/auth/login", "/auth/verify"],
-            "gateway": ["/upload", "/generate-listing", "/syndicate", "/research", "/status"],
+            "gateway": ["/upload", "/generate-listing", "/syndicate", "/research", "/jobs/{job_id}", "/status"],
             "documentation": ["/docs", "/redoc"],
         }
     }
@@ -542,9 +2460,18 @@ async def health_check():
     """
     Health check endpoint for Cloud Run startup/liveness probes
     
-    CLOUD SCALING NOTE: This is crucial for Cloud Run health monitoring
+    Upstream health comes from the background monitor's cache, so this
+    never waits on an upstream.
+    
+    CLOUD SCALING NOTE: This is crucial for Cloud Run health monitoring.
+    The gateway stays "healthy" when an upstream is down; restarting the
+    gateway would not fix the upstream.
     """
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    return {
+        "status": "healthy",
+        "timestamp": datetime.utcnow().isoformat(),
+        "upstreams": health_monitor.summary,
+    }
 
 
 # ============================================================================
@@ -561,6 +2488,24 @@ async def startup_event():
     logger.info("Gateway service starting up...")
     logger.info(f"Environment: {os.getenv('ENVIRONMENT', 'development')}")
     logger.info(f"Configured microservices: {list(MICROSERVICE_ENDPOINTS.keys())}")
+    
+    # Open one pooled client per upstream so the first requests do not pay
+    # client construction
+    for upstream in upstream_clients.values():
+        upstream.get_client()
+    logger.info(f"Upstream connection pools ready (http2={UPSTREAM_HTTP2 and _http2_available()})")
+    
+    # Start async job workers (re-queues jobs persisted by a previous run)
+    await job_manager.start()
+    
+    # Probe upstream health in the background
+    health_monitor.start()
+    
+    # Reload API keys on SIGHUP (not available on every platform)
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, api_key_registry.reload)
+    except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+        logger.info("SIGHUP API key reload not available on this platform")
 
 
 @app.on_event("shutdown")
@@ -571,6 +2516,20 @@ async def shutdown_event():
     CLOUD SCALING NOTE: Graceful shutdown is important for Cloud Run
     """
     logger.info("Gateway service shutting down...")
+    
+    # Stop job workers first; unfinished jobs stay in the store
+    await job_manager.stop()
+    await job_manager.store.close()
+    await health_monitor.stop()
+    
+    # Drain and close pooled upstream connections
+    for upstream in upstream_clients.values():
+        await upstream.aclose()
+    await response_cache.backend.close()
+    await rate_limiter.backend.close()
+    
+    # Write out any queued access log lines
+    access_log.stop()
 
 
 # ============================================================================
@@ -5,12 +5,22 @@ Simple test script for the FastAPI Gateway
 This script tests the gateway endpoints without requiring external microservices.
 """
 
+import io
+import os
+import json
 import sys
+import time
 import asyncio
+import tempfile
 from fastapi.testclient import TestClient
 
+import httpx
+
 # Import the gateway app
-from gateway import app
+import gateway
+from gateway import app, upstream_clients
+from benchmarks import stub_upstream
+from benchmarks.common import free_port, serve_in_thread
 
 def test_gateway():
     """Test the gateway endpoints"""
@@ -102,9 +112,641 @@ def test_gateway():
     
     return True
 
+
+def test_upstream_pools():
+    """Test that proxy endpoints reuse the pooled upstream clients"""
+    print("Testing upstream connection pools...")
+    print("=" * 60)
+    
+    seen = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        return httpx.Response(200, json={"ok": True})
+    
+    research = upstream_clients["research"]
+    research._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    try:
+        client = TestClient(app)
+        headers = {"X-API-Key": "dev-api-key-1"}
+        
+        print("\n1. Testing proxied requests share one client...")
+        pooled = research._client
+        for i in range(3):
+            response = client.post("/research", json={"keywords": f"lamp {i}"}, headers=headers)
+            assert response.status_code == 200
+            assert response.json() == {"ok": True}
+        assert research._client is pooled
+        assert len(seen) == 3 and seen[0] == research.url
+        print("   ✓ Requests reuse the pooled client")
+        
+        print("\n2. Testing pool counters on /status...")
+        stats = client.get("/status").json()["upstreams"]["research"]
+        assert stats["requests_total"] >= 3
+        assert stats["in_flight"] == 0
+        assert stats["timeout_seconds"] > 0
+        assert "status" not in client.get("/status").json()["upstreams"]
+        print("   ✓ Pool utilisation counters exposed")
+    finally:
+        research._client = None
+    
+    return True
+
+def test_upload_streaming():
+    """Test streaming and buffered upload proxying produce the same upstream body"""
+    print("Testing upload proxying...")
+    print("=" * 60)
+    
+    received = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        received.append((request.headers["content-type"], body))
+        return httpx.Response(200, json={"analyzed": True})
+    
+    upload = upstream_clients["upload"]
+    upload._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    streaming, max_bytes = gateway.UPLOAD_STREAMING, gateway.UPLOAD_MAX_BODY_BYTES
+    
+    try:
+        client = TestClient(app)
+        headers = {"X-API-Key": "dev-api-key-1"}
+        files = [
+            ("files", ("front.jpg", b"\xff\xd8front" * 5000, "image/jpeg")),
+            ("files", ("back.png", b"\x89PNGback" * 5000, "image/png")),
+        ]
+        
+        for mode in (True, False):
+            gateway.UPLOAD_STREAMING = mode
+            print(f"\n{'1' if mode else '2'}. Testing {'streaming' if mode else 'buffered'} upload...")
+            response = client.post("/upload", files=files, data={"note": "x"}, headers=headers)
+            assert response.status_code == 200, response.text
+            content_type, body = received[-1]
+            assert content_type.startswith("multipart/form-data; boundary=")
+            assert body.count(b'name="images"') == 2
+            assert b'filename="front.jpg"' in body and b"Content-Type: image/png" in body
+            assert (b"\xff\xd8front" * 5000) in body and (b"\x89PNGback" * 5000) in body
+            assert b"note" not in body
+            print("   ✓ Files forwarded under the images field")
+        
+        print("\n3. Testing maximum body size...")
+        gateway.UPLOAD_MAX_BODY_BYTES = 10_000
+        for mode in (True, False):
+            gateway.UPLOAD_STREAMING = mode
+            response = client.post("/upload", files=files, headers=headers)
+            assert response.status_code == 413
+        
+        # Chunked uploads carry no Content-Length, so the relay enforces the limit itself
+        async def chunks():
+            yield b"--b\r\nContent-Disposition: form-data; name=\"files\"; filename=\"a\"\r\n\r\n"
+            while True:
+                yield b"x" * 4096
+        
+        async def drain():
+            relay = gateway.MultipartRelay("multipart/form-data; boundary=b", max_body_bytes=10_000)
+            async for _ in relay.relay(chunks()):
+                pass
+        
+        try:
+            asyncio.run(drain())
+            assert False, "expected UploadTooLargeError"
+        except gateway.UploadTooLargeError:
+            pass
+        print("   ✓ Oversized uploads rejected with 413")
+        
+        print("\n4. Testing upload without files...")
+        gateway.UPLOAD_MAX_BODY_BYTES = max_bytes
+        gateway.UPLOAD_STREAMING = True
+        response = client.post("/upload", data={"note": "x"}, files={"other": ("a.txt", b"a")}, headers=headers)
+        assert response.status_code == 422
+        print("   ✓ Missing files rejected")
+    finally:
+        upload._client = None
+        gateway.UPLOAD_STREAMING, gateway.UPLOAD_MAX_BODY_BYTES = streaming, max_bytes
+    
+    return True
+
+def test_research_cache():
+    """Test research response caching and request coalescing"""
+    print("Testing research cache...")
+    print("=" * 60)
+    
+    calls = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.content)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"results": len(calls)})
+    
+    research = upstream_clients["research"]
+    research._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    try:
+        client = TestClient(app)
+        headers = {"X-API-Key": "dev-api-key-1"}
+        
+        print("\n1. Testing cache hit for a reordered identical body...")
+        first = client.post("/research", json={"keywords": "vase", "category": 1}, headers=headers)
+        second = client.post("/research", json={"category": 1, "keywords": "vase"}, headers=headers)
+        assert first.headers["X-Cache"] == "MISS" and second.headers["X-Cache"] == "HIT"
+        assert first.json() == second.json() and len(calls) == 1
+        print("   ✓ Canonicalised body served from cache")
+        
+        print("\n2. Testing tenant isolation and no-cache refresh...")
+        other = client.post("/research", json={"keywords": "vase", "category": 1}, headers={"X-API-Key": "dev-api-key-2"})
+        assert other.headers["X-Cache"] == "MISS" and len(calls) == 2
+        fresh = client.post(
+            "/research", json={"keywords": "vase", "category": 1},
+            headers={**headers, "Cache-Control": "no-cache"},
+        )
+        assert fresh.headers["X-Cache"] == "BYPASS" and len(calls) == 3
+        print("   ✓ Tenants cached separately, no-cache refreshes")
+        
+        print("\n3. Testing concurrent identical requests are coalesced...")
+        cache = gateway.ResponseCache(gateway.InMemoryCacheBackend(), {"research": 60})
+        fetches = []
+        
+        async def fetch():
+            fetches.append(1)
+            await asyncio.sleep(0.05)
+            return b"{}"
+        
+        async def burst():
+            return await asyncio.gather(*(cache.get_or_fetch("research", "k", fetch) for _ in range(20)))
+        
+        statuses = [cache_status for _, cache_status in asyncio.run(burst())]
+        assert len(fetches) == 1
+        assert statuses.count("MISS") == 1 and statuses.count("COALESCED") == 19
+        print("   ✓ 20 concurrent requests made one upstream call")
+        
+        print("\n4. Testing LRU bounds and cache stats on /status...")
+        backend = gateway.InMemoryCacheBackend(max_entries=2, max_bytes=10)
+        
+        async def fill():
+            await backend.set("a", b"12345", 60)
+            await backend.set("b", b"12345", 60)
+            await backend.get("a")
+            await backend.set("c", b"1", 60)
+            return [await backend.get(key) for key in ("a", "b", "c")]
+        
+        assert asyncio.run(fill()) == [b"12345", None, b"1"]
+        stats = client.get("/status").json()["cache"]
+        assert stats["hits"] >= 1 and stats["misses"] >= 2 and "coalesced" in stats
+        print("   ✓ LRU eviction and /status counters work")
+    finally:
+        research._client = None
+    
+    return True
+
+def test_async_jobs():
+    """Test async job mode, polling, webhooks and SQLite persistence"""
+    print("Testing async jobs...")
+    print("=" * 60)
+    
+    webhooks = []
+    
+    async def upstream(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"title": "Vintage lamp", "echo": request.content.decode()})
+    
+    async def webhook(request: httpx.Request) -> httpx.Response:
+        webhooks.append(request)
+        return httpx.Response(204)
+    
+    listing = upstream_clients["generate_listing"]
+    allowed_hosts = gateway.JOB_WEBHOOK_ALLOWED_HOSTS
+    gateway.JOB_WEBHOOK_ALLOWED_HOSTS = ["hooks.example.com"]
+    
+    with TestClient(app) as client:
+        listing._client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+        gateway.job_manager._webhook_client = httpx.AsyncClient(transport=httpx.MockTransport(webhook))
+        headers = {"X-API-Key": "dev-api-key-1", "Prefer": "respond-async"}
+        
+        print("\n1. Testing job submission returns 202...")
+        response = client.post(
+            "/generate-listing", json={"sku": 1},
+            headers={**headers, "X-Callback-URL": "https://hooks.example.com/done"},
+        )
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        assert response.headers["Location"] == f"/jobs/{job_id}"
+        print("   ✓ Job accepted")
+        
+        print("\n2. Testing job polling...")
+        for _ in range(50):
+            job = client.get(f"/jobs/{job_id}", headers=headers).json()
+            if job["status"] == "succeeded" and webhooks:
+                break
+            time.sleep(0.02)
+        assert job["status"] == "succeeded" and job["result"]["title"] == "Vintage lamp"
+        assert "payload" not in job
+        assert client.get(f"/jobs/{job_id}", headers={"X-API-Key": "dev-api-key-2"}).status_code == 404
+        print("   ✓ Job result available to its tenant only")
+        
+        print("\n3. Testing completion webhook...")
+        assert str(webhooks[0].url) == "https://hooks.example.com/done"
+        assert webhooks[0].headers["X-Gateway-Signature"].startswith("sha256=")
+        response = client.post(
+            "/syndicate", json={}, headers={**headers, "X-Callback-URL": "file:///etc/passwd"}
+        )
+        assert response.status_code == 400
+        assert client.get("/status").json()["jobs"]["succeeded"] >= 1
+        print("   ✓ Signed webhook delivered, bad callback rejected")
+    listing._client = None
+    gateway.JOB_WEBHOOK_ALLOWED_HOSTS = allowed_hosts
+    
+    print("\n3b. Testing callbacks to internal addresses are rejected...")
+    
+    async def check(url):
+        try:
+            await gateway.validate_callback_url(url)
+            return True
+        except ValueError:
+            return False
+    
+    gateway.JOB_WEBHOOK_ALLOWED_HOSTS = []
+    try:
+        for url in ("http://169.254.169.254/latest/meta-data", "http://localhost:8080/",
+                    "http://10.0.0.5/hook", "http://[::1]/hook", "http://224.0.0.1/"):
+            assert not asyncio.run(check(url)), url
+        assert asyncio.run(check("https://93.184.216.34/hook"))
+    finally:
+        gateway.JOB_WEBHOOK_ALLOWED_HOSTS = allowed_hosts
+    print("   ✓ Loopback, link-local, private and multicast hosts refused")
+    
+    print("\n4. Testing SQLite store re-queues jobs after restart...")
+    
+    async def restart():
+        path = os.path.join(tempfile.mkdtemp(), "jobs.db")
+        store = gateway.SQLiteJobStore(path)
+        await store.save(gateway.Job(id="pending", route="generate_listing", tenant="t", payload={"sku": 2}))
+        await store.save(gateway.Job(id="resumed", route="generate_listing", tenant="t", status="running", payload={"sku": 3}))
+        await store.save(gateway.Job(id="interrupted", route="syndicate", tenant="t", status="running", payload={}))
+        await store.close()
+        
+        listing._client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+        manager = gateway.JobManager(gateway.SQLiteJobStore(path), workers=2)
+        await manager.start()
+        for _ in range(50):
+            job = await manager.store.get("pending")
+            resumed = await manager.store.get("resumed")
+            if job.status == resumed.status == "succeeded":
+                break
+            await asyncio.sleep(0.02)
+        interrupted = await manager.store.get("interrupted")
+        await manager.stop()
+        await manager.store.close()
+        return job, resumed, interrupted
+    
+    try:
+        job, resumed, interrupted = asyncio.run(restart())
+        assert job.status == "succeeded" and json.loads(job.result["echo"]) == {"sku": 2}
+        assert resumed.status == "succeeded"
+        assert interrupted.status == "failed" and "outcome unknown" in interrupted.error
+    finally:
+        listing._client = None
+    print("   ✓ Persisted jobs resumed after restart, interrupted syndication not replayed")
+    
+    print("\n5. Testing concurrent starts and unexpected worker errors...")
+    
+    class SlowStore(gateway.InMemoryJobStore):
+        async def unfinished(self):
+            await asyncio.sleep(0.05)
+            return await super().unfinished()
+    
+    async def broken(request: httpx.Request) -> httpx.Response:
+        raise RuntimeError("upstream client bug")
+    
+    async def concurrent_start():
+        store = SlowStore()
+        await store.save(gateway.Job(id="pending", route="generate_listing", tenant="t", payload={"sku": 4}))
+        listing._client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+        manager = gateway.JobManager(store, workers=2)
+        _, submitted, _ = await asyncio.gather(
+            manager.start(), manager.submit("generate_listing", "t", {"sku": 5}), manager.start()
+        )
+        workers = sum(task.get_coro().__qualname__ == "JobManager._worker" for task in asyncio.all_tasks())
+        await manager._queue.join()
+        statuses = [(await store.get(job_id)).status for job_id in ("pending", submitted.id)]
+        
+        listing._client = httpx.AsyncClient(transport=httpx.MockTransport(broken))
+        crashed = await manager.submit("generate_listing", "t", {"sku": 6})
+        await manager._queue.join()
+        crashed = await store.get(crashed.id)
+        await manager.stop()
+        return workers, statuses, crashed
+    
+    try:
+        workers, statuses, crashed = asyncio.run(concurrent_start())
+        assert workers == 2 and statuses == ["succeeded", "succeeded"]
+        assert crashed.status == "failed" and "upstream client bug" in crashed.error
+    finally:
+        listing._client = None
+    print("   ✓ One start for concurrent callers, crashed jobs marked failed")
+    
+    return True
+
+def test_auth_fast_path():
+    """Test cached JWT verification and API key reloading"""
+    print("Testing authentication fast path...")
+    print("=" * 60)
+    
+    client = TestClient(app)
+    gateway.verified_token_cache.clear()
+    
+    print("\n1. Testing verified tokens are cached...")
+    token = gateway.create_access_token({"sub": "seller"})
+    for _ in range(3):
+        response = client.post("/auth/verify", headers={"Authorization": f"Bearer {token}"})
+        assert response.json()["auth_info"]["username"] == "seller"
+    stats = client.get("/status").json()["auth"]["token_cache"]
+    assert stats["entries"] == 1 and stats["hits"] >= 2
+    print("   ✓ Repeated token verified from cache")
+    
+    print("\n2. Testing cached tokens respect expiry...")
+    cache = gateway.VerifiedTokenCache(max_size=2, max_age=60)
+    cache.put("expired", "seller", time.time() - 1)
+    cache.put("valid", "seller", time.time() + 60)
+    assert cache.get("expired") is None and cache.get("valid") == "seller"
+    cache.put("a", "x", None)
+    cache.put("b", "y", None)
+    assert cache.get("valid") is None  # evicted as least recently used
+    response = client.post("/auth/verify", headers={"Authorization": "Bearer not-a-jwt"})
+    assert response.status_code == 401
+    print("   ✓ Expired and invalid tokens rejected")
+    
+    print("\n3. Testing API key hot reload...")
+    previous = os.environ.get("VALID_API_KEYS")
+    try:
+        os.environ["VALID_API_KEYS"] = "rotated-key"
+        assert client.post("/auth/verify", headers={"X-API-Key": "rotated-key"}).status_code == 401
+        gateway.api_key_registry.reload()
+        assert client.post("/auth/verify", headers={"X-API-Key": "rotated-key"}).status_code == 200
+        assert client.post("/auth/verify", headers={"X-API-Key": "dev-api-key-1"}).status_code == 401
+    finally:
+        if previous is None:
+            del os.environ["VALID_API_KEYS"]
+        else:
+            os.environ["VALID_API_KEYS"] = previous
+        gateway.api_key_registry.reload()
+    assert client.post("/auth/verify", headers={"X-API-Key": "dev-api-key-1"}).status_code == 200
+    print("   ✓ Rotated keys picked up on reload")
+    
+    return True
+
+def test_access_logging():
+    """Test one-line structured access logs with header allowlist and sampling"""
+    print("Testing access logging...")
+    print("=" * 60)
+    
+    client = TestClient(app)
+    stream = io.StringIO()
+    access_log = gateway.access_log
+    previous_stream, sample_rate = access_log.stream, gateway.ACCESS_LOG_SAMPLE_RATE
+    access_log.flush()
+    access_log.stream = stream
+    
+    try:
+        print("\n1. Testing one JSON line per request...")
+        client.get("/health?probe=1", headers={"User-Agent": "probe", "X-API-Key": "dev-api-key-1"})
+        access_log.flush()
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        assert record["path"] == "/health" and record["status_code"] == 200
+        assert record["headers"] == {"user-agent": "probe"}
+        assert record["duration_ms"] >= 0 and record["timestamp"].endswith("+00:00")
+        print("   ✓ Compact record with allowlisted headers only")
+        
+        print("\n2. Testing 2xx sampling keeps errors...")
+        gateway.ACCESS_LOG_SAMPLE_RATE = 0.0
+        sampled_out = access_log.sampled_out
+        client.get("/health")
+        client.post("/auth/verify")
+        access_log.flush()
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 2 and json.loads(lines[1])["status_code"] == 401
+        assert json.loads(lines[1])["severity"] == "WARNING"
+        assert access_log.sampled_out == sampled_out + 1
+        print("   ✓ Successful requests sampled, errors always logged")
+    finally:
+        access_log.flush()
+        access_log.stream = previous_stream
+        gateway.ACCESS_LOG_SAMPLE_RATE = sample_rate
+    
+    return True
+
+def test_rate_limiting():
+    """Test per-tenant token buckets and concurrency caps"""
+    print("Testing rate limiting...")
+    print("=" * 60)
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True})
+    
+    research = upstream_clients["research"]
+    research._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    limit = gateway.RATE_LIMITS["research"]
+    previous = limit.model_copy()
+    
+    try:
+        client = TestClient(app)
+        
+        print("\n1. Testing token bucket returns 429 with Retry-After...")
+        limit.rate, limit.burst = 0.1, 2
+        token = gateway.create_access_token({"sub": "rate-limited-seller"})
+        headers = {"Authorization": f"Bearer {token}", "Cache-Control": "no-cache"}
+        codes = [client.post("/research", json={"q": i}, headers=headers).status_code for i in range(3)]
+        assert codes == [200, 200, 429]
+        response = client.post("/research", json={"q": 9}, headers=headers)
+        assert response.status_code == 429 and int(response.headers["Retry-After"]) >= 1
+        print("   ✓ Burst allowed, excess rejected")
+        
+        print("\n2. Testing limits are per tenant...")
+        other = gateway.create_access_token({"sub": "other-seller"})
+        response = client.post("/research", json={"q": 1}, headers={"Authorization": f"Bearer {other}"})
+        assert response.status_code == 200
+        assert client.get("/status").json()["rate_limit"]["rejected_rate"] >= 2
+        print("   ✓ Other tenants unaffected")
+        
+        print("\n3. Testing concurrency cap...")
+        backend = gateway.InMemoryRateLimitBackend()
+        cap = gateway.RateLimit(rate=0, burst=1, max_in_flight=2)
+        
+        async def saturate():
+            results = [await backend.acquire("t:syndicate", cap) for _ in range(3)]
+            await backend.release("t:syndicate", cap)
+            results.append(await backend.acquire("t:syndicate", cap))
+            return results
+        
+        assert asyncio.run(saturate()) == [0.0, 0.0, -1.0, 0.0]
+        print("   ✓ In-flight requests capped and released")
+        
+        print("\n4. Testing the bucket table is capped...")
+        backend = gateway.InMemoryRateLimitBackend(max_keys=4, eviction_scan=4)
+        
+        async def rotate():
+            busy = [await backend.acquire(f"busy{i}:research", cap) for i in range(4)]
+            rejected = await backend.acquire("new:research", cap)
+            await backend.release("busy1:research", cap)
+            for i in range(1000):
+                assert await backend.acquire(f"rotating{i}:research", cap) == 0.0
+                await backend.release(f"rotating{i}:research", cap)
+            return busy, rejected
+        
+        assert asyncio.run(rotate()) == ([0.0] * 4, -1.0)
+        stats = backend.stats()
+        assert stats["keys"] == 4 and stats["rejected_full"] == 1, stats
+        assert {"busy0:research", "busy2:research", "busy3:research"} <= set(backend._buckets)
+        print("   ✓ Table stays at max_keys, in-flight buckets kept")
+    finally:
+        research._client = None
+        limit.rate, limit.burst, limit.max_in_flight = previous.rate, previous.burst, previous.max_in_flight
+    
+    return True
+
+def test_upstream_resilience():
+    """Fault-injection test of retries, circuit breaking and hedging against a stub upstream"""
+    print("Testing upstream resilience...")
+    print("=" * 60)
+    
+    original = dict(upstream_clients)
+    
+    with serve_in_thread(stub_upstream.app, free_port()) as base:
+        def inject(**faults):
+            httpx.post(f"{base}/__faults", json=faults).raise_for_status()
+        
+        def hits():
+            return httpx.get(f"{base}/__stats").json()["requests"]
+        
+        research = gateway.UpstreamClient("research", f"{base}/api/ebay/str", 5)
+        research.breaker = gateway.CircuitBreaker("research", failure_threshold=3, reset_timeout=0.3)
+        syndicate = gateway.UpstreamClient("syndicate", f"{base}/api/bulk-upload-ebay", 5)
+        upstream_clients.update(research=research, syndicate=syndicate)
+        headers = {"X-API-Key": "dev-api-key-1", "Cache-Control": "no-cache"}
+        
+        try:
+            with TestClient(app) as client:
+                print("\n1. Testing idempotent retries with backoff...")
+                inject(fail_next=2, status=503)
+                before = hits()
+                response = client.post("/research", json={"q": "retry"}, headers=headers)
+                assert response.status_code == 200
+                assert hits() - before == 3 and research.retries == 2
+                print("   ✓ Two 503s retried transparently")
+                
+                print("\n2. Testing non-idempotent routes are not retried...")
+                inject(fail_next=1, status=503)
+                before = hits()
+                response = client.post("/syndicate", json={"listings": []}, headers=headers)
+                assert response.status_code == 502 and hits() - before == 1
+                print("   ✓ Syndication failure surfaced without a retry")
+                
+                print("\n3. Testing circuit breaker opens and fails fast...")
+                inject(fail_rate=1.0, status=503)
+                assert client.post("/research", json={"q": 1}, headers=headers).status_code == 502
+                assert research.breaker.state == "open"
+                before = hits()
+                response = client.post("/research", json={"q": 2}, headers=headers)
+                assert response.status_code == 503 and "Retry-After" in response.headers
+                assert hits() == before
+                breaker = client.get("/status").json()["upstreams"]["research"]["circuit_breaker"]
+                assert breaker["state"] == "open" and breaker["rejected"] >= 1
+                print("   ✓ Open circuit rejects without calling the upstream")
+                
+                print("\n4. Testing half-open probe closes the circuit...")
+                inject()
+                time.sleep(0.35)
+                assert client.post("/research", json={"q": 3}, headers=headers).status_code == 200
+                assert research.breaker.state == "closed"
+                print("   ✓ Successful probe closed the circuit")
+                
+                print("\n5. Testing hedged requests...")
+                research.hedge_delay = 0.05
+                inject(slow_next=1, slow_ms=800)
+                started = time.monotonic()
+                assert client.post("/research", json={"q": 4}, headers=headers).status_code == 200
+                assert time.monotonic() - started < 0.6
+                assert research.hedges == 1 and research.hedge_wins == 1
+                research.hedge_delay = 0
+                print("   ✓ Hedge answered before the slow request")
+                
+                print("\n6. Testing retry budget caps retries...")
+                research.retry_budget = gateway.RetryBudget(ratio=0.0, reserve=1.0)
+                inject(fail_next=5, status=503)
+                before = hits()
+                assert client.post("/research", json={"q": 5}, headers=headers).status_code == 502
+                assert hits() - before == 2 and research.retry_budget.exhausted == 1
+                print("   ✓ Retries stopped when the budget ran out")
+        finally:
+            upstream_clients.update(original)
+    
+    return True
+
+
+def test_health_monitor():
+    """Test the background upstream health monitor and cached /status and /health"""
+    print("Testing upstream health monitor...")
+    print("=" * 60)
+    
+    original = gateway.health_monitor
+    
+    with serve_in_thread(stub_upstream.app, free_port()) as base:
+        upstreams = {
+            "research": gateway.UpstreamClient("research", f"{base}/api/ebay/str", 5),
+            "upload": gateway.UpstreamClient("upload", f"{base}/api/analyze-images", 5),
+            "syndicate": gateway.UpstreamClient("syndicate", f"http://127.0.0.1:{free_port()}/api/bulk-upload-ebay", 5),
+        }
+        monitor = gateway.HealthMonitor(upstreams, interval=0, timeout=1)
+        
+        async def probe(rounds):
+            for _ in range(rounds):
+                await monitor.check_now()
+            for upstream in upstreams.values():
+                await upstream.aclose()
+        
+        print("\n1. Testing concurrent probe round...")
+        before = httpx.get(f"{base}/__stats").json()["health_checks"]
+        asyncio.run(probe(3))
+        assert monitor.urls["research"] == f"{base}/health"
+        # research and upload share an origin, so each round probes it once
+        assert httpx.get(f"{base}/__stats").json()["health_checks"] - before == 3
+        assert monitor.summary == {"research": "healthy", "upload": "healthy", "syndicate": "unhealthy"}
+        research = monitor.snapshot["research"]
+        assert research["status_code"] == 200 and research["checked_at"]
+        assert research["latency_p50_ms"] <= research["latency_p99_ms"]
+        assert monitor.snapshot["syndicate"]["consecutive_failures"] == 3
+        print("   ✓ Healthy, unhealthy and latency percentiles recorded")
+        
+        print("\n2. Testing /status and /health read the cache...")
+        gateway.health_monitor = monitor
+        try:
+            with TestClient(app) as client:
+                body = client.get("/status").json()
+                assert body["microservices"]["research"]["status"] == "healthy"
+                assert body["microservices"]["syndicate"]["status"] == "unhealthy"
+                assert body["health_monitor"]["rounds"] == 3
+                health = client.get("/health").json()
+                assert health["status"] == "healthy"
+                assert health["upstreams"]["syndicate"] == "unhealthy"
+        finally:
+            gateway.health_monitor = original
+        print("   ✓ Cached results served without probing")
+    
+    return True
+
 if __name__ == "__main__":
     try:
         test_gateway()
+        test_upstream_pools()
+        test_upload_streaming()
+        test_research_cache()
+        test_async_jobs()
+        test_auth_fast_path()
+        test_access_logging()
+        test_rate_limiting()
+        test_upstream_resilience()
+        test_health_monitor()
         sys.exit(0)
     except Exception as e:
         print(f"\n❌ Test failed: {str(e)}")